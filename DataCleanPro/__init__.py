@@ -1,6 +1,39 @@
-from .data_loader import DataLoader
-from .preprocessor import Preprocessor
-from .transformation import Transformation
-from .visualization import Visualization
+import importlib
 
-__all__ = ["DataLoader", "Preprocessor", "Transformation", "Visualization"]
+# Public names and the submodules defining them. They are imported on first access
+# (PEP 562), so e.g. a cleaning-only process never loads the plotting modules.
+_EXPORTS = {
+    "ChunkedData": "chunked",
+    "ColumnProfile": "profiling",
+    "Correlation": "correlation",
+    "DataLoader": "data_loader",
+    "DiskCache": "cache",
+    "FittedStatistics": "statistics",
+    "FrequencyEncoder": "encoders",
+    "IncrementalCleaner": "incremental",
+    "LabelEncoder": "encoders",
+    "OneHotEncoder": "encoders",
+    "Pipeline": "pipeline",
+    "Preprocessor": "preprocessor",
+    "ProcessBackend": "backends",
+    "RemoteFetcher": "remote",
+    "Profile": "profiling",
+    "SerialBackend": "backends",
+    "ThreadBackend": "backends",
+    "Transformation": "transformation",
+    "Visualization": "visualization",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,232 @@
+"""
+Execution backends that spread per-column work of Preprocessor and Transformation over cores.
+
+A backend maps a module-level function over a list of tasks and returns the results in
+task order, so output never depends on scheduling. Work is split into contiguous column
+groups (or row blocks, when there are fewer columns than workers); numeric columns are
+copied once into a column-major float64 block, which the process backend places in shared
+memory so workers read and write it in place instead of receiving pickled copies.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class SerialBackend:
+    """Run tasks one after another in this thread (the default)."""
+
+    name = "serial"
+    shared = False
+
+    def __init__(self, workers=1):
+        self.workers = 1
+
+    def map(self, func, tasks):
+        return [func(task) for task in tasks]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ThreadBackend(SerialBackend):
+    """
+    Run tasks on a thread pool. NumPy reductions and arithmetic release the GIL,
+    so numeric columns scale across cores; pure-Python work (e.g. object columns) does not.
+    workers: number of threads (default: number of CPUs)
+    """
+
+    name = "thread"
+
+    def __init__(self, workers=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._pool = None
+
+    def map(self, func, tasks):
+        tasks = list(tasks)
+        if self.workers == 1 or len(tasks) <= 1:
+            return [func(task) for task in tasks]
+        if self._pool is None:
+            # Kept between calls, so a sequence of operations starts the workers once.
+            self._pool = self._start_pool()
+        return list(self._pool.map(func, tasks))
+
+    def _start_pool(self):
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class ProcessBackend(ThreadBackend):
+    """
+    Run tasks in worker processes. Numeric blocks are passed through shared memory;
+    other inputs (e.g. string columns to encode) are pickled to the workers.
+    workers: number of processes (default: number of CPUs)
+    """
+
+    name = "process"
+    shared = True
+
+    def _start_pool(self):
+        # Workers must share this process's resource tracker; one started per worker would
+        # treat the blocks they attach to as leaked and unlink them when the worker exits.
+        resource_tracker.ensure_running()
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+
+BACKENDS = {"serial": SerialBackend, "thread": ThreadBackend, "process": ProcessBackend}
+
+
+def get_backend(backend):
+    """Backend instance from None, a name in BACKENDS, or an existing backend."""
+    if backend is None:
+        return SerialBackend()
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid backend '{backend}'. Valid are: {list(BACKENDS)}.")
+        return BACKENDS[backend]()
+    if not hasattr(backend, "map"):
+        raise TypeError("backend must be a backend name or an object with a 'map' method.")
+    return backend
+
+
+def column_groups(columns, n_jobs):
+    """Split columns into at most `n_jobs` contiguous groups."""
+    columns = list(columns)
+    n_groups = max(1, min(n_jobs or 1, len(columns)))
+    return [list(group) for group in np.array_split(np.array(columns, dtype=object), n_groups) if len(group)]
+
+
+def partitions(n_rows, n_columns, workers, by="auto"):
+    """
+    Contiguous ((row_start, row_stop), (column_start, column_stop)) ranges covering a block.
+    by: 'columns', 'rows', or 'auto' (column groups unless there are fewer columns than workers)
+    """
+    if by == "auto":
+        by = "columns" if n_columns >= workers else "rows"
+    if by == "columns":
+        edges = np.linspace(0, n_columns, max(1, min(workers, n_columns)) + 1).astype(int)
+        return [((0, n_rows), (int(start), int(stop))) for start, stop in zip(edges[:-1], edges[1:])]
+    edges = np.linspace(0, n_rows, max(1, min(workers, n_rows)) + 1).astype(int)
+    return [((int(start), int(stop)), (0, n_columns)) for start, stop in zip(edges[:-1], edges[1:])]
+
+
+class SharedBlock:
+    """
+    Column-major float64 block for a backend: in shared memory for the process backend,
+    an ordinary array otherwise. `handle` is what tasks receive and pass to `run_on_block`.
+    """
+
+    def __init__(self, shape, backend):
+        self.memory = None
+        if backend.shared and shape[0] * shape[1] > 0:
+            self.memory = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1] * 8)
+            self.array = np.ndarray(shape, dtype="float64", buffer=self.memory.buf, order="F")
+            self.handle = (self.memory.name, shape)
+        else:
+            self.array = np.empty(shape, order="F")
+            self.handle = self.array
+
+    @classmethod
+    def from_frame(cls, frame, columns, backend):
+        block = cls((len(frame), len(columns)), backend)
+        for position, col in enumerate(columns):
+            block.array[:, position] = frame[col].to_numpy(dtype="float64", na_value=np.nan)
+        return block
+
+    def close(self):
+        self.array = self.handle = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_on_block(handle, func, *args):
+    """Call func(block, *args) on a SharedBlock handle, attaching to shared memory if needed."""
+    if isinstance(handle, np.ndarray):
+        return func(handle, *args)
+    name, shape = handle
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        block = np.ndarray(shape, dtype="float64", buffer=memory.buf, order="F")
+        result = func(block, *args)
+        del block
+        return result
+    finally:
+        memory.close()
+
+
+def partial_moments(block, rows, columns):
+    """count, mean, M2 (sum of squared deviations), min and max of each column over a row range."""
+    width = columns[1] - columns[0]
+    stats = np.full((5, width), np.nan)
+    for offset, position in enumerate(range(*columns)):
+        values = block[rows[0]:rows[1], position]
+        valid = values[~np.isnan(values)]
+        stats[0, offset] = len(valid)
+        if len(valid):
+            mean = valid.mean()
+            deviations = valid - mean
+            stats[1:, offset] = mean, np.dot(deviations, deviations), valid.min(), valid.max()
+    return stats
+
+
+def combine_moments(parts, n_columns):
+    """Merge partial_moments results (in partition order) into per-column count, mean, M2, min, max."""
+    total = np.zeros((5, n_columns))
+    total[1:] = np.nan
+    for (rows, columns), stats in parts:
+        for offset, position in enumerate(range(*columns)):
+            count, mean, m2, low, high = stats[:, offset]
+            if count == 0:
+                continue
+            current = total[0, position]
+            if current == 0:
+                total[:, position] = stats[:, offset]
+                continue
+            # Chan et al. pairwise update of mean and M2.
+            delta = mean - total[1, position]
+            merged = current + count
+            total[1, position] += delta * count / merged
+            total[2, position] += m2 + delta * delta * current * count / merged
+            total[0, position] = merged
+            total[3, position] = min(total[3, position], low)
+            total[4, position] = max(total[4, position], high)
+    return total
+
+
+def scale_range(block, rows, columns, offset, scale):
+    """(x - offset) / scale in place, column by column over a row range."""
+    for position in range(*columns):
+        values = block[rows[0]:rows[1], position]
+        values -= offset[position]
+        values /= scale[position]
+
+
+def moments_task(task):
+    """partial_moments of a (handle, rows, columns) task."""
+    handle, rows, columns = task
+    return run_on_block(handle, partial_moments, rows, columns)
+
+
+def scale_task(task):
+    """scale_range of a (handle, rows, columns, offset, scale) task."""
+    handle, rows, columns, offset, scale = task
+    return run_on_block(handle, scale_range, rows, columns, offset, scale)
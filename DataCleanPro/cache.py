@@ -0,0 +1,200 @@
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+import pandas as pd
+
+from .data_loader import READERS, DataLoader, _file_format
+
+MAGIC = b"DCPCACHE"
+ALIGNMENT = 64
+
+
+def source_fingerprint(path, validate="mtime"):
+    """
+    Identity of a source for cache keys.
+    validate: 'mtime' uses size and modification time (cheap), 'hash' the SHA-256
+              of the contents. URLs and other non-local sources use the string itself.
+    """
+    path = os.fspath(path)
+    if not os.path.exists(path):
+        return {"source": path}
+    stat = os.stat(path)
+    fingerprint = {"source": os.path.abspath(path), "size": stat.st_size}
+    if validate == "hash":
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        fingerprint["sha256"] = digest.hexdigest()
+    else:
+        fingerprint["mtime_ns"] = stat.st_mtime_ns
+    return fingerprint
+
+
+def frame_fingerprint(data):
+    """Content hash of an in-memory DataFrame (values, index, column names and dtypes)."""
+    hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+    digest = hashlib.sha256(hashes.tobytes())
+    digest.update(repr(list(data.columns)).encode())
+    digest.update(repr([str(dtype) for dtype in data.dtypes]).encode())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache for loaded and cleaned DataFrames.
+
+    Entries are keyed on source fingerprints plus the operation and its parameters,
+    so a changed source produces a new key and the stale entry simply ages out.
+    Frames are stored with pickle protocol 5 and out-of-band buffers, and read
+    back through a copy-on-write memory map so NumPy data is not copied on load.
+    When the directory grows past `max_bytes`, least recently used entries are evicted.
+    """
+
+    def __init__(self, directory, max_bytes=1024 ** 3, validate="mtime"):
+        if validate not in ["mtime", "hash"]:
+            raise ValueError(f"Invalid validate '{validate}'. Valid are: ['mtime', 'hash'].")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.validate = validate
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, sources, operation, params=None):
+        """Cache key for applying `operation` with `params` to `sources` (paths or fingerprint dicts)."""
+        parts = {
+            "sources": [source if isinstance(source, dict) else source_fingerprint(source, self.validate)
+                        for source in sources],
+            "operation": operation,
+            "params": params or {},
+        }
+        encoded = json.dumps(parts, sort_keys=True, default=repr).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl5")
+
+    def get(self, key):
+        """Cached DataFrame for `key`, or None. Unreadable (truncated or corrupt) entries are removed."""
+        path = self._path(key)
+        try:
+            data = _read_entry(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (ValueError, struct.error, pickle.UnpicklingError, EOFError, AttributeError, TypeError,
+                IndexError, ImportError):
+            self.misses += 1
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store `data` under `key` and evict old entries if the cache is over its size limit."""
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                _write_entry(handle, data)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.evict()
+
+    def get_or_compute(self, key, compute):
+        """Cached value for `key`, computing and storing it with `compute()` on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = compute()
+            self.put(key, data)
+        return data
+
+    def load(self, file_path, file_format=None, **kwargs):
+        """
+        Load a file through the cache; a warm call skips parsing entirely.
+        kwargs are passed to the matching DataLoader.load_* method and are part of the key.
+        """
+        file_format = _file_format(file_path, file_format)
+        loader = getattr(DataLoader, f"load_{file_format}", READERS[file_format])
+        key = self.key([file_path], f"load:{file_format}", kwargs)
+        return self.get_or_compute(key, lambda: loader(file_path, **kwargs))
+
+    def entries(self):
+        """(path, size, last use) of every cache entry, least recently used first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl5"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((os.path.join(self.directory, name), stat.st_size, stat.st_mtime_ns))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            os.remove(path)
+
+
+def _write_entry(handle, data):
+    buffers = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    handle.write(MAGIC)
+    handle.write(struct.pack("<QQ", len(payload), len(raws)))
+    handle.write(struct.pack(f"<{len(raws)}Q", *[raw.nbytes for raw in raws]))
+    handle.write(payload)
+    for raw in raws:
+        handle.write(b"\0" * (-handle.tell() % ALIGNMENT))
+        handle.write(raw)
+
+
+def _read_entry(path):
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError("Empty cache entry.")
+        # ACCESS_COPY gives writable, private pages: arrays are usable in place
+        # and never write back to the cache file.
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a cache entry.")
+    offset = len(MAGIC)
+    payload_size, n_buffers = struct.unpack_from("<QQ", view, offset)
+    offset += 16
+    sizes = struct.unpack_from(f"<{n_buffers}Q", view, offset)
+    offset += 8 * n_buffers
+    if offset + payload_size > len(view):
+        raise ValueError("Truncated cache entry.")
+    payload = view[offset:offset + payload_size]
+    offset += payload_size
+    buffers = []
+    for size in sizes:
+        offset += -offset % ALIGNMENT
+        if offset + size > len(view):
+            raise ValueError("Truncated cache entry.")
+        buffers.append(view[offset:offset + size])
+        offset += size
+    return pickle.loads(payload, buffers=buffers)
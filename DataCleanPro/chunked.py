@@ -0,0 +1,189 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+class ChunkedData:
+    """Re-iterable sequence of DataFrame chunks.
+
+    Wraps a factory that opens a fresh chunk iterator on every pass, so
+    two-pass operations (gather statistics, then apply them) can read the
+    source twice while holding only one chunk in memory at a time.
+    """
+
+    def __init__(self, factory):
+        if not callable(factory):
+            raise TypeError("factory must be a callable returning an iterator of DataFrames.")
+        self._factory = factory
+
+    def __iter__(self):
+        for chunk in self._factory():
+            if not isinstance(chunk, pd.DataFrame):
+                raise TypeError("Chunks must be pandas DataFrames.")
+            yield chunk
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Build chunked data from an in-memory list of DataFrames."""
+        frames = list(frames)
+        return cls(lambda: iter(frames))
+
+    @classmethod
+    def from_frame(cls, data, chunksize):
+        """Split an in-memory DataFrame into row chunks of `chunksize`."""
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer.")
+        return cls(lambda: (data.iloc[start:start + chunksize] for start in range(0, len(data), chunksize)))
+
+    @property
+    def columns(self):
+        """Columns of the first chunk."""
+        for chunk in self:
+            return chunk.columns
+        return pd.Index([])
+
+    def map(self, func):
+        """Return new chunked data that applies `func` lazily to every chunk."""
+        factory = self._factory
+        return ChunkedData(lambda: (func(chunk) for chunk in factory()))
+
+    def collect(self):
+        """Concatenate all chunks into a single DataFrame."""
+        frames = list(self)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames)
+
+
+def numeric_columns(data):
+    """Numeric columns of a DataFrame or chunked data, in order."""
+    if isinstance(data, ChunkedData):
+        for chunk in data:
+            return chunk.select_dtypes(include="number").columns
+        return pd.Index([])
+    return data.select_dtypes(include="number").columns
+
+
+def streaming_moments(chunks, columns):
+    """Count, sum, sum of squares, min and max per column in one pass.
+
+    Returns a DataFrame indexed by column with the columns
+    count, mean, std, min and max (std uses ddof=1 like pandas).
+    """
+    columns = list(columns)
+    count = np.zeros(len(columns))
+    total = np.zeros(len(columns))
+    shift = None
+    total_sq = np.zeros(len(columns))
+    minimum = np.full(len(columns), np.inf)
+    maximum = np.full(len(columns), -np.inf)
+    for chunk in chunks:
+        values = chunk[columns].to_numpy(dtype="float64", na_value=np.nan)
+        if values.size == 0:
+            continue
+        if shift is None:
+            # Shift by a representative value to keep the sum of squares
+            # numerically stable on data with a large offset.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                shift = np.nan_to_num(np.nanmean(values, axis=0))
+        valid = ~np.isnan(values)
+        centered = np.where(valid, values - shift, 0.0)
+        count += valid.sum(axis=0)
+        total += centered.sum(axis=0)
+        total_sq += (centered ** 2).sum(axis=0)
+        minimum = np.fmin(minimum, np.nanmin(np.where(valid, values, np.inf), axis=0))
+        maximum = np.fmax(maximum, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+
+    if shift is None:
+        shift = np.zeros(len(columns))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count + shift, np.nan)
+        variance = (total_sq - total ** 2 / np.where(count > 0, count, 1)) / (count - 1)
+        std = np.where(count > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+    minimum = np.where(count > 0, minimum, np.nan)
+    maximum = np.where(count > 0, maximum, np.nan)
+    return pd.DataFrame({"count": count, "mean": mean, "std": std, "min": minimum, "max": maximum}, index=columns)
+
+
+def streaming_median(chunks, columns, moments=None, bins=4096):
+    """Exact per-column median over chunked data with bounded memory.
+
+    A histogram pass locates the bin(s) holding the middle rank(s), then a
+    second pass collects only the values in those bins and selects the
+    median from them.
+    """
+    columns = list(columns)
+    if moments is None:
+        moments = streaming_moments(chunks, columns)
+    medians = {}
+    counts = moments["count"].to_numpy()
+    lows = moments["min"].to_numpy()
+    highs = moments["max"].to_numpy()
+    edges = {}
+    histograms = {}
+    for i, col in enumerate(columns):
+        if counts[i] == 0:
+            medians[col] = np.nan
+        elif lows[i] == highs[i]:
+            medians[col] = lows[i]
+        else:
+            edges[col] = np.linspace(lows[i], highs[i], bins + 1)
+            histograms[col] = np.zeros(bins, dtype="int64")
+    if not edges:
+        return pd.Series(medians, index=columns, dtype="float64")
+
+    for chunk in chunks:
+        for col in edges:
+            values = chunk[col].to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            histograms[col] += np.histogram(values, bins=edges[col])[0]
+
+    targets = {}
+    for col in edges:
+        n = int(moments.at[col, "count"])
+        ranks = (n // 2,) if n % 2 else (n // 2 - 1, n // 2)
+        cumulative = np.cumsum(histograms[col])
+        wanted = sorted({int(np.searchsorted(cumulative, rank, side="right")) for rank in ranks})
+        offset = {b: int(cumulative[b] - histograms[col][b]) for b in wanted}
+        targets[col] = (ranks, wanted, offset, [])
+
+    for chunk in chunks:
+        for col, (_, wanted, _, buckets) in targets.items():
+            values = chunk[col].to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            index = np.clip(np.searchsorted(edges[col], values, side="right") - 1, 0, bins - 1)
+            buckets.append(values[np.isin(index, wanted)])
+
+    for col, (ranks, wanted, offset, buckets) in targets.items():
+        selected = np.sort(np.concatenate(buckets)) if buckets else np.array([])
+        picked = []
+        for rank in ranks:
+            # Values of the wanted bins are contiguous in sorted order, so a
+            # rank maps to a position inside the concatenated selection.
+            start = offset[wanted[0]]
+            picked.append(selected[rank - start])
+        medians[col] = float(np.mean(picked))
+    return pd.Series(medians, index=columns, dtype="float64")
+
+
+def streaming_mode(chunks, columns):
+    """Most frequent non-null value per column, merged across chunks."""
+    columns = list(columns)
+    counts = {col: None for col in columns}
+    for chunk in chunks:
+        for col in columns:
+            current = chunk[col].value_counts(dropna=True)
+            counts[col] = current if counts[col] is None else counts[col].add(current, fill_value=0)
+    modes = {}
+    for col, value_counts in counts.items():
+        if value_counts is not None and not value_counts.empty:
+            best = value_counts.max()
+            tied = list(value_counts[value_counts == best].index)
+            try:
+                # Match Series.mode, which returns the smallest of tied values.
+                modes[col] = sorted(tied)[0]
+            except TypeError:
+                modes[col] = tied[0]
+    return modes
@@ -0,0 +1,295 @@
+"""
+Batch cleaning from a declarative spec: `datacleanpro job.yaml` (or `python -m DataCleanPro job.json`).
+
+A spec is a YAML (requires PyYAML) or JSON mapping:
+
+    inputs: ["raw/*.csv", "extra/2024.parquet"]   # paths or glob patterns
+    format: csv              # optional; otherwise inferred from each file's extension
+    chunksize: 200000        # optional; stream CSV/Parquet/NDJSON inputs in chunks of this many rows
+    workers: 8               # files cleaned at the same time (default 1)
+    executor: process        # 'process' (default) or 'thread'
+    backend: thread          # optional Preprocessor/Transformation backend within each file
+    steps:
+      - handle_missing_values: {strategy: median}
+      - encode_categorical: {columns: [Sex], method: frequency}
+      - handle_outliers: {method: iqr}
+      - remove_duplicates: {}
+      - standardize_data: {columns: [Fare]}
+    output:
+      directory: cleaned
+      format: parquet        # csv, json, ndjson, parquet, feather or orc
+
+Every file is loaded, cleaned by the steps in order and written to the output directory
+under its own name. A per-step timing summary is printed at the end. With `chunksize`, steps
+gather their statistics while timed, but apply them lazily chunk by chunk, so that part
+is counted in 'write'.
+"""
+import argparse
+import glob
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from .backends import BACKENDS, get_backend
+from .chunked import ChunkedData
+from .data_loader import READERS, DataLoader, _file_format
+from .preprocessor import Preprocessor
+from .transformation import Transformation
+
+# Step name -> class that runs it; outlier steps always remove the outliers.
+STEPS = {
+    "handle_missing_values": Preprocessor,
+    "encode_categorical": Preprocessor,
+    "handle_outliers": Preprocessor,
+    "remove_duplicates": Preprocessor,
+    "normalize_data": Transformation,
+    "standardize_data": Transformation,
+}
+OUTPUT_FORMATS = {"csv": ".csv", "json": ".json", "ndjson": ".jsonl", "parquet": ".parquet", "feather": ".feather",
+                  "orc": ".orc"}
+
+
+def load_spec(path):
+    """Read a job spec from a .yaml/.yml or .json file."""
+    with open(path, encoding="utf-8") as handle:
+        text = handle.read()
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("YAML specs require PyYAML. Install it with 'pip install DataCleanPro[yaml]'.")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def validate_spec(spec):
+    """Check a spec and return it with defaults filled in; raises ValueError on the first problem."""
+    if not isinstance(spec, dict):
+        raise ValueError("The spec must be a mapping with 'inputs', 'steps' and 'output'.")
+    unknown = set(spec) - {"inputs", "format", "chunksize", "workers", "executor", "backend", "steps", "output"}
+    if unknown:
+        raise ValueError(f"Unknown spec keys: {sorted(unknown)}.")
+    inputs = spec.get("inputs")
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    if not inputs:
+        raise ValueError("The spec needs at least one entry in 'inputs'.")
+    if spec.get("format") is not None and spec["format"] not in READERS:
+        raise ValueError(f"Invalid format '{spec['format']}'. Valid are: {list(READERS)}.")
+    chunksize = spec.get("chunksize")
+    if chunksize is not None and (not isinstance(chunksize, int) or chunksize <= 0):
+        raise ValueError("chunksize must be a positive integer.")
+    workers = spec.get("workers", 1)
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    executor = spec.get("executor", "process")
+    if executor not in ["process", "thread"]:
+        raise ValueError(f"Invalid executor '{executor}'. Valid are: ['process', 'thread'].")
+    if spec.get("backend") is not None and spec["backend"] not in BACKENDS:
+        raise ValueError(f"Invalid backend '{spec['backend']}'. Valid are: {list(BACKENDS)}.")
+
+    steps = []
+    for step in spec.get("steps") or []:
+        if isinstance(step, str):
+            step = {step: {}}
+        if not isinstance(step, dict) or len(step) != 1:
+            raise ValueError(f"Each step must be a name or a one-key mapping of name to parameters, got {step!r}.")
+        (name, params), = step.items()
+        if name not in STEPS:
+            raise ValueError(f"Invalid step '{name}'. Valid are: {list(STEPS)}.")
+        if chunksize is not None and name == "encode_categorical":
+            raise ValueError("Step 'encode_categorical' needs whole files; remove 'chunksize' to use it.")
+        params = dict(params or {})
+        valid = [param for param in inspect.signature(getattr(STEPS[name], name)).parameters if param != "self"]
+        unknown = sorted(set(params) - set(valid))
+        if unknown:
+            raise ValueError(f"Invalid parameters {unknown} for step '{name}'. Valid are: {valid}.")
+        steps.append((name, params))
+    if not steps:
+        raise ValueError("The spec needs at least one entry in 'steps'.")
+
+    output = spec.get("output")
+    if not isinstance(output, dict) or "directory" not in output:
+        raise ValueError("The spec needs 'output' with a 'directory'.")
+    output_format = output.get("format", "csv")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output format '{output_format}'. Valid are: {list(OUTPUT_FORMATS)}.")
+    return {"inputs": list(inputs), "format": spec.get("format"), "chunksize": chunksize, "workers": workers,
+            "executor": executor, "backend": spec.get("backend"), "steps": steps,
+            "output": {"directory": output["directory"], "format": output_format}}
+
+
+def expand_inputs(inputs):
+    """Input paths with glob patterns expanded, in order and without repeats."""
+    paths = []
+    for pattern in inputs:
+        pattern = os.path.expanduser(pattern)
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    if not paths:
+        raise ValueError("No input files matched.")
+    return paths
+
+
+def output_path(path, spec):
+    """Where the cleaned copy of input `path` is written: the output directory plus the input's file stem."""
+    stem = os.path.splitext(os.path.basename(path.split("?")[0]))[0]
+    return os.path.join(spec["output"]["directory"], stem + OUTPUT_FORMATS[spec["output"]["format"]])
+
+
+def check_outputs(paths, spec):
+    """Raise ValueError if two inputs would be written to the same output file."""
+    seen = {}
+    for path in paths:
+        output = output_path(path, spec)
+        if output in seen:
+            raise ValueError(f"Inputs '{seen[output]}' and '{path}' would both be written to '{output}'; "
+                             f"rename one of them or clean them in separate jobs.")
+        seen[output] = path
+
+
+def _load(path, spec):
+    file_format = _file_format(path, spec["format"])
+    if spec["chunksize"] is not None:
+        if file_format == "csv":
+            return DataLoader.stream_csv(path, chunksize=spec["chunksize"])
+        if file_format == "parquet":
+            return DataLoader.stream_parquet(path, batch_size=spec["chunksize"], dtype_backend=None)
+        if file_format == "ndjson":
+            return DataLoader.stream_json(path, chunksize=spec["chunksize"])
+    return READERS[file_format](path)
+
+
+def _write(data, path, output_format):
+    """Write a DataFrame or ChunkedData; returns the number of rows written."""
+    if isinstance(data, ChunkedData):
+        rows = 0
+        if output_format in ("csv", "ndjson"):
+            header_written = False
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                for chunk in data:
+                    if output_format == "csv":
+                        # Chunks can be empty after filtering steps; the header goes out exactly once.
+                        chunk.to_csv(handle, index=False, header=not header_written)
+                        header_written = True
+                    else:
+                        chunk.to_json(handle, orient="records", lines=True)
+                    rows += len(chunk)
+            return rows
+        if output_format in ("parquet", "feather"):
+            def counted(chunk):
+                nonlocal rows
+                rows += len(chunk)
+                return chunk
+            getattr(DataLoader, f"write_{output_format}")(data.map(counted), path)
+            return rows
+        data = data.collect()
+    if output_format == "csv":
+        data.to_csv(path, index=False)
+    elif output_format == "json":
+        data.to_json(path, orient="records")
+    elif output_format == "ndjson":
+        data.to_json(path, orient="records", lines=True)
+    else:
+        getattr(DataLoader, f"write_{output_format}")(data, path)
+    return len(data)
+
+
+def clean_file(path, spec):
+    """
+    Load, clean and write one input file. Returns a result dict with the output path,
+    row counts, (label, seconds) timings per stage and the error message if it failed.
+    """
+    result = {"input": path, "output": None, "rows_in": None, "rows_out": None, "timings": [], "error": None}
+    output = output_path(path, spec)
+    try:
+        start = time.perf_counter()
+        data = _load(path, spec)
+        result["timings"].append(("load", time.perf_counter() - start))
+        if isinstance(data, pd.DataFrame):
+            result["rows_in"] = len(data)
+        # One backend for all steps of the file; chunked steps run during the write, so it stays open until then.
+        with get_backend(spec["backend"]) as backend:
+            for number, (name, params) in enumerate(spec["steps"], start=1):
+                start = time.perf_counter()
+                if name == "handle_outliers":
+                    params = dict(params, remove=True)
+                data = getattr(STEPS[name](data, backend=backend), name)(**params)
+                result["timings"].append((f"{number}. {name}", time.perf_counter() - start))
+            start = time.perf_counter()
+            result["rows_out"] = _write(data, output, spec["output"]["format"])
+            result["timings"].append(("write", time.perf_counter() - start))
+        result["output"] = output
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def run(spec):
+    """Clean every input of a validated spec with `workers` files at a time; results keep input order."""
+    paths = expand_inputs(spec["inputs"])
+    check_outputs(paths, spec)
+    os.makedirs(spec["output"]["directory"], exist_ok=True)
+    workers = min(spec["workers"], len(paths))
+    if workers == 1:
+        return [clean_file(path, spec) for path in paths]
+    pool_class = ThreadPoolExecutor if spec["executor"] == "thread" else ProcessPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        return list(pool.map(clean_file, paths, [spec] * len(paths)))
+
+
+def format_summary(results, elapsed, workers):
+    """Per-stage timing table summed over files, followed by any failures."""
+    totals, counts = {}, {}
+    for result in results:
+        for label, seconds in result["timings"]:
+            totals[label] = totals.get(label, 0.0) + seconds
+            counts[label] = counts.get(label, 0) + 1
+    done = [result for result in results if result["error"] is None]
+    rows_out = sum(result["rows_out"] or 0 for result in done)
+    lines = [f"Cleaned {len(done)} of {len(results)} files ({rows_out:,} rows written) "
+             f"in {elapsed:.2f} s with {workers} worker(s)", ""]
+    grand_total = sum(totals.values()) or 1.0
+    lines.append(f"{'stage':<36}{'total s':>10}{'mean s':>10}{'share':>8}")
+    for label, seconds in totals.items():
+        lines.append(f"{label:<36}{seconds:>10.3f}{seconds / counts[label]:>10.3f}{seconds / grand_total:>8.1%}")
+    for result in results:
+        if result["error"] is not None:
+            lines.append(f"FAILED {result['input']}: {result['error']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="datacleanpro", description="Clean files as described by a YAML or JSON spec.")
+    parser.add_argument("spec", help="path to the job spec (.yaml, .yml or .json)")
+    parser.add_argument("--workers", type=int, help="override the spec's number of parallel files")
+    parser.add_argument("--output-dir", help="override the spec's output directory")
+    parser.add_argument("--dry-run", action="store_true", help="validate the spec and list the inputs without cleaning")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = load_spec(args.spec)
+        if isinstance(spec, dict):
+            if args.workers is not None:
+                spec["workers"] = args.workers
+            if args.output_dir is not None:
+                spec.setdefault("output", {})["directory"] = args.output_dir
+        spec = validate_spec(spec)
+        paths = expand_inputs(spec["inputs"])
+        check_outputs(paths, spec)
+    except (OSError, ValueError, ImportError) as error:
+        print(f"datacleanpro: {error}", file=sys.stderr)
+        return 2
+    if args.dry_run:
+        print("\n".join(f"{path} -> {spec['output']['directory']}" for path in paths))
+        return 0
+
+    start = time.perf_counter()
+    results = run(spec)
+    print(format_summary(results, time.perf_counter() - start, min(spec["workers"], len(paths))))
+    return 1 if any(result["error"] is not None for result in results) else 0
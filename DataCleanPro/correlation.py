@@ -0,0 +1,271 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .chunked import ChunkedData, numeric_columns
+from .sketches import KLLSketch
+
+# Rows per matrix product; bounds the float64 copy of each slice.
+BLOCK_ROWS = 16384
+
+
+class Correlation:
+    """
+    Running sufficient statistics for a pairwise-complete correlation matrix.
+
+    Each chunk adds its cross-products with a BLAS matrix product (X^T X), so the
+    cost is one GEMM per row block and the state is a few p x p arrays regardless
+    of the number of rows. Values are shifted by the first chunk's means to keep the
+    sums numerically stable. While no missing values have been seen, counts and sums
+    are kept per column; the first chunk with NaN switches to per-pair statistics
+    (like pandas' pairwise-complete `corr`), which costs three more products per block.
+    States over the same columns merge, so chunks or workers can be combined.
+    """
+
+    def __init__(self, columns, method="pearson"):
+        self.columns = list(columns)
+        self.method = method
+        self.shift = None
+        self.n = 0
+        self.sx = None
+        self.sxx = None
+        self.sxy = None
+        self.rank_sketches = None
+        self.incremental = True
+
+    @classmethod
+    def compute(cls, data, columns=None, method="pearson"):
+        """
+        Correlation of a DataFrame or ChunkedData.
+        method: 'pearson', or 'spearman' (exact ranks on a DataFrame; on chunked data a first
+                pass sketches each column so values are mapped to approximate ranks). Columns
+                are ranked once each, so with missing values the result differs slightly from
+                pandas, which re-ranks the complete rows of every pair.
+        """
+        valid = ["pearson", "spearman"]
+        if method not in valid:
+            raise ValueError(f"Invalid method '{method}'. Valid are: {valid}.")
+        if columns is None:
+            columns = numeric_columns(data)
+        columns = list(columns)
+        if not columns:
+            raise ValueError("No numeric columns found or specified for correlation.")
+        state = cls(columns, method)
+        if isinstance(data, ChunkedData):
+            if method == "spearman":
+                state.rank_sketches = [KLLSketch(k=400, seed=0) for _ in columns]
+                for chunk in data:
+                    values = state._values(chunk)
+                    for position, sketch in enumerate(state.rank_sketches):
+                        sketch.update(values[:, position])
+            for chunk in data:
+                state.update(chunk)
+        else:
+            if method == "spearman":
+                state._accumulate(data[columns].rank().to_numpy(dtype="float64", na_value=np.nan))
+                # Ranks are relative to this data, so further rows cannot be added.
+                state.incremental = False
+            else:
+                state.update(data)
+        return state
+
+    def _values(self, chunk):
+        missing = [col for col in self.columns if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Column '{missing[0]}' not found in the DataFrame.")
+        return chunk[self.columns].to_numpy(dtype="float64", na_value=np.nan)
+
+    def _ranks(self, values):
+        """Approximate ranks from the sketched CDF of each column."""
+        ranks = np.empty_like(values)
+        for position, sketch in enumerate(self.rank_sketches):
+            items, weights = sketch.weighted_items()
+            ranks[:, position] = np.interp(values[:, position], items, np.cumsum(weights) - weights / 2)
+        return np.where(np.isnan(values), np.nan, ranks)
+
+    def update(self, chunk):
+        """Add the rows of a DataFrame chunk."""
+        if not self.incremental:
+            raise ValueError("Exact Spearman correlation cannot be updated; compute it on chunked data instead.")
+        values = self._values(chunk)
+        if self.rank_sketches is not None:
+            values = self._ranks(values)
+        self._accumulate(values)
+        return self
+
+    def _accumulate(self, values):
+        for start in range(0, len(values), BLOCK_ROWS):
+            block = values[start:start + BLOCK_ROWS]
+            if self.shift is None:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    self.shift = np.nan_to_num(np.nanmean(block, axis=0))
+                self.sx = np.zeros(len(self.columns))
+                self.sxx = np.zeros(len(self.columns))
+                self.sxy = np.zeros((len(self.columns), len(self.columns)))
+            block = block - self.shift
+            missing = np.isnan(block)
+            if missing.any():
+                self._expand()
+                present = (~missing).astype("float64")
+                block[missing] = 0.0
+                self.n += present.T @ present
+                self.sx += block.T @ present
+                self.sxx += (block * block).T @ present
+            elif self.sx.ndim == 1:
+                self.n += len(block)
+                self.sx += block.sum(axis=0)
+                self.sxx += (block * block).sum(axis=0)
+            else:
+                self.n += len(block)
+                self.sx += block.sum(axis=0)[:, None]
+                self.sxx += (block * block).sum(axis=0)[:, None]
+            self.sxy += block.T @ block
+
+    def _expand(self):
+        """Switch from per-column to per-pair counts and sums."""
+        if self.sx.ndim == 1:
+            p = len(self.columns)
+            self.n = np.full((p, p), float(self.n))
+            self.sx = np.repeat(self.sx[:, None], p, axis=1)
+            self.sxx = np.repeat(self.sxx[:, None], p, axis=1)
+
+    def _reshift(self, shift):
+        """Re-express the sums relative to another shift vector."""
+        delta = self.shift - shift
+        pairwise = self.sx.ndim == 2
+        sx = self.sx if pairwise else self.sx[:, None]
+        sy = self.sx.T if pairwise else self.sx[None, :]
+        n = self.n
+        self.sxy = self.sxy + delta[:, None] * sy + delta[None, :] * sx + n * np.outer(delta, delta)
+        if pairwise:
+            self.sxx = self.sxx + 2 * delta[:, None] * self.sx + n * delta[:, None] ** 2
+            self.sx = self.sx + n * delta[:, None]
+        else:
+            self.sxx = self.sxx + 2 * delta * self.sx + n * delta ** 2
+            self.sx = self.sx + n * delta
+        self.shift = shift
+
+    def merge(self, other):
+        """Fold the statistics of another state over the same columns into this one."""
+        if other.columns != self.columns or other.method != self.method:
+            raise ValueError("Can only merge correlation states over the same columns and method.")
+        if not self.incremental or not other.incremental:
+            raise ValueError("Exact Spearman correlation cannot be merged; compute it on chunked data instead.")
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            self.shift, self.sx, self.sxx, self.sxy = other.shift, other.sx.copy(), other.sxx.copy(), other.sxy.copy()
+            self.n = np.copy(other.n) if np.ndim(other.n) else other.n
+            return self
+        other_sx, other_sxx, other_sxy, other_n = other.sx, other.sxx, other.sxy, other.n
+        if not np.array_equal(other.shift, self.shift):
+            moved = Correlation(other.columns, other.method)
+            moved.shift, moved.n, moved.sx, moved.sxx, moved.sxy = other.shift, other.n, other.sx, other.sxx, other.sxy
+            moved._reshift(self.shift)
+            other_sx, other_sxx, other_sxy, other_n = moved.sx, moved.sxx, moved.sxy, moved.n
+        if other_sx.ndim == 2 or self.sx.ndim == 2:
+            self._expand()
+            if other_sx.ndim == 1:
+                p = len(self.columns)
+                other_n = np.full((p, p), float(other_n))
+                other_sx = np.repeat(other_sx[:, None], p, axis=1)
+                other_sxx = np.repeat(other_sxx[:, None], p, axis=1)
+        self.n = self.n + other_n
+        self.sx = self.sx + other_sx
+        self.sxx = self.sxx + other_sxx
+        self.sxy = self.sxy + other_sxy
+        return self
+
+    def matrix(self):
+        """Correlation matrix as a DataFrame (NaN where a pair has fewer than two rows or no spread)."""
+        p = len(self.columns)
+        if self.shift is None:
+            return pd.DataFrame(np.full((p, p), np.nan), index=self.columns, columns=self.columns)
+        if self.sx.ndim == 1:
+            sx, sy, sxx, syy = self.sx[:, None], self.sx[None, :], self.sxx[:, None], self.sxx[None, :]
+        else:
+            sx, sy, sxx, syy = self.sx, self.sx.T, self.sxx, self.sxx.T
+        n = self.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * self.sxy - sx * sy
+            variance_x = np.maximum(n * sxx - sx * sx, 0.0)
+            variance_y = np.maximum(n * syy - sy * sy, 0.0)
+            result = covariance / np.sqrt(variance_x * variance_y)
+        result = np.clip(result, -1.0, 1.0)
+        result[np.broadcast_to(n, result.shape) < 2] = np.nan
+        diagonal = np.diagonal(result).copy()
+        np.fill_diagonal(result, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return pd.DataFrame(result, index=self.columns, columns=self.columns)
+
+    def top_pairs(self, k=20, absolute=True):
+        """The `k` most strongly correlated column pairs, strongest first."""
+        return top_pairs(self.matrix(), k, absolute)
+
+
+def top_pairs(matrix, k=20, absolute=True):
+    """The `k` strongest off-diagonal pairs of a correlation matrix as a DataFrame (left, right, correlation)."""
+    values = matrix.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pairs = values[rows, cols]
+    strength = np.abs(pairs) if absolute else pairs.copy()
+    strength = np.where(np.isnan(strength), -np.inf, strength)
+    k = min(k, len(pairs))
+    if k == 0:
+        return pd.DataFrame(columns=["left", "right", "correlation"])
+    chosen = np.argpartition(-strength, k - 1)[:k]
+    chosen = chosen[np.argsort(-strength[chosen], kind="stable")]
+    labels = np.asarray(matrix.columns, dtype=object)
+    return pd.DataFrame({"left": labels[rows[chosen]], "right": labels[cols[chosen]], "correlation": pairs[chosen]})
+
+
+def cluster_order(matrix):
+    """
+    Column order that places strongly correlated columns next to each other: average-linkage
+    clustering on 1 - |r| when scipy is installed, otherwise the order of the leading
+    eigenvector of |r| (found by power iteration, so it stays cheap for thousands of columns).
+    """
+    values = np.nan_to_num(np.abs(matrix.to_numpy()))
+    if len(values) < 3:
+        return np.arange(len(values))
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+    except ImportError:
+        vector = np.ones(len(values))
+        for _ in range(100):
+            updated = values @ vector
+            updated /= np.linalg.norm(updated)
+            if np.allclose(updated, vector, atol=1e-9):
+                break
+            vector = updated
+        return np.argsort(-vector, kind="stable")
+    distance = 1.0 - values
+    np.fill_diagonal(distance, 0.0)
+    return leaves_list(linkage(squareform(distance, checks=False), method="average"))
+
+
+def downsample(matrix, max_size=100):
+    """Average a correlation matrix over blocks of adjacent columns so it has at most `max_size` rows."""
+    size = len(matrix)
+    if size <= max_size:
+        return matrix
+    edges = np.linspace(0, size, max_size + 1).astype(int)
+    values = matrix.to_numpy()
+    row_means = np.add.reduceat(np.nan_to_num(values), edges[:-1], axis=0)
+    block_sums = np.add.reduceat(row_means, edges[:-1], axis=1)
+    widths = np.diff(edges)
+    labels = [f"{matrix.columns[start]}..{matrix.columns[stop - 1]}" if stop - start > 1 else str(matrix.columns[start])
+              for start, stop in zip(edges[:-1], edges[1:])]
+    return pd.DataFrame(block_sums / np.outer(widths, widths), index=labels, columns=labels)
+
+
+def heatmap_matrix(matrix, cluster=None, max_size=100):
+    """Matrix to draw: reordered by `cluster_order` (default: when it has to be downsampled) and downsampled."""
+    if cluster is None:
+        cluster = len(matrix) > max_size
+    if cluster:
+        order = cluster_order(matrix)
+        matrix = matrix.iloc[order, order]
+    return downsample(matrix, max_size)
@@ -1,15 +1,544 @@
+import bz2
+import contextlib
+import glob
+import gzip
+import io
+import json
+import lzma
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from .chunked import ChunkedData
+from .optimizer import category_columns, format_report, optimize_dtypes
+
 class DataLoader:
     @staticmethod
-    def load_csv(file_path):
-        """Load a CSV file from a URL or local path into a DataFrame."""
-        return pd.read_csv(file_path)
+    def load_csv(file_path, optimize=False, sample_size=10000, max_category_ratio=0.5, verbose=False, fetcher=None):
+        """Load a CSV file from a URL or local path into a DataFrame.
+        optimize: downcast numeric columns and parse repetitive string columns
+                  (chosen from the first `sample_size` rows) straight into category
+        verbose: print the memory usage before and after optimization
+        fetcher: RemoteFetcher for http(s) URLs (default: a shared one without cache);
+                 the file is downloaded once, with retries, and parsed from memory"""
+        source, compression = _source(file_path, fetcher)
+        if not optimize:
+            return pd.read_csv(source(), compression=compression)
+        sample = pd.read_csv(source(), nrows=sample_size, compression=compression)
+        categories = category_columns(sample, max_category_ratio)
+        data = pd.read_csv(source(), dtype={col: "category" for col in categories}, compression=compression)
+        return DataLoader.optimize_dtypes(data, sample_size, max_category_ratio, verbose=verbose)
+    @staticmethod
+    def load_xlsx(file_path, fetcher=None):
+        """Load a XLSX file from a URL or local path into a DataFrame. fetcher: see `load_csv`"""
+        source, _ = _source(file_path, fetcher)
+        return pd.read_excel(source())
+    @staticmethod
+    def load_json(file_path, optimize=False, sample_size=10000, max_category_ratio=0.5, verbose=False, fetcher=None,
+                  lines=None, columns=None, schema=None):
+        """Load a JSON file from a URL or local path into a DataFrame.
+        optimize, verbose, fetcher: see `load_csv`
+        lines: True for newline-delimited JSON (one record per line); inferred from a
+               .jsonl/.ndjson extension if None. Such files are parsed block by block
+               into typed columns, see `stream_json` for `columns` and `schema`"""
+        if lines is None:
+            lines = _ndjson_extension(file_path)
+        if lines:
+            frames = list(_read_ndjson(file_path, fetcher, None, None, columns, schema, None))
+            data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns or getattr(schema, "names", schema))
+        elif columns is not None or schema is not None:
+            raise ValueError("columns and schema apply to newline-delimited JSON only; pass lines=True.")
+        else:
+            source, compression = _source(file_path, fetcher)
+            data = pd.read_json(source(), compression=compression)
+        if optimize:
+            data = DataLoader.optimize_dtypes(data, sample_size, max_category_ratio, verbose=verbose)
+        return data
+    @staticmethod
+    def optimize_dtypes(data, sample_size=10000, max_category_ratio=0.5, float32=False, report=False, verbose=False):
+        """
+        Shrink a DataFrame's memory footprint.
+        Integers get the smallest signed width holding their range, float64 columns
+        become float32 when `float32` is True or a sample round-trips exactly, and
+        string columns with a sampled distinct ratio <= `max_category_ratio` become category.
+        report: if True, also return a dict with per-column dtype changes and bytes before/after
+        """
+        optimized, details = optimize_dtypes(data, sample_size, max_category_ratio, float32)
+        if verbose:
+            print(format_report(details))
+        if report:
+            return optimized, details
+        return optimized
+    @staticmethod
+    def stream_csv(file_path, chunksize=None, max_bytes=None, sample_rows=1000, fetcher=None):
+        """
+        Stream a CSV file as DataFrame chunks instead of loading it at once.
+        chunksize: number of rows per chunk
+        max_bytes: memory budget per chunk; rows per chunk are estimated from
+                   the in-memory size of the first `sample_rows` rows
+        fetcher: RemoteFetcher for http(s) URLs, whose body is parsed while it downloads
+        Exactly one of chunksize or max_bytes must be given. The returned
+        ChunkedData re-reads the file on every iteration.
+        """
+        if (chunksize is None) == (max_bytes is None):
+            raise ValueError("Specify exactly one of 'chunksize' or 'max_bytes'.")
+        if max_bytes is not None:
+            if max_bytes <= 0:
+                raise ValueError("max_bytes must be a positive integer.")
+            with _stream_source(file_path, fetcher) as source:
+                sample = pd.read_csv(source, nrows=sample_rows, compression=_compression(file_path))
+            if len(sample) == 0:
+                chunksize = sample_rows
+            else:
+                row_bytes = sample.memory_usage(index=True, deep=True).sum() / len(sample)
+                chunksize = max(1, int(max_bytes // max(row_bytes, 1)))
+        elif chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer.")
+
+        def read():
+            with _stream_source(file_path, fetcher) as source:
+                with pd.read_csv(source, chunksize=chunksize, compression=_compression(file_path)) as reader:
+                    yield from reader
+        return ChunkedData(read)
+    @staticmethod
+    def stream_json(file_path, chunksize=None, max_bytes=None, columns=None, schema=None, dtype_backend=None,
+                    fetcher=None):
+        """
+        Stream a newline-delimited JSON file (one record per line, optionally .gz/.bz2/.xz)
+        as DataFrame chunks. With pyarrow installed, blocks of lines are parsed straight into
+        typed Arrow columns; otherwise records go through `json` and `pd.json_normalize`.
+        chunksize: number of rows per chunk
+        max_bytes: bytes of input parsed per chunk (must exceed the longest line)
+        columns: columns to keep, in order; nested fields are flattened to dotted names ('user.id')
+        schema: {column: type} for the fast path, e.g. {"user.id": "int64", "amount": "double"}
+                (pyarrow type names or DataTypes, or a pyarrow Schema); fields outside the schema
+                and `columns` are skipped while parsing. Without it, types are inferred from the
+                first block; if a later block does not fit them (e.g. a field that was only null
+                so far), the rest of the file is read with the pure-Python parser
+        dtype_backend: None for NumPy dtypes (default), 'numpy_nullable' or 'pyarrow'
+        fetcher: RemoteFetcher for http(s) URLs, whose body is parsed while it downloads
+        Exactly one of chunksize or max_bytes must be given. The returned
+        ChunkedData re-reads the file on every iteration.
+        """
+        if (chunksize is None) == (max_bytes is None):
+            raise ValueError("Specify exactly one of 'chunksize' or 'max_bytes'.")
+        if (chunksize if max_bytes is None else max_bytes) <= 0:
+            raise ValueError(f"{'chunksize' if max_bytes is None else 'max_bytes'} must be a positive integer.")
+        valid = ["pyarrow", "numpy_nullable", None]
+        if dtype_backend not in valid:
+            raise ValueError(f"Invalid dtype_backend '{dtype_backend}'. Valid are: {valid}.")
+        return ChunkedData(lambda: _read_ndjson(file_path, fetcher, chunksize, max_bytes, columns, schema,
+                                                dtype_backend))
     @staticmethod
-    def load_xlsx(file_path):
-        """Load a XLSX file from a URL or local path into a DataFrame."""
-        return pd.read_excel(file_path)
+    def load_parquet(file_path, columns=None, filters=None, dtype_backend="pyarrow"):
+        """
+        Load a Parquet file or directory into a DataFrame.
+        columns: only these columns are read
+        filters: row predicate, either a pyarrow expression or a list of
+                 (column, op, value) tuples such as [("year", ">=", 2020)];
+                 row groups whose statistics cannot match are skipped
+        dtype_backend: 'pyarrow' for Arrow-backed dtypes, 'numpy_nullable' or None for NumPy dtypes
+        """
+        return _read_dataset(file_path, "parquet", columns, filters, dtype_backend)
     @staticmethod
-    def load_json(file_path):
-        """Load a JSON file from a URL or local path into a DataFrame."""
-        return pd.read_json(file_path)
\ No newline at end of file
+    def load_feather(file_path, columns=None, filters=None, dtype_backend="pyarrow"):
+        """Load a Feather / Arrow IPC file into a DataFrame. See `load_parquet` for the arguments."""
+        return _read_dataset(file_path, "ipc", columns, filters, dtype_backend)
+    @staticmethod
+    def load_orc(file_path, columns=None, filters=None, dtype_backend="pyarrow"):
+        """Load an ORC file into a DataFrame. See `load_parquet` for the arguments."""
+        return _read_dataset(file_path, "orc", columns, filters, dtype_backend)
+    @staticmethod
+    def stream_parquet(file_path, columns=None, filters=None, batch_size=131072, dtype_backend="pyarrow"):
+        """Stream a Parquet file as DataFrame chunks of at most `batch_size` rows with projection and filters applied."""
+        def read():
+            dataset = _dataset(file_path, "parquet")
+            for batch in dataset.to_batches(columns=columns, filter=_filter_expression(filters), batch_size=batch_size):
+                yield _to_pandas(batch, dtype_backend)
+        return ChunkedData(read)
+    @staticmethod
+    def write_parquet(data, file_path, compression="zstd", row_group_size=None):
+        """Write a DataFrame or ChunkedData to Parquet; chunked data is written chunk by chunk."""
+        pa, _ = _require_pyarrow()
+        import pyarrow.parquet as pq
+        if isinstance(data, pd.DataFrame):
+            pq.write_table(pa.Table.from_pandas(data, preserve_index=False), file_path,
+                           compression=compression, row_group_size=row_group_size)
+            return
+        writer = None
+        try:
+            for chunk in data:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(file_path, table.schema, compression=compression)
+                writer.write_table(table.cast(writer.schema), row_group_size=row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+    @staticmethod
+    def write_feather(data, file_path, compression="zstd"):
+        """Write a DataFrame or ChunkedData to a Feather / Arrow IPC file."""
+        pa, _ = _require_pyarrow()
+        import pyarrow.feather as feather
+        if isinstance(data, pd.DataFrame):
+            feather.write_feather(pa.Table.from_pandas(data, preserve_index=False), file_path, compression=compression)
+            return
+        writer = None
+        try:
+            for chunk in data:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    options = pa.ipc.IpcWriteOptions(compression=compression)
+                    writer = pa.ipc.new_file(file_path, table.schema, options=options)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+    @staticmethod
+    def write_orc(data, file_path):
+        """Write a DataFrame to an ORC file."""
+        pa, _ = _require_pyarrow()
+        from pyarrow import orc
+        if not isinstance(data, pd.DataFrame):
+            data = data.collect()
+        orc.write_table(pa.Table.from_pandas(data, preserve_index=False), file_path)
+
+    @staticmethod
+    def load_many(paths, file_format=None, workers=None, executor="thread", source_column=None,
+                  on_error="raise", report=False, fetcher=None):
+        """
+        Load many files (a glob pattern or a list of paths/URLs) in parallel and concatenate them once.
+        file_format: 'csv', 'json', 'ndjson', 'xlsx', 'parquet', 'feather' or 'orc'; inferred from the extension if None
+        workers: number of parallel readers (default: CPU count)
+        executor: 'thread' or 'process'
+        source_column: if given, add a category column with the file each row came from
+        on_error: 'raise' on an unreadable file or a schema mismatch, or 'skip' the file
+        report: if True, also return a dict with the loaded files and the skipped files with their errors
+        fetcher: RemoteFetcher that downloads the http(s) URLs among `paths` concurrently before
+                 parsing (default: a shared one without cache); with a cache_dir, its cached files are parsed
+        All files must have the same columns as the first readable file; columns are aligned to its order.
+        """
+        if on_error not in ["raise", "skip"]:
+            raise ValueError(f"Invalid on_error '{on_error}'. Valid are: ['raise', 'skip'].")
+        if executor not in ["thread", "process"]:
+            raise ValueError(f"Invalid executor '{executor}'. Valid are: ['thread', 'process'].")
+        if file_format is not None and file_format not in READERS:
+            raise ValueError(f"Invalid file_format '{file_format}'. Valid are: {list(READERS)}.")
+        if isinstance(paths, str):
+            pattern = os.path.expanduser(paths)
+            paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [paths]
+        paths = list(paths)
+        if not paths:
+            raise ValueError("No files found to load.")
+
+        pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        with contextlib.ExitStack() as stack:
+            local, errors = {}, {}
+            urls = [path for path in paths if _is_url(path)]
+            if urls:
+                fetcher = _fetcher(fetcher)
+                directory = None if fetcher.cache_dir else stack.enter_context(tempfile.TemporaryDirectory())
+                for url, download in zip(urls, fetcher.download_many(urls, directory, return_exceptions=True)):
+                    if isinstance(download, Exception):
+                        errors[url] = f"{type(download).__name__}: {download}"
+                    else:
+                        local[url] = download
+            readable = [path for path in paths if path not in errors]
+            with pool_class(max_workers=workers) as pool:
+                shards = pool.map(_read_shard, [local.get(path, path) for path in readable], [file_format] * len(readable))
+                read = dict(zip(readable, shards))
+        results = [read[path] if path in read else (None, errors[path]) for path in paths]
+
+        frames, loaded, skipped = [], [], {}
+        columns = None
+        for path, (frame, error) in zip(paths, results):
+            if error is None and columns is not None and set(frame.columns) != set(columns):
+                error = (f"Schema mismatch: expected columns {list(columns)}, got {list(frame.columns)}.")
+            if error is not None:
+                if on_error == "raise":
+                    raise ValueError(f"Could not load '{path}': {error}")
+                skipped[path] = error
+                continue
+            if columns is None:
+                columns = frame.columns
+            elif not frame.columns.equals(columns):
+                frame = frame[columns]
+            frames.append(frame)
+            loaded.append(path)
+        if not frames:
+            raise ValueError(f"None of the {len(paths)} files could be loaded.")
+
+        data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        if source_column is not None:
+            # A path listed more than once is loaded each time but is a single category.
+            categories = list(dict.fromkeys(loaded))
+            frame_codes = [categories.index(path) for path in loaded]
+            codes = np.repeat(frame_codes, [len(frame) for frame in frames])
+            data[source_column] = pd.Categorical.from_codes(codes, categories=categories)
+        if report:
+            return data, {"loaded": loaded, "skipped": skipped}
+        return data
+
+
+READERS = {
+    "csv": pd.read_csv,
+    "json": pd.read_json,
+    "ndjson": lambda path: DataLoader.load_json(path, lines=True),
+    "xlsx": pd.read_excel,
+    "parquet": lambda path: _read_dataset(path, "parquet", None, None, None),
+    "feather": lambda path: _read_dataset(path, "ipc", None, None, None),
+    "orc": lambda path: _read_dataset(path, "orc", None, None, None),
+}
+DECOMPRESSORS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+EXTENSIONS = {".csv": "csv", ".json": "json", ".jsonl": "ndjson", ".ndjson": "ndjson", ".xlsx": "xlsx",
+              ".xls": "xlsx", ".parquet": "parquet", ".feather": "feather", ".arrow": "feather", ".orc": "orc"}
+
+
+def _file_format(path, file_format):
+    if file_format is not None:
+        return file_format
+    name = str(path).split("?")[0].lower()
+    if name.endswith(".gz") or name.endswith(".zip") or name.endswith(".bz2"):
+        name = os.path.splitext(name)[0]
+    extension = os.path.splitext(name)[1]
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Cannot infer the format of '{path}'; pass file_format.")
+    return EXTENSIONS[extension]
+
+
+def _read_shard(path, file_format):
+    """Read one file, returning (frame, None) or (None, error message) so one bad shard does not stop the pool."""
+    try:
+        return READERS[_file_format(path, file_format)](path), None
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def _is_url(path):
+    return isinstance(path, str) and path[:8].lower().startswith(("http://", "https://"))
+
+
+def _fetcher(fetcher):
+    if fetcher is not None:
+        return fetcher
+    from .remote import default_fetcher
+    return default_fetcher()
+
+
+def _compression(path):
+    """pandas `compression` for a path: inferred by pandas for local paths, from the extension for URLs."""
+    if not _is_url(path):
+        return "infer"
+    from .remote import COMPRESSED_EXTENSIONS, url_extension
+    return COMPRESSED_EXTENSIONS.get(os.path.splitext(url_extension(path))[1])
+
+
+def _source(file_path, fetcher):
+    """
+    (open, compression) for a pandas reader. http(s) URLs are downloaded once through a
+    RemoteFetcher and re-read from memory; other paths are passed to pandas unchanged.
+    """
+    if not _is_url(file_path):
+        return (lambda: file_path), "infer"
+    content = _fetcher(fetcher).fetch(file_path)
+    return (lambda: io.BytesIO(content)), _compression(file_path)
+
+
+def _stream_source(file_path, fetcher):
+    """Context manager giving `file_path`, or for http(s) URLs a file object over the body as it downloads."""
+    if not _is_url(file_path):
+        return contextlib.nullcontext(file_path)
+    return _fetcher(fetcher).open(file_path)
+
+
+def _ndjson_extension(path):
+    stem, extension = os.path.splitext(str(path).split("?")[0].lower())
+    name = stem if extension in DECOMPRESSORS else stem + extension
+    return name.endswith((".jsonl", ".ndjson"))
+
+
+@contextlib.contextmanager
+def _open_binary(file_path, fetcher):
+    """Binary file object over a local path or http(s) URL, decompressed by its .gz/.bz2/.xz extension."""
+    with contextlib.ExitStack() as stack:
+        handle = stack.enter_context(_stream_source(file_path, fetcher))
+        if not hasattr(handle, "read"):
+            handle = stack.enter_context(open(handle, "rb"))
+        extension = os.path.splitext(str(file_path).split("?")[0].lower())[1]
+        if extension in DECOMPRESSORS:
+            handle = stack.enter_context(DECOMPRESSORS[extension](handle))
+        yield handle
+
+
+def _read_ndjson(file_path, fetcher, chunksize, max_bytes, columns, schema, dtype_backend):
+    """DataFrame chunks of a newline-delimited JSON file, nested fields flattened to dotted names."""
+    columns = None if columns is None else list(columns)
+    start = 0
+
+    def numbered(chunk):
+        nonlocal start
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        return chunk
+
+    try:
+        import pyarrow as pa
+        import pyarrow.json as pj
+    except ImportError:
+        pa = None
+    if pa is not None:
+        try:
+            for chunk in _ndjson_arrow(file_path, fetcher, chunksize, max_bytes, columns, schema, dtype_backend,
+                                       pa, pj):
+                yield numbered(chunk)
+            return
+        except pa.ArrowInvalid:
+            if schema is not None:
+                raise
+            # Without a schema, pyarrow fixes each type from the first block, so a field that was
+            # only null there fails a later block. Continue with the Python parser from the first
+            # row not returned yet.
+    for chunk in _ndjson_records(file_path, fetcher, chunksize or 100_000, max_bytes, columns, schema,
+                                 dtype_backend, skip=start):
+        yield numbered(chunk)
+
+
+def _ndjson_arrow(file_path, fetcher, chunksize, max_bytes, columns, schema, dtype_backend, pa, pj):
+    """Fast path of `_read_ndjson`: parse blocks of lines straight into Arrow columns."""
+    with _open_binary(file_path, fetcher) as handle:
+        if not handle.peek(1):
+            return
+        parse_options = None
+        if schema is not None:
+            explicit = _arrow_schema(schema, pa)
+            names = [".".join(path) for path in _leaf_paths(explicit, pa)]
+            columns = names if columns is None else columns
+            behavior = "ignore" if set(columns) <= set(names) else "infer"
+            parse_options = pj.ParseOptions(explicit_schema=explicit, unexpected_field_behavior=behavior)
+        reader = pj.open_json(handle, read_options=pj.ReadOptions(block_size=max_bytes or 1 << 20),
+                              parse_options=parse_options)
+        tables = _rebatch(reader, chunksize, pa) if chunksize else (pa.Table.from_batches([batch]) for batch in reader)
+        for table in tables:
+            while any(pa.types.is_struct(field.type) for field in table.schema):
+                table = table.flatten()
+            if columns is not None:
+                for col in columns:
+                    if col not in table.column_names:
+                        raise ValueError(f"Column '{col}' not found in the JSON records.")
+                table = table.select(columns)
+            yield _to_pandas(table, dtype_backend)
+
+
+def _ndjson_records(file_path, fetcher, chunksize, max_bytes, columns, schema, dtype_backend, skip=0):
+    """Pure-Python path of `_read_ndjson`: parse line batches with json and flatten with json_normalize."""
+    def frame(records):
+        data = pd.json_normalize(records)
+        if columns is not None or schema is not None:
+            data = data.reindex(columns=columns if columns is not None else list(schema))
+        if schema is not None:
+            data = data.astype(schema)
+        return data.convert_dtypes(dtype_backend=dtype_backend) if dtype_backend is not None else data
+
+    with _open_binary(file_path, fetcher) as handle:
+        records, size = [], 0
+        for line in handle:
+            if not line.strip():
+                continue
+            if skip:
+                skip -= 1
+                continue
+            records.append(json.loads(line))
+            size += len(line)
+            if len(records) == chunksize or (max_bytes is not None and size >= max_bytes):
+                yield frame(records)
+                records, size = [], 0
+        if records:
+            yield frame(records)
+
+
+def _arrow_schema(schema, pa):
+    """pyarrow Schema from a {dotted name: type} mapping, nesting dotted names into structs."""
+    if isinstance(schema, pa.Schema):
+        return schema
+    tree = {}
+    for name, dtype in schema.items():
+        *parents, leaf = name.split(".")
+        node = tree
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = dtype if isinstance(dtype, pa.DataType) else pa.type_for_alias(dtype)
+
+    def fields(node):
+        return [pa.field(key, pa.struct(fields(value)) if isinstance(value, dict) else value)
+                for key, value in node.items()]
+    return pa.schema(fields(tree))
+
+
+def _leaf_paths(fields, pa):
+    """Name paths of the non-struct fields, depth first (the order `Table.flatten` produces)."""
+    for field in fields:
+        if pa.types.is_struct(field.type):
+            for path in _leaf_paths(field.type, pa):
+                yield (field.name,) + path
+        else:
+            yield (field.name,)
+
+
+def _rebatch(batches, chunksize, pa):
+    """Regroup record batches into tables of exactly `chunksize` rows (the last one may be shorter)."""
+    pending, rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunksize)
+            rest = table.slice(chunksize)
+            pending, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("Columnar formats require pyarrow. Install it with 'pip install pyarrow'.")
+    return pa, ds
+
+
+def _dataset(file_path, file_format):
+    _, ds = _require_pyarrow()
+    return ds.dataset(file_path, format=file_format)
+
+
+def _filter_expression(filters):
+    if filters is None:
+        return None
+    _, ds = _require_pyarrow()
+    if isinstance(filters, ds.Expression):
+        return filters
+    import pyarrow.parquet as pq
+    return pq.filters_to_expression(filters)
+
+
+def _to_pandas(table, dtype_backend):
+    if dtype_backend == "pyarrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    if dtype_backend == "numpy_nullable":
+        return table.to_pandas().convert_dtypes(dtype_backend="numpy_nullable")
+    return table.to_pandas()
+
+
+def _read_dataset(file_path, file_format, columns, filters, dtype_backend):
+    valid = ["pyarrow", "numpy_nullable", None]
+    if dtype_backend not in valid:
+        raise ValueError(f"Invalid dtype_backend '{dtype_backend}'. Valid are: {valid}.")
+    dataset = _dataset(file_path, file_format)
+    table = dataset.to_table(columns=columns, filter=_filter_expression(filters))
+    return _to_pandas(table, dtype_backend)
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+
+FINGERPRINT_128 = np.dtype([("high", "<u8"), ("low", "<u8")])
+# The high word of 128-bit fingerprints uses its own string hash key and its own way of combining
+# columns; pandas ignores hash_key for numeric columns, so a different key alone is not enough.
+_SECOND_HASH_KEY = "5f2a9c1e7b3d4068"
+_SECOND_SEED = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _splitmix(values):
+    """SplitMix64 finalizer, a bijective mix of uint64 values."""
+    with np.errstate(over="ignore"):
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _second_word(frame):
+    """High fingerprint word: per-column hashes chained through SplitMix64 instead of pandas' combiner."""
+    high = np.full(len(frame), _SECOND_SEED, dtype=np.uint64)
+    for position in range(frame.shape[1]):
+        column = pd.util.hash_pandas_object(frame.iloc[:, position], index=False,
+                                            hash_key=_SECOND_HASH_KEY).to_numpy()
+        with np.errstate(over="ignore"):
+            high = _splitmix(high * np.uint64(0x100000001B3) + _splitmix(column + np.uint64(position)))
+    return high
+
+
+def row_fingerprints(frame, subset=None, bits=64):
+    """
+    Hash every row (or the `subset` columns) to a 64- or 128-bit fingerprint.
+    Rows with equal values get equal fingerprints; the index is not hashed.
+    """
+    if bits not in (64, 128):
+        raise ValueError("bits must be 64 or 128.")
+    if subset is not None:
+        subset = [subset] if isinstance(subset, str) else list(subset)
+        frame = frame[subset]
+    low = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    if bits == 64:
+        return low
+    fingerprints = np.empty(len(low), dtype=FINGERPRINT_128)
+    fingerprints["high"] = _second_word(frame)
+    fingerprints["low"] = low
+    return fingerprints
+
+
+class HashSet:
+    """
+    Exact set of fingerprints backed by sorted NumPy runs.
+    New keys form a sorted run; runs of similar size are merged (like a binary
+    counter), so inserts stay amortized O(log n) per key and lookups binary-search
+    a logarithmic number of runs.
+    """
+
+    def __init__(self):
+        self._runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, keys):
+        found = np.zeros(len(keys), dtype=bool)
+        for run in self._runs:
+            position = np.minimum(np.searchsorted(run, keys), len(run) - 1)
+            found |= run[position] == keys
+        return found
+
+    def add(self, keys):
+        run = np.unique(keys)
+        while self._runs and len(self._runs[-1]) <= len(run):
+            run = np.union1d(self._runs.pop(), run)
+        if len(run):
+            self._runs.append(run)
+
+
+class BloomFilter:
+    """
+    Probabilistic fingerprint set with a fixed memory budget.
+    May report a few unseen rows as already seen (at about `error_rate` once
+    `capacity` keys are stored) but never misses a real duplicate.
+    """
+
+    def __init__(self, capacity=10_000_000, error_rate=0.001):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1.")
+        self.n_bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2))
+        self.n_hashes = max(1, int(round(self.n_bits / capacity * np.log(2))))
+        self._bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _positions(self, keys):
+        if keys.dtype == FINGERPRINT_128:
+            first, second = keys["low"], keys["high"]
+        else:
+            first, second = keys, (keys >> np.uint64(32)) | (keys << np.uint64(32))
+        # Double hashing: h_i = h1 + i * h2, computed with uint64 wrap-around.
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            hashes = first[:, None] + steps[None, :] * (second[:, None] | np.uint64(1))
+        return hashes % np.uint64(self.n_bits)
+
+    def contains(self, keys):
+        positions = self._positions(keys)
+        bits = (self._bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def add(self, keys):
+        positions = self._positions(keys).ravel()
+        np.bitwise_or.at(self._bits, positions >> np.uint64(3),
+                         np.left_shift(1, (positions & np.uint64(7)).astype(np.uint8)).astype(np.uint8))
+        self._count += len(keys)
+
+
+class Deduplicator:
+    """
+    One-pass duplicate detection over a stream of chunks, keeping the first occurrence.
+    method: 'exact' (HashSet) or 'bloom' (BloomFilter with `capacity` and `error_rate`)
+    bits: fingerprint width, 64 or 128
+    rows_seen and duplicates report the counts of the rows processed so far.
+    """
+
+    def __init__(self, subset=None, method="exact", bits=64, capacity=10_000_000, error_rate=0.001):
+        valid = ["exact", "bloom"]
+        if method not in valid:
+            raise ValueError(f"Invalid method '{method}'. Valid are: {valid}.")
+        self.subset = subset
+        self.bits = bits
+        self.seen = HashSet() if method == "exact" else BloomFilter(capacity, error_rate)
+        self.rows_seen = 0
+        self.duplicates = 0
+
+    def duplicated(self, chunk):
+        """Boolean mask of rows already seen in this or an earlier chunk; updates the seen set."""
+        mask, keys = self.check(chunk)
+        self.record(mask, keys)
+        return mask
+
+    def check(self, chunk):
+        """(mask, fingerprints) of a chunk like `duplicated`, without recording it; pass both to `record`."""
+        keys = row_fingerprints(chunk, self.subset, self.bits)
+        within = pd.Series(keys) if keys.dtype != FINGERPRINT_128 else pd.DataFrame(keys)
+        mask = within.duplicated().to_numpy().copy()
+        fresh = ~mask
+        mask[fresh] = self.seen.contains(keys[fresh])
+        return mask, keys
+
+    def record(self, mask, keys):
+        """Add the rows of a `check` result to the seen set and the counts."""
+        self.seen.add(keys[~mask])
+        self.rows_seen += len(keys)
+        self.duplicates += int(mask.sum())
+
+    def drop_duplicates(self, chunk):
+        return chunk[~self.duplicated(chunk)]
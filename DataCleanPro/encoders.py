@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+
+
+def code_dtype(n_categories):
+    """Smallest signed integer dtype that holds codes 0..n-1 plus -1 for missing/unseen."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def is_categorical_column(series):
+    """True for object, string and category columns."""
+    return (pd.api.types.is_object_dtype(series)
+            or pd.api.types.is_string_dtype(series)
+            or isinstance(series.dtype, pd.CategoricalDtype))
+
+
+class CategoricalEncoder:
+    """
+    Base class for encoders built on pandas Categorical codes.
+    Categories are learned once with `fit` (in order of first appearance, via
+    `pd.factorize`, or the declared categories of a category column) and
+    reused by `transform` on later batches.
+    handle_unknown: 'ignore' maps categories not seen during fit to the unknown
+                    value; 'error' raises a ValueError
+    """
+
+    def __init__(self, handle_unknown="ignore"):
+        valid = ["ignore", "error"]
+        if handle_unknown not in valid:
+            raise ValueError(f"Invalid handle_unknown '{handle_unknown}'. Valid are: {valid}.")
+        self.handle_unknown = handle_unknown
+        self.categories = None
+
+    def fit(self, series):
+        self._fit_codes(series)
+        return self
+
+    def _fit_codes(self, series):
+        """Learn the categories and return the codes of `series` from the same hashing pass."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Keep the declared categories so their codes can be reused as-is.
+            self.categories = series.cat.categories
+            codes = series.cat.codes.to_numpy()
+        else:
+            codes, uniques = pd.factorize(series)
+            self.categories = pd.Index(uniques)
+        return codes.astype(code_dtype(len(self.categories)), copy=False)
+
+    def codes(self, series):
+        """Integer codes of `series` against the fitted categories; -1 for missing and unseen values."""
+        if self.categories is None:
+            raise ValueError(f"{type(self).__name__} is not fitted yet. Call 'fit' first.")
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            if not series.cat.categories.equals(self.categories):
+                # Translate the column's own codes through a small category lookup table.
+                lookup = np.append(self.categories.get_indexer(series.cat.categories), -1)
+                codes = lookup[codes]
+        else:
+            codes = self.categories.get_indexer(series)
+        if self.handle_unknown == "error":
+            unseen = (codes == -1) & series.notna().to_numpy()
+            if unseen.any():
+                examples = list(pd.unique(series[unseen])[:5])
+                raise ValueError(f"Column '{series.name}' has categories not seen during fit: {examples}.")
+        return codes.astype(code_dtype(len(self.categories)), copy=False)
+
+    def partial_fit(self, series):
+        """
+        Learn the categories of another batch without renumbering: unseen categories are
+        appended after the known ones, so codes handed out earlier stay valid.
+        """
+        self._partial_fit_codes(series)
+        return self
+
+    def _partial_fit_codes(self, series):
+        if self.categories is None:
+            return self._fit_codes(series)
+        values = series.astype(object) if isinstance(series.dtype, pd.CategoricalDtype) else series
+        codes = self.categories.get_indexer(values)
+        unseen = (codes == -1) & series.notna().to_numpy()
+        if unseen.any():
+            self.categories = self.categories.append(pd.Index(pd.unique(values[unseen])))
+            codes = self.categories.get_indexer(values)
+        return codes.astype(code_dtype(len(self.categories)), copy=False)
+
+    def transform(self, series):
+        return self._encode(self.codes(series), series)
+
+    def fit_transform(self, series):
+        return self._encode(self._fit_codes(series), series)
+
+    def partial_fit_transform(self, series):
+        return self._encode(self._partial_fit_codes(series), series)
+
+    def _encode(self, codes, series):
+        raise NotImplementedError
+
+
+class LabelEncoder(CategoricalEncoder):
+    """Label encoding into the smallest integer dtype; missing and unseen values become -1."""
+
+    def _encode(self, codes, series):
+        return pd.Series(codes, index=series.index, name=series.name)
+
+
+class FrequencyEncoder(CategoricalEncoder):
+    """
+    Frequency encoding computed from category code counts with `np.bincount`.
+    Missing values are counted as their own category; unseen categories get
+    `unknown_value` (0.0 by default, i.e. never observed).
+    """
+
+    def __init__(self, handle_unknown="ignore", unknown_value=0.0):
+        super().__init__(handle_unknown)
+        self.unknown_value = unknown_value
+        self.frequencies = None
+        self.missing_frequency = 0.0
+        self.counts = None
+        self.total = 0
+        self.missing_count = 0
+
+    def _fit_codes(self, series):
+        codes = super()._fit_codes(series)
+        self.counts = np.zeros(len(self.categories), dtype=np.int64)
+        self.total = self.missing_count = 0
+        self._count(codes)
+        return codes
+
+    def _partial_fit_codes(self, series):
+        if self.categories is None:
+            return self._fit_codes(series)
+        codes = super()._partial_fit_codes(series)
+        self._count(codes)
+        return codes
+
+    def _count(self, codes):
+        """Add a batch's codes to the running counts and refresh the frequencies."""
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.categories))
+        self.counts = np.append(self.counts, np.zeros(len(counts) - len(self.counts), dtype=np.int64)) + counts
+        self.total += len(codes)
+        self.missing_count += int((codes == -1).sum())
+        self.frequencies = self.counts / self.total if self.total else self.counts.astype("float64")
+        self.missing_frequency = self.missing_count / self.total if self.total else 0.0
+
+    def _encode(self, codes, series):
+        lookup = np.append(self.frequencies, self.unknown_value)
+        values = lookup[codes]
+        values[series.isna().to_numpy()] = self.missing_frequency
+        return pd.Series(values, index=series.index, name=series.name)
+
+
+class OneHotEncoder(CategoricalEncoder):
+    """
+    One-hot encoding from category codes.
+    sparse: False for a dense boolean DataFrame (like pd.get_dummies), True for a
+            DataFrame of SparseDtype columns, or 'csr' for a scipy CSR matrix.
+            Sparse outputs require scipy.
+    Missing and unseen values produce an all-zero row.
+    """
+
+    def __init__(self, handle_unknown="ignore", sparse=False):
+        super().__init__(handle_unknown)
+        valid = [False, True, "csr"]
+        if sparse not in valid:
+            raise ValueError(f"Invalid sparse option '{sparse}'. Valid are: {valid}.")
+        self.sparse = sparse
+
+    def feature_names(self, prefix):
+        return [f"{prefix}_{category}" for category in self.categories]
+
+    def to_csr(self, series):
+        """Encode `series` as a scipy CSR matrix of shape (rows, categories)."""
+        return self._csr(self.codes(series))
+
+    def _csr(self, codes):
+        try:
+            from scipy import sparse
+        except ImportError:
+            raise ImportError("Sparse one-hot encoding requires scipy. Install it with 'pip install scipy'.")
+        codes = codes.astype(np.int64)
+        rows = np.flatnonzero(codes >= 0)
+        data = np.ones(len(rows), dtype=np.uint8)
+        return sparse.csr_matrix((data, (rows, codes[rows])), shape=(len(codes), len(self.categories)))
+
+    def _encode(self, codes, series):
+        prefix = series.name
+        if self.sparse == "csr":
+            return self._csr(codes)
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(self._csr(codes), index=series.index,
+                                                     columns=self.feature_names(prefix))
+        dense = np.zeros((len(codes), len(self.categories)), dtype=bool)
+        rows = np.flatnonzero(codes >= 0)
+        dense[rows, codes[rows]] = True
+        return pd.DataFrame(dense, index=series.index, columns=self.feature_names(prefix))
+
+
+ENCODERS = {"label": LabelEncoder, "onehot": OneHotEncoder, "frequency": FrequencyEncoder}
@@ -0,0 +1,172 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .backends import SharedBlock, column_groups, combine_moments, moments_task, partitions, run_on_block
+
+
+def compute_fill_values(frame, strategy):
+    """
+    Fill value per column for 'mean', 'median' or 'mode' imputation.
+    Only columns that contain nulls are reduced, all in a single call.
+    Mean and median cover every numeric dtype (int32, float32, Int64, ...).
+    """
+    targets = frame.loc[:, frame.isna().any().to_numpy()]
+    if strategy == "mode":
+        return multi_column_mode(targets)
+    numeric = targets.select_dtypes(include="number")
+    if strategy == "mean":
+        return numeric.mean()
+    return numeric.median()
+
+
+def partitioned_fill_values(frame, strategy, backend):
+    """
+    `compute_fill_values` with a backend. Means are merged from per-partition moments and
+    medians computed per column group, both on one column-major block (shared memory for
+    processes); modes are computed per column group on sub-frames sent to the workers.
+    """
+    if not frame.columns.is_unique:
+        return compute_fill_values(frame, strategy)
+    targets = frame.loc[:, frame.isna().any().to_numpy()]
+    if strategy == "mode":
+        groups = column_groups(targets.columns, backend.workers)
+        if not groups:
+            return pd.Series(dtype="object")
+        return pd.concat(backend.map(multi_column_mode, [targets[group] for group in groups]))
+    numeric = list(targets.select_dtypes(include="number").columns)
+    if not numeric:
+        return pd.Series(dtype="float64")
+    with SharedBlock.from_frame(targets, numeric, backend) as block:
+        if strategy == "mean":
+            parts = partitions(len(targets), len(numeric), backend.workers)
+            stats = backend.map(moments_task, [(block.handle, rows, cols) for rows, cols in parts])
+            values = combine_moments(zip(parts, stats), len(numeric))[1]
+        else:
+            parts = partitions(len(targets), len(numeric), backend.workers, by="columns")
+            values = np.concatenate(backend.map(_median_task, [(block.handle, cols) for _, cols in parts]))
+    return pd.Series(values, index=numeric)
+
+
+def _column_medians(block, columns):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmedian(block[:, columns[0]:columns[1]], axis=0)
+
+
+def _median_task(task):
+    handle, columns = task
+    return run_on_block(handle, _column_medians, columns)
+
+
+def multi_column_mode(frame):
+    """
+    Most frequent non-null value per column (smallest value on ties, like Series.mode).
+    Numeric columns are handled together: one column-wise sort of a 2-D block per kind
+    (float64 for float columns, native int64/uint64 for integer columns so values above
+    2**53 stay exact), then run-length counting over the flattened result.
+    """
+    modes = pd.Series(np.nan, index=frame.columns, dtype="object")
+    dtypes = dict(zip(frame.columns, frame.dtypes))
+    blocks = {}
+    for col in frame.columns:
+        dtype = dtypes[col]
+        if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+            continue
+        if pd.api.types.is_unsigned_integer_dtype(dtype):
+            blocks.setdefault("uint64", []).append(col)
+        elif pd.api.types.is_integer_dtype(dtype):
+            blocks.setdefault("int64", []).append(col)
+        else:
+            blocks.setdefault("float64", []).append(col)
+    if blocks and frame.columns.is_unique:
+        for dtype, columns in blocks.items():
+            if dtype == "float64":
+                values = _block_modes(frame[columns].to_numpy(dtype="float64", na_value=np.nan))
+            else:
+                missing = frame[columns].isna().to_numpy()
+                values = _block_modes(frame[columns].to_numpy(dtype=dtype, na_value=0), missing)
+            modes[columns] = values
+        numeric_set = {col for columns in blocks.values() for col in columns}
+        others = [col for col in frame.columns if col not in numeric_set]
+    else:
+        others = list(frame.columns)
+    for col in others:
+        mode_val = frame[col].mode(dropna=True)
+        if not mode_val.empty:
+            modes[col] = mode_val.iloc[0]
+    return modes
+
+
+def _block_modes(block, missing=None):
+    """Mode per column of a 2-D block; NaN (float blocks) or `missing` entries are not counted."""
+    rows, ncols = block.shape
+    if rows == 0:
+        return np.full(ncols, np.nan)
+    if missing is None:
+        # Sorting puts NaN last; column-major flattening keeps each column contiguous.
+        flat = np.sort(block, axis=0).T.ravel()
+        flat_missing = np.isnan(flat)
+    else:
+        # Integer blocks have no NaN: sort on (missing, value) so missing entries come last.
+        order = np.lexsort((block, missing), axis=0)
+        flat = np.take_along_axis(block, order, axis=0).T.ravel()
+        flat_missing = np.take_along_axis(missing, order, axis=0).T.ravel()
+    starts_mask = np.ones(flat.size, dtype=bool)
+    starts_mask[1:] = (flat[1:] != flat[:-1]) | (flat_missing[1:] != flat_missing[:-1])
+    starts_mask[::rows] = True
+    starts = np.flatnonzero(starts_mask)
+    lengths = np.diff(np.append(starts, flat.size))
+    run_values = flat[starts]
+    run_columns = starts // rows
+    lengths[flat_missing[starts]] = 0
+    # Longest run per column; the earliest start breaks ties (smallest value).
+    order = np.lexsort((starts, -lengths, run_columns))
+    ordered_columns = run_columns[order]
+    best = order[np.r_[True, ordered_columns[1:] != ordered_columns[:-1]]]
+    modes = np.full(ncols, np.nan, dtype=object)
+    found = lengths[best] > 0
+    modes[run_columns[best][found]] = run_values[best][found]
+    return modes
+
+
+def apply_fill_values(frame, fill_values):
+    """
+    Fill nulls from a column -> value mapping block by block.
+    Columns sharing a NumPy float dtype are filled together with one
+    `np.where` over a 2-D block; other dtypes fall back to `fillna`.
+    Integer columns that receive a fractional fill value are upcast to float
+    first (nullable Int* to Float64), since they cannot hold the value otherwise.
+    """
+    fill_values = {col: value for col, value in fill_values.items() if col in frame.columns}
+    if not fill_values:
+        return frame
+    dtypes = dict(zip(frame.columns, frame.dtypes))
+    upcast = {}
+    for col, value in fill_values.items():
+        dtype = dtypes[col]
+        if pd.api.types.is_integer_dtype(dtype) and not float(value).is_integer():
+            upcast[col] = "Float64" if isinstance(dtype, pd.api.extensions.ExtensionDtype) else "float64"
+    if upcast:
+        frame = frame.astype(upcast)
+        dtypes.update({col: frame[col].dtype for col in upcast})
+    if not frame.columns.is_unique:
+        return frame.fillna(fill_values)
+
+    groups = {}
+    for col in fill_values:
+        groups.setdefault(dtypes[col], []).append(col)
+    pieces = []
+    for dtype, columns in groups.items():
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            block = frame[columns].to_numpy()
+            fill = np.array([fill_values[col] for col in columns], dtype=dtype)
+            block = np.where(np.isnan(block), fill, block)
+            pieces.append(pd.DataFrame(block, index=frame.index, columns=columns))
+        else:
+            pieces.append(frame[columns].fillna({col: fill_values[col] for col in columns}))
+    untouched = frame.drop(columns=list(fill_values))
+    result = pd.concat([untouched] + pieces, axis=1)[frame.columns]
+    result.columns = frame.columns
+    return result
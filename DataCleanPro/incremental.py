@@ -0,0 +1,163 @@
+import copy
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from .chunked import numeric_columns
+from .dedup import Deduplicator
+from .encoders import ENCODERS, is_categorical_column
+from .imputation import apply_fill_values
+from .profiling import Profile
+
+
+class IncrementalCleaner:
+    """
+    Clean an append-only table one delta at a time, keeping running state instead of the history.
+
+    State:
+    - a Profile of the numeric columns (counts, Welford mean/variance, min/max, KLL quantile sketch)
+    - exact value frequency tables for mode imputation
+    - label/frequency encoders whose categories only grow (`partial_fit`), so earlier codes stay valid
+    - the row fingerprints of a Deduplicator
+    - a Profile of the scaled columns after imputation, for the scaling statistics
+
+    `update(delta)` folds the new rows into the state and returns them cleaned with the
+    statistics of every row seen so far, so a run costs time proportional to the delta.
+    Rows returned earlier are not revisited. Medians are approximate (KLL sketch).
+
+    strategy: 'mean', 'median', 'mode' or None to leave missing values
+    encode: categorical columns to encode with `method` ('label' or 'frequency')
+    scale: 'normalize', 'standardize' or None
+    columns: columns to scale (default: the numeric columns of the first delta)
+    deduplicate: 'exact' or 'bloom' to drop rows seen before (in `subset`), or None
+    k: KLL sketch size for the medians
+    """
+
+    def __init__(self, strategy="mean", encode=None, method="label", scale=None, columns=None, deduplicate=None,
+                 subset=None, k=200, seed=0):
+        for name, value, valid in [("strategy", strategy, [None, "mean", "median", "mode"]),
+                                   ("method", method, ["label", "frequency"]),
+                                   ("scale", scale, [None, "normalize", "standardize"]),
+                                   ("deduplicate", deduplicate, [None, "exact", "bloom"])]:
+            if value not in valid:
+                raise ValueError(f"Invalid {name} '{value}'. Valid are: {valid}.")
+        self.strategy = strategy
+        self.scale = scale
+        self.columns = None if columns is None else list(columns)
+        self.encoders = {col: ENCODERS[method]() for col in encode or []}
+        self.deduplicator = None if deduplicate is None else Deduplicator(subset=subset, method=deduplicate)
+        self.profile = Profile(k=k, seed=seed)
+        self.scaled = Profile(k=k, seed=seed)
+        self.frequencies = {}
+        self.rows_seen = 0
+        self.rows_emitted = 0
+
+    def update(self, delta):
+        """
+        Fold newly appended rows into the state and return them cleaned.
+        The state only changes once the cleaned output is built, so a delta that
+        raises can be fixed and passed again.
+        """
+        if not isinstance(delta, pd.DataFrame):
+            raise TypeError("Input data needs to be pandas DataFrame.")
+        for col in list(self.encoders) + (self.columns or []):
+            if col not in delta.columns:
+                raise ValueError(f"Column '{col}' not found in the DataFrame.")
+        for col in self.encoders:
+            if not is_categorical_column(delta[col]):
+                raise TypeError(f"Column '{col}' is not categorical. Categorical columns only.")
+        rows = len(delta)
+        if self.deduplicator is not None:
+            mask, keys = self.deduplicator.check(delta)
+            delta = delta[~mask]
+
+        # Updated state is built on copies and committed at the end.
+        profile = self.profile.copy().update(delta[numeric_columns(delta)])
+        frequencies = dict(self.frequencies)
+        if self.strategy == "mode":
+            for col in delta.columns:
+                counts = delta[col].value_counts()
+                previous = frequencies.get(col)
+                frequencies[col] = counts if previous is None else previous.add(counts, fill_value=0)
+
+        cleaned = delta
+        if self.strategy is not None:
+            missing = delta.columns[delta.isna().any().to_numpy()]
+            fill_values = self._fill_values(profile, frequencies)
+            cleaned = apply_fill_values(delta, {col: fill_values[col] for col in missing if col in fill_values})
+        if self.encoders or self.scale is not None:
+            cleaned = cleaned.copy()
+        encoders = copy.deepcopy(self.encoders)
+        for col, encoder in encoders.items():
+            cleaned[col] = encoder.partial_fit_transform(cleaned[col])
+        columns, scaled = self.columns, self.scaled
+        if self.scale is not None:
+            cleaned, columns, scaled = self._scale(cleaned)
+
+        self.profile, self.frequencies, self.encoders = profile, frequencies, encoders
+        self.columns, self.scaled = columns, scaled
+        if self.deduplicator is not None:
+            self.deduplicator.record(mask, keys)
+        self.rows_seen += rows
+        self.rows_emitted += len(cleaned)
+        return cleaned
+
+    def fill_values(self):
+        """Current fill value per column for the strategy (means/medians of numeric columns, or modes)."""
+        return self._fill_values(self.profile, self.frequencies)
+
+    def _fill_values(self, profile, frequencies):
+        if self.strategy == "mode":
+            return {col: _mode(counts) for col, counts in frequencies.items() if len(counts)}
+        values = {}
+        for col in profile.numeric_columns():
+            column = profile[col]
+            if column.n:
+                values[col] = column.mean if self.strategy == "mean" else float(column.quantile(0.5))
+        return values
+
+    def _scale(self, cleaned):
+        """Scale `cleaned` in place; returns it with the scaled columns and the updated scaling profile."""
+        columns = self.columns
+        if columns is None:
+            columns = [col for col in numeric_columns(cleaned) if col not in self.encoders]
+        for col in columns:
+            if not pd.api.types.is_numeric_dtype(cleaned[col]):
+                raise TypeError(f"Column '{col}' is not numeric. Cannot apply {self.scale}.")
+        scaled = self.scaled.copy().update(cleaned[columns])
+        moments = scaled.moments().loc[columns]
+        if self.scale == "normalize":
+            offset, scale = moments["min"], moments["max"] - moments["min"]
+            reason = "a constant value"
+        else:
+            offset, scale = moments["mean"], moments["std"]
+            reason = "zero standard deviation"
+        for col in scale[scale == 0].index:
+            raise ValueError(f"Cannot {self.scale} column '{col}' as it has {reason}.")
+        values = cleaned[columns].to_numpy(dtype="float64", na_value=np.nan)
+        cleaned[columns] = (values - offset.to_numpy()) / scale.to_numpy()
+        return cleaned, columns, scaled
+
+    def save(self, file_path):
+        """Write the state to a file, e.g. between daily runs."""
+        with open(file_path, "wb") as handle:
+            pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_path):
+        """Read a state previously written with `save`."""
+        with open(file_path, "rb") as handle:
+            cleaner = pickle.load(handle)
+        if not isinstance(cleaner, cls):
+            raise TypeError(f"'{file_path}' does not contain an {cls.__name__}.")
+        return cleaner
+
+
+def _mode(counts):
+    """Most frequent value of a frequency table; the smallest one on ties, like Series.mode."""
+    top = counts[counts == counts.max()].index
+    try:
+        return top.sort_values()[0]
+    except TypeError:
+        return top[0]
@@ -0,0 +1,254 @@
+"""
+Per-call metrics for the public methods of DataLoader, Preprocessor, Transformation,
+Pipeline and Visualization.
+
+Nothing is wrapped until `enable()` is called, so there is no overhead while disabled.
+Each call then produces a record with wall and CPU time, rows and columns in and out,
+the nesting depth (e.g. Preprocessor steps run by Pipeline.collect) and, with
+`memory=True`, the peak traced memory of the call (tracemalloc, which slows allocation
+heavy code, so it is off by default). Records go to every sink: an object with
+`emit(record)` or a plain callable.
+"""
+import contextlib
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+_state = {"sinks": [], "memory": False, "originals": {}, "started_tracing": False}
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def _classes():
+    from .data_loader import DataLoader
+    from .pipeline import Pipeline
+    from .preprocessor import Preprocessor
+    from .transformation import Transformation
+    from .visualization import Visualization
+    return [DataLoader, Preprocessor, Transformation, Pipeline, Visualization]
+
+
+def _shape(value):
+    if isinstance(value, tuple) and value and isinstance(value[0], pd.DataFrame):
+        value = value[0]
+    if isinstance(value, pd.DataFrame):
+        return value.shape
+    return None, None
+
+
+def _input_shape(args, kwargs):
+    # Methods take their data as `self.data` or as the first DataFrame argument.
+    for value in list(args) + list(kwargs.values()):
+        data = getattr(value, "data", value)
+        if isinstance(data, pd.DataFrame):
+            return data.shape
+    return None, None
+
+
+def _wrap(owner, name, func):
+    qualified = f"{owner}.{name}"
+
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        rows_in, columns_in = _input_shape(args, kwargs)
+        memory = _state["memory"]
+        if memory:
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = {"peak": 0, "base": tracemalloc.get_traced_memory()[0] if memory else 0}
+        stack.append(frame)
+        error = None
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except BaseException as exc:
+            error = type(exc).__name__
+            result = None
+            raise
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            stack.pop()
+            record = {"timestamp": time.time(), "method": qualified, "depth": len(stack),
+                      "wall_seconds": wall, "cpu_seconds": cpu,
+                      "rows_in": rows_in, "columns_in": columns_in}
+            record["rows_out"], record["columns_out"] = _shape(result)
+            if memory:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                record["memory_peak_bytes"] = max(0, peak - frame["base"])
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+            record["error"] = error
+            _emit(record)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _emit(record):
+    for sink in _state["sinks"]:
+        if hasattr(sink, "emit"):
+            sink.emit(record)
+        else:
+            sink(record)
+
+
+def enable(sinks=None, memory=False):
+    """
+    Start recording calls to the public API.
+    sinks: list of sinks (default: LoggingSink())
+    memory: also record the peak traced memory of each call (slower)
+    """
+    with _lock:
+        _state["sinks"] = list(sinks) if sinks is not None else [LoggingSink()]
+        _state["memory"] = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _state["started_tracing"] = True
+        if _state["originals"]:
+            return
+        for cls in _classes():
+            for name, attribute in list(vars(cls).items()):
+                if name.startswith("_"):
+                    continue
+                if isinstance(attribute, staticmethod):
+                    wrapped = staticmethod(_wrap(cls.__name__, name, attribute.__func__))
+                elif isinstance(attribute, classmethod):
+                    wrapped = classmethod(_wrap(cls.__name__, name, attribute.__func__))
+                elif callable(attribute):
+                    wrapped = _wrap(cls.__name__, name, attribute)
+                else:
+                    continue
+                _state["originals"][(cls, name)] = attribute
+                setattr(cls, name, wrapped)
+
+
+def disable():
+    """Stop recording and restore the original methods."""
+    with _lock:
+        for (cls, name), attribute in _state["originals"].items():
+            setattr(cls, name, attribute)
+        _state["originals"] = {}
+        _state["sinks"] = []
+        if _state["started_tracing"]:
+            tracemalloc.stop()
+            _state["started_tracing"] = False
+        _state["memory"] = False
+
+
+def is_enabled():
+    return bool(_state["originals"])
+
+
+@contextlib.contextmanager
+def instrument(sinks=None, memory=False):
+    """Record calls made inside a `with` block."""
+    enable(sinks, memory)
+    try:
+        yield
+    finally:
+        disable()
+
+
+class LoggingSink:
+    """Log one line per call to the 'DataCleanPro' logger."""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("DataCleanPro")
+        self.level = level
+
+    def emit(self, record):
+        self.logger.log(self.level, "%s%s %.4fs wall %.4fs cpu rows %s->%s cols %s->%s%s",
+                        "  " * record["depth"], record["method"], record["wall_seconds"], record["cpu_seconds"],
+                        record["rows_in"], record["rows_out"], record["columns_in"], record["columns_out"],
+                        f" error={record['error']}" if record["error"] else "")
+
+
+class JSONLinesSink:
+    """Append each record as one JSON line to `path`."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(line)
+
+
+class OpenMetricsSink:
+    """
+    Aggregate records into per-method counters and expose them in the OpenMetrics
+    text format, via `render()` or an HTTP endpoint started with `serve(port)`.
+    """
+
+    COUNTERS = [("calls", "Calls", None), ("errors", "Calls that raised", None),
+                ("wall_seconds", "Wall time", "wall_seconds"), ("cpu_seconds", "CPU time", "cpu_seconds"),
+                ("rows_in", "Input rows", "rows_in"), ("rows_out", "Output rows", "rows_out")]
+
+    def __init__(self, prefix="datacleanpro"):
+        self.prefix = prefix
+        self.totals = {}
+        self._lock = threading.Lock()
+        self.server = None
+
+    def emit(self, record):
+        with self._lock:
+            totals = self.totals.setdefault(record["method"], {name: 0 for name, _, _ in self.COUNTERS})
+            totals["calls"] += 1
+            totals["errors"] += record["error"] is not None
+            for name, _, field in self.COUNTERS[2:]:
+                totals[name] += record[field] or 0
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name, help_text, _ in self.COUNTERS:
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"# HELP {metric} {help_text} per DataCleanPro method.")
+                for method, totals in sorted(self.totals.items()):
+                    lines.append(f'{metric}_total{{method="{method}"}} {totals[name]}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=9464, host="127.0.0.1"):
+        """Serve `render()` at http://host:port/metrics from a background thread; returns the server."""
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = sink.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.server
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
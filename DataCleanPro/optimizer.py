@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+# Signed widths only, so arithmetic on downcast columns cannot wrap below zero.
+INTEGER_DTYPES = [np.int8, np.int16, np.int32, np.int64]
+
+
+def sample_rows(frame, sample_size, seed=0):
+    """Random sample of at most `sample_size` rows (the whole frame if it is smaller)."""
+    if len(frame) <= sample_size:
+        return frame
+    return frame.sample(n=sample_size, random_state=seed)
+
+
+def category_columns(sample, max_category_ratio=0.5, min_rows=10):
+    """String columns whose distinct-value ratio in `sample` is at most `max_category_ratio`."""
+    columns = []
+    for col in sample.columns:
+        series = sample[col]
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        values = series.dropna()
+        if len(values) < min_rows:
+            continue
+        if values.nunique() / len(values) <= max_category_ratio:
+            columns.append(col)
+    return columns
+
+
+def smallest_integer_dtype(low, high):
+    """Smallest signed NumPy integer dtype holding [low, high]."""
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def optimize_dtypes(frame, sample_size=10000, max_category_ratio=0.5, float32=False, seed=0):
+    """
+    Downcast a DataFrame to compact dtypes.
+    - integers: smallest signed width holding the column's full min/max
+    - floats: float32 if `float32` is True, or if the values round-trip exactly
+      (checked on the sample first, so the full check only runs on likely candidates)
+    - strings: category when the sampled distinct-value ratio is at most `max_category_ratio`
+    Returns (optimized frame, report), where report maps each changed column to
+    (old dtype, new dtype) and holds total memory before and after in bytes.
+    """
+    before = int(frame.memory_usage(index=True, deep=True).sum())
+    sample = sample_rows(frame, sample_size, seed)
+    conversions = {}
+
+    integer_columns = [col for col, dtype in zip(frame.columns, frame.dtypes)
+                       if isinstance(dtype, np.dtype) and dtype.kind == "i"]
+    if integer_columns:
+        # One reduction over all integer columns; downcasting is only safe on the full range.
+        lows, highs = frame[integer_columns].min(), frame[integer_columns].max()
+        for col in integer_columns:
+            if len(frame) == 0:
+                continue
+            target = smallest_integer_dtype(int(lows[col]), int(highs[col]))
+            if target.itemsize < frame[col].dtype.itemsize:
+                conversions[col] = target
+
+    for col, dtype in zip(frame.columns, frame.dtypes):
+        if isinstance(dtype, np.dtype) and dtype == np.float64:
+            if float32 or (_round_trips(sample[col].to_numpy()) and _round_trips(frame[col].to_numpy())):
+                conversions[col] = np.dtype(np.float32)
+
+    for col in category_columns(sample, max_category_ratio):
+        conversions[col] = "category"
+
+    optimized = frame.astype(conversions) if conversions else frame
+    after = int(optimized.memory_usage(index=True, deep=True).sum())
+    report = {
+        "before": before,
+        "after": after,
+        "columns": {col: (str(frame[col].dtype), str(optimized[col].dtype)) for col in conversions},
+    }
+    return optimized, report
+
+
+def _round_trips(values):
+    return np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True)
+
+
+def format_report(report):
+    """One-line summary of an optimize_dtypes report."""
+    before, after = report["before"] / 1024 ** 2, report["after"] / 1024 ** 2
+    saved = 100 * (1 - report["after"] / report["before"]) if report["before"] else 0.0
+    return (f"Memory usage: {before:.2f} MB -> {after:.2f} MB ({saved:.0f}% saved, "
+            f"{len(report['columns'])} columns converted)")
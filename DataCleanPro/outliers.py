@@ -0,0 +1,107 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .backends import SharedBlock, column_groups, partitions, run_on_block
+from .chunked import streaming_moments
+from .sketches import KLLSketch
+
+
+def map_column_groups(func, columns, n_jobs=1):
+    """Apply `func` to column groups, on a thread pool when n_jobs > 1. Results keep group order."""
+    groups = column_groups(columns, n_jobs)
+    if len(groups) == 1:
+        return [func(groups[0])]
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        return list(pool.map(func, groups))
+
+
+def bounds_mask(frame, columns, lower, upper):
+    """Rows where any column falls outside [lower, upper], as one NumPy boolean mask."""
+    values = frame[columns].to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        outside = (values < np.asarray(lower, dtype="float64")) | (values > np.asarray(upper, dtype="float64"))
+    return outside.any(axis=1)
+
+
+def iqr_bounds(quartiles, threshold):
+    """Lower and upper fences from a (2, columns) array of first and third quartiles."""
+    q1, q3 = np.asarray(quartiles[0], dtype="float64"), np.asarray(quartiles[1], dtype="float64")
+    iqr = q3 - q1
+    return q1 - threshold * iqr, q3 + threshold * iqr
+
+
+def iqr_mask(frame, columns, threshold=1.5, n_jobs=1):
+    """IQR outlier mask: one `quantile([0.25, 0.75])` call and one mask per column group."""
+    def detect(group):
+        quartiles = frame[group].quantile([0.25, 0.75]).to_numpy(dtype="float64")
+        lower, upper = iqr_bounds(quartiles, threshold)
+        return bounds_mask(frame, group, lower, upper)
+    return np.logical_or.reduce(map_column_groups(detect, columns, n_jobs))
+
+
+def zscore_mask(frame, columns, zscore_threshold=3.0, n_jobs=1):
+    """Z-score outlier mask using the population standard deviation."""
+    def detect(group):
+        values = frame[group].to_numpy(dtype="float64", na_value=np.nan)
+        mean = frame[group].mean().to_numpy(dtype="float64")
+        std = frame[group].std(ddof=0).to_numpy(dtype="float64")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (np.abs((values - mean) / std) > zscore_threshold).any(axis=1)
+    return np.logical_or.reduce(map_column_groups(detect, columns, n_jobs))
+
+
+def partitioned_mask(frame, columns, backend, method="iqr", threshold=1.5, zscore_threshold=3.0):
+    """
+    Outlier mask with a backend: the columns are copied once into a column-major block
+    (shared memory for processes) and each column group's fences and mask are computed
+    in a task; the group masks are OR-ed in group order.
+    """
+    with SharedBlock.from_frame(frame, columns, backend) as block:
+        parts = partitions(len(frame), len(columns), backend.workers, by="columns")
+        limit = threshold if method == "iqr" else zscore_threshold
+        masks = backend.map(_mask_task, [(block.handle, cols, method, limit) for _, cols in parts])
+    return np.logical_or.reduce(masks)
+
+
+def _group_mask(block, columns, method, limit):
+    values = block[:, columns[0]:columns[1]]
+    with warnings.catch_warnings():
+        # All-NaN columns have NaN fences and flag no rows, as in the pandas path.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if method == "iqr":
+            lower, upper = iqr_bounds(np.nanquantile(values, [0.25, 0.75], axis=0), limit)
+            with np.errstate(invalid="ignore"):
+                return ((values < lower) | (values > upper)).any(axis=1)
+        mean, std = np.nanmean(values, axis=0), np.nanstd(values, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (np.abs((values - mean) / std) > limit).any(axis=1)
+
+
+def _mask_task(task):
+    handle, columns, method, limit = task
+    return run_on_block(handle, _group_mask, columns, method, limit)
+
+
+def streaming_bounds(chunks, columns, method="iqr", threshold=1.5, zscore_threshold=3.0, k=200):
+    """
+    Outlier fences for chunked data gathered in one streaming pass.
+    IQR uses approximate quartiles from one KLL sketch per column; z-score uses
+    exact streaming moments.
+    """
+    columns = list(columns)
+    if method == "iqr":
+        sketches = [KLLSketch(k=k, seed=i) for i in range(len(columns))]
+        for chunk in chunks:
+            values = chunk[columns].to_numpy(dtype="float64", na_value=np.nan)
+            for i, sketch in enumerate(sketches):
+                sketch.update(values[:, i])
+        quartiles = np.array([sketch.quantile([0.25, 0.75]) for sketch in sketches]).T
+        return iqr_bounds(quartiles, threshold)
+    moments = streaming_moments(chunks, columns)
+    count = moments["count"].to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = moments["std"].to_numpy() * np.sqrt((count - 1) / count)
+    mean = moments["mean"].to_numpy()
+    return mean - zscore_threshold * std, mean + zscore_threshold * std
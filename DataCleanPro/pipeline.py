@@ -0,0 +1,237 @@
+import numpy as np
+import pandas as pd
+
+from .cache import frame_fingerprint, source_fingerprint
+from .data_loader import READERS, _file_format
+from .encoders import ENCODERS, is_categorical_column
+from .imputation import multi_column_mode
+from .preprocessor import Preprocessor
+
+# Steps that only rewrite values column by column; consecutive ones are fused.
+COLUMN_STEPS = {"fill", "encode", "normalize", "standardize"}
+
+
+class Pipeline:
+    """
+    Lazily recorded cleaning steps, executed only at `collect()`.
+
+    Consecutive column-wise steps (mean/median/mode imputation, label/frequency
+    encoding, normalization, standardization) are fused into one stage that runs
+    the whole chain per column on a single working array, so each column is read
+    once and allocated once. Steps that change rows or the column set
+    (drop imputation, one-hot encoding, outlier removal, duplicate removal) end a
+    fused stage and run through Preprocessor. Each step sees the output of the
+    previous one, exactly as the eager methods would.
+    Numeric columns touched by a fused stage come back as float64.
+
+    With a DiskCache, `collect()` first looks up the result keyed on the input
+    (source file fingerprint, or a content hash of an in-memory frame) and the
+    recorded steps; a hit skips loading and cleaning, and leaves `encoders` empty.
+    """
+
+    def __init__(self, data: pd.DataFrame, cache=None):
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Input data needs to be pandas DataFrame.")
+        self.data = data
+        self.source = None
+        self.cache = cache
+        self.steps = []
+        self.encoders = {}
+
+    @classmethod
+    def from_file(cls, file_path, file_format=None, cache=None):
+        """Pipeline over a file that is only loaded at `collect()`, and not at all on a cache hit."""
+        pipeline = cls(pd.DataFrame(), cache=cache)
+        pipeline.data = None
+        pipeline.source = (file_path, _file_format(file_path, file_format))
+        return pipeline
+
+    def handle_missing_values(self, strategy="mean"):
+        valid = ["mean", "median", "mode", "drop"]
+        if strategy not in valid:
+            raise ValueError(f"Invalid strategy '{strategy}'. Valid are: {valid}.")
+        if strategy == "drop":
+            self.steps.append(("frame", "handle_missing_values", {"strategy": "drop"}))
+        else:
+            self.steps.append(("fill", strategy, {}))
+        return self
+
+    def encode_categorical(self, columns, method="label"):
+        valid = ["label", "onehot", "frequency"]
+        if method not in valid:
+            raise ValueError(f"Invalid encoding '{method}'. Valid are: {valid}.")
+        if not columns:
+            raise ValueError("No columns provided.")
+        if method == "onehot":
+            self.steps.append(("frame", "encode_categorical", {"columns": list(columns), "method": "onehot"}))
+        else:
+            self.steps.append(("encode", method, {"columns": list(columns)}))
+        return self
+
+    def handle_outliers(self, columns=None, method="iqr", threshold=1.5, zscore_threshold=3.0):
+        """Record outlier removal (the pipeline always removes; use Preprocessor to inspect outliers)."""
+        self.steps.append(("frame", "handle_outliers", {"columns": columns, "method": method, "threshold": threshold,
+                                                        "zscore_threshold": zscore_threshold, "remove": True}))
+        return self
+
+    def remove_duplicates(self, subset=None, keep="first"):
+        self.steps.append(("frame", "remove_duplicates", {"subset": subset, "keep": keep}))
+        return self
+
+    def normalize_data(self, columns=None):
+        self.steps.append(("normalize", "normalize", {"columns": None if columns is None else list(columns)}))
+        return self
+
+    def standardize_data(self, columns=None):
+        self.steps.append(("standardize", "standardize", {"columns": None if columns is None else list(columns)}))
+        return self
+
+    def plan(self):
+        """Execution plan: a list of ('fused', [steps]) and ('frame', step) stages."""
+        stages = []
+        for step in self.steps:
+            if step[0] in COLUMN_STEPS:
+                if stages and stages[-1][0] == "fused":
+                    stages[-1][1].append(step)
+                else:
+                    stages.append(("fused", [step]))
+            else:
+                stages.append(("frame", step))
+        return stages
+
+    def explain(self):
+        """Human-readable description of the execution plan."""
+        lines = []
+        for number, (kind, content) in enumerate(self.plan(), start=1):
+            if kind == "fused":
+                names = ", ".join(f"{step[0]}({step[1]})" if step[0] != step[1] else step[0] for step in content)
+                lines.append(f"{number}. fused column pass: {names}")
+            else:
+                lines.append(f"{number}. {content[1]}({content[2]})")
+        return "\n".join(lines)
+
+    def collect(self):
+        """Run the plan and return the cleaned DataFrame."""
+        if self.cache is None:
+            return self._execute(self._load())
+        if self.source is not None:
+            file_path, file_format = self.source
+            origin = {"file": source_fingerprint(file_path, self.cache.validate), "format": file_format}
+        else:
+            origin = {"frame": frame_fingerprint(self.data)}
+        key = self.cache.key([origin], "pipeline", {"steps": self.steps})
+        return self.cache.get_or_compute(key, lambda: self._execute(self._load()))
+
+    def _load(self):
+        if self.data is None:
+            file_path, file_format = self.source
+            if self.cache is not None:
+                self.data = self.cache.load(file_path, file_format)
+            else:
+                self.data = READERS[file_format](file_path)
+        return self.data
+
+    def _execute(self, data):
+        for kind, content in self.plan():
+            if kind == "fused":
+                data = self._run_fused(data, content)
+            else:
+                _, method, params = content
+                preprocessor = Preprocessor(data)
+                result = getattr(preprocessor, method)(**params)
+                self.encoders.update(preprocessor.encoders)
+                data = result
+        return data
+
+    def _column_chains(self, data, steps):
+        """Resolve which steps touch which column, tracking columns that become numeric."""
+        numeric = {col: pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                   for col, dtype in zip(data.columns, data.dtypes)}
+        chains = {col: [] for col in data.columns}
+        for kind, name, params in steps:
+            if kind == "fill":
+                targets = [col for col in data.columns if name == "mode" or numeric[col]]
+            elif kind == "encode":
+                targets = params["columns"]
+                for col in targets:
+                    if col not in chains:
+                        raise ValueError(f"Column '{col}' not found.")
+                    if numeric[col] or not is_categorical_column(data[col]):
+                        raise TypeError(f"Column '{col}' is not categorical. Categorical columns only.")
+                    numeric[col] = True
+            else:
+                targets = params["columns"]
+                if targets is None:
+                    targets = [col for col in data.columns if numeric[col]]
+                    if not targets:
+                        raise ValueError(f"No numeric columns found or specified for {name}.")
+                for col in targets:
+                    if col not in chains:
+                        raise ValueError(f"Column '{col}' not found in the DataFrame.")
+                    if not numeric[col]:
+                        raise TypeError(f"Column '{col}' is not numeric. Cannot apply {name}.")
+            for col in targets:
+                chains[col].append((kind, name))
+        return chains
+
+    def _run_fused(self, data, steps):
+        chains = self._column_chains(data, steps)
+        columns = {}
+        for col, chain in chains.items():
+            columns[col] = self._run_chain(data[col], chain) if chain else data[col]
+        return pd.DataFrame(columns, index=data.index, copy=False)
+
+    def _run_chain(self, series, chain):
+        current = series
+        owned = False  # True once `current` is our own float64 working array
+
+        def working():
+            nonlocal current, owned
+            if not owned:
+                if isinstance(current, pd.Series):
+                    current = current.to_numpy(dtype="float64", na_value=np.nan, copy=True)
+                else:
+                    current = np.array(current, dtype="float64")
+                owned = True
+            return current
+
+        for kind, name in chain:
+            if kind == "fill":
+                if isinstance(current, pd.Series) and not pd.api.types.is_numeric_dtype(current):
+                    mode_val = current.mode(dropna=True)
+                    if not mode_val.empty:
+                        current = current.fillna(mode_val.iloc[0])
+                    continue
+                has_missing = current.hasnans if isinstance(current, pd.Series) else \
+                    (current.dtype.kind == "f" and np.isnan(current).any())
+                if not has_missing:
+                    continue
+                values = working()
+                if name == "mean":
+                    fill = np.nanmean(values)
+                elif name == "median":
+                    fill = np.nanmedian(values)
+                else:
+                    fill = multi_column_mode(pd.DataFrame({0: values})).iloc[0]
+                if not pd.isna(fill):
+                    np.copyto(values, fill, where=np.isnan(values))
+            elif kind == "encode":
+                encoder = ENCODERS[name]()
+                current = encoder.fit_transform(current).to_numpy()
+                owned = current.dtype == np.float64
+                self.encoders[series.name] = encoder
+            else:
+                values = working()
+                if kind == "normalize":
+                    offset, scale = np.nanmin(values), np.nanmax(values) - np.nanmin(values)
+                    if scale == 0:
+                        raise ValueError(f"Cannot normalize column '{series.name}' as it has a constant value.")
+                else:
+                    offset, scale = np.nanmean(values), np.nanstd(values, ddof=1)
+                    if scale == 0:
+                        raise ValueError(f"Cannot standardize column '{series.name}' as it has zero standard deviation.")
+                values -= offset
+                values /= scale
+        if isinstance(current, pd.Series):
+            return current
+        return pd.Series(current, index=series.index, name=series.name)
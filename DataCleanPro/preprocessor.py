@@ -1,46 +1,138 @@
+import logging
+
 import pandas as pd
 
+from .backends import get_backend
+from .chunked import ChunkedData, numeric_columns, streaming_median, streaming_mode, streaming_moments
+from .dedup import Deduplicator
+from .encoders import ENCODERS, is_categorical_column
+from .imputation import apply_fill_values, compute_fill_values, partitioned_fill_values
+from .outliers import bounds_mask, iqr_mask, partitioned_mask, streaming_bounds, zscore_mask
+from .profiling import Profile
+from .statistics import FittedStatistics
+
+logger = logging.getLogger("DataCleanPro")
+
 class Preprocessor:
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, backend=None):
+        """
+        backend: 'serial' (default), 'thread', 'process' or a backend instance such as
+                 ProcessBackend(workers=16); spreads imputation, encoding and outlier
+                 detection on in-memory frames over cores
+        """
         self.data = data
+        self.encoders = {}
+        self.deduplicator = None
+        self.backend = get_backend(backend)
+        # Backends created here from a name (or the default) are shut down by `close`.
+        self._owns_backend = backend is None or isinstance(backend, str)
+
+    def close(self):
+        """Shut down the backend's workers if this object created the backend; instances passed in are left open."""
+        if self._owns_backend:
+            self.backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def fit(self, columns=None, categorical=None):
+        """Fit fill values and category maps once so later batches skip re-aggregation."""
+        return FittedStatistics.fit(self.data, columns=columns, categorical=categorical)
     
-    def check_missing_values(self):
-        """Print missing values per column."""
-        missing= self.data.isnull().sum()
-        if missing.empty:
-            print("No missing values found.")
+    def profile(self, columns=None, k=200, top_k=10, precision=14):
+        """Single-pass, mergeable profile of the data (see `Profile`)."""
+        return Profile.profile(self.data, columns=columns, k=k, top_k=top_k, precision=precision)
+
+    def check_missing_values(self, profile=None):
+        """Log (at INFO, to the 'DataCleanPro' logger) and return missing values per column.
+        profile: Profile to read the null counts from instead of rescanning the data"""
+        if profile is not None:
+            missing = profile.nulls
+        elif isinstance(self.data, ChunkedData):
+            missing = pd.Series(dtype="int64")
+            for chunk in self.data:
+                missing = missing.add(chunk.isnull().sum(), fill_value=0).astype("int64")
+        else:
+            missing= self.data.isnull().sum()
+        if not missing.any():
+            logger.info("No missing values found.")
         else:
-            print("Missing Values:\n", missing)
+            logger.info("Missing Values:\n%s", missing)
+        return missing
     
-    def handle_missing_values(self, strategy="mean"):
-        """Handle missing values by mean, median, mode, or drop."""
+    def handle_missing_values(self, strategy="mean", stats=None):
+        """Handle missing values by mean, median, mode, or drop.
+        stats: FittedStatistics whose fill values are used instead of recomputing them"""
         valid = ["mean", "median", "mode", "drop"]
         if strategy not in valid:
             raise ValueError(f"Invalid encoding '{strategy}'. Valid are: {valid}.")
 
-        if strategy == "mean":
-            for col in self.data.columns:
-                if self.data[col].dtype in ['int64', 'float64']:
-                    self.data[col] = self.data[col].fillna(self.data[col].mean())
-        elif strategy == "median":
-            for col in self.data.columns:
-                if self.data[col].dtype in ['int64', 'float64']:
-                    self.data[col] = self.data[col].fillna(self.data[col].median())
-        elif strategy == 'mode':
-            for col in self.data.columns:
-                mode_val = self.data[col].mode(dropna=True)
-                if not mode_val.empty:
-                    self.data[col] = self.data[col].fillna(mode_val.iloc[0])
+        if stats is not None and strategy != "drop":
+            self.data = stats.fill_missing(self.data, strategy)
+            return self.data
+
+        if isinstance(self.data, ChunkedData):
+            return self._handle_missing_values_chunked(strategy)
+
+        if strategy in ("mean", "median", "mode"):
+            if self.backend.name != "serial":
+                fill_values = partitioned_fill_values(self.data, strategy, self.backend)
+            else:
+                fill_values = compute_fill_values(self.data, strategy)
+            self.data = apply_fill_values(self.data, fill_values.dropna().to_dict())
         elif strategy == "drop":
             self.data = self.data.dropna()
        
         return self.data
 
-    def encode_categorical(self, columns, method="label", order=None):
+    def _handle_missing_values_chunked(self, strategy):
+        """Two-pass imputation over chunked data: gather fill values, then apply them lazily."""
+        if strategy == "drop":
+            self.data = self.data.map(lambda chunk: chunk.dropna())
+            return self.data
+
+        if strategy == "mode":
+            fill_values = streaming_mode(self.data, self.data.columns)
+        else:
+            columns = numeric_columns(self.data)
+            moments = streaming_moments(self.data, columns)
+            if strategy == "mean":
+                fill_values = moments["mean"]
+            else:
+                fill_values = streaming_median(self.data, columns, moments=moments)
+            fill_values = fill_values.dropna().to_dict()
+        self.data = self.data.map(lambda chunk: apply_fill_values(chunk, fill_values))
+        return self.data
+
+    def _require_frame(self, operation):
+        if isinstance(self.data, ChunkedData):
+            raise TypeError(f"'{operation}' requires an in-memory DataFrame, not chunked data.")
+
+    def encode_categorical(self, columns, method="label", order=None, stats=None, sparse=False, encoders=None,
+                           handle_unknown="ignore"):
         """Encode categorical variables with one method at a time:
-        - label: Label encoding
-        - onehot: One-hot encoding
-        - frequency: Frequency encoding"""
+        - label: Label encoding into int8/int16/int32 codes (-1 for missing or unseen)
+        - onehot: One-hot encoding (sparse=True for SparseDtype columns, 'csr' for a scipy matrix)
+        - frequency: Frequency encoding
+        sparse='csr' returns {column: CSR matrix} instead of a DataFrame and leaves self.data
+        unchanged; matrix columns follow `self.encoders[column].feature_names(column)`
+        stats: FittedStatistics whose label/frequency maps are applied as-is (label codes match
+               LabelEncoder, -1 for missing or unseen); one-hot columns follow the categories of
+               its label maps, so every batch gets the same dummy columns
+        encoders: fitted encoders per column (e.g. `self.encoders` of another Preprocessor) to reuse
+        handle_unknown: 'ignore' or 'error' for categories the encoders did not see during fit"""
+        if stats is not None and method != "onehot":
+            self.data = stats.encode(self.data, columns, method)
+            return self.data
+        if stats is not None:
+            if encoders is not None:
+                raise ValueError("Pass either stats or encoders, not both.")
+            encoders = {col: stats.encoder(col, ENCODERS["onehot"], handle_unknown=handle_unknown, sparse=sparse)
+                        for col in columns}
+        self._require_frame("encode_categorical")
         if not columns:
             raise ValueError("No columns provided.")
         valid = ["label", "onehot", "frequency"]
@@ -48,87 +140,121 @@ class Preprocessor:
             if col not in self.data.columns:
                 raise ValueError(f"Column '{col}' not found.")
            
-            if not (pd.api.types.is_object_dtype(self.data[col]) or pd.api.types.is_categorical_dtype(self.data[col])):
+            if not is_categorical_column(self.data[col]):
                 raise TypeError(f"Column '{col}' is not categorical. Categorical columns only.")
 
         if method not in valid:
             raise ValueError(f"Invalid encoding '{method}'. Valid are: {valid}.")
+        valid_sparse = [False, True, "csr"]
+        if sparse not in valid_sparse:
+            raise ValueError(f"Invalid sparse option '{sparse}'. Valid are: {valid_sparse}.")
+        if sparse and method != "onehot":
+            raise ValueError("Sparse output is only available for one-hot encoding.")
+
+        tasks = []
+        for col in columns:
+            encoder = (encoders or {}).get(col)
+            if encoder is None:
+                if method == "onehot":
+                    encoder = ENCODERS[method](handle_unknown=handle_unknown, sparse=sparse)
+                else:
+                    encoder = ENCODERS[method](handle_unknown=handle_unknown)
+                tasks.append((encoder, self.data[col], True))
+            elif isinstance(encoder, ENCODERS[method]):
+                tasks.append((encoder, self.data[col], False))
+            else:
+                raise TypeError(f"Encoder for column '{col}' is not a {ENCODERS[method].__name__}.")
+        # Columns are encoded independently; results come back in column order.
+        results = self.backend.map(_encode_column, tasks)
+        fitted = {col: encoder for col, (encoder, _) in zip(columns, results)}
+        encoded = {col: values for col, (_, values) in zip(columns, results)}
+        self.encoders.update(fitted)
 
-        if method == "label":
-            for col in columns:
-                if col in self.data.columns:
-                    categories = self.data[col].astype(str).unique()
-                    category_map = {category: index for index, category in enumerate(categories)}
-                    self.data[col] = self.data[col].map(category_map)
-
-        elif method == "onehot":
-            self.data = pd.get_dummies(self.data, columns=columns)
-
-        elif method == "frequency":
-            for col in columns:
-                if col in self.data.columns:
-                    freq = self.data[col].value_counts(dropna=False)
-                    freq_i = freq / freq.sum()
-                    self.data[col] = self.data[col].map(freq_i)
+        if method == "onehot":
+            if sparse == "csr":
+                return encoded
+            self.data = pd.concat([self.data.drop(columns=list(columns))] + list(encoded.values()), axis=1)
+        else:
+            for col, values in encoded.items():
+                self.data[col] = values
         return self.data
 
-    def handle_outliers(self, columns=None, method="iqr", threshold=1.5, zscore_threshold=3.0, remove=False, visualize=False):
+    def handle_outliers(self, columns=None, method="iqr", threshold=1.5, zscore_threshold=3.0, remove=False, visualize=False,
+                        n_jobs=1, sketch_size=200):
         """
         Detect (or remove) outliers using either IQR or Z-score method.
         method: 'iqr' or 'zscore'
         threshold: used for IQR method
         zscore_threshold: used for Z-score method
         remove: if True, remove outliers; if False, just return them
+        n_jobs: number of threads the columns are spread across (ignored with a parallel backend)
+        sketch_size: KLL sketch size for the approximate quartiles of chunked data
         """
-        if columns is None:
-            columns = self.data.select_dtypes(include=['int64', 'float64']).columns
         valid = ["iqr", "zscore"]
         if method not in valid:
             raise ValueError(f"Invalid method '{method}'. Valid are: {valid}.")
-
         if columns is None:
-            columns = self.data.select_dtypes(include=['int64', 'float64']).columns
+            columns = numeric_columns(self.data)
             if len(columns) == 0:
                 raise ValueError("No numeric columns found for outlier detection.")
-        outliers_index = set() #unique id's
-        if method == "iqr":
-            for col in columns:
-                q1 = self.data[col].quantile(0.25)
-                q3 = self.data[col].quantile(0.75)
-                iqr = q3 - q1
-                lower_bound = q1 - threshold * iqr
-                upper_bound = q3 + threshold * iqr
-                col_outliers = self.data[(self.data[col] < lower_bound) | (self.data[col] > upper_bound)].index
-                outliers_index.update(col_outliers)
-                
-        elif method == "zscore":
-            numeric_columns = self.data[columns]
-            mean = numeric_columns.mean()
-            std = numeric_columns.std(ddof=0)
-            z_score = (numeric_columns - mean) / std
-            filter = (z_score.abs() > zscore_threshold).any(axis=1)
-            col_outliers = self.data[filter].index
-            outliers_index.update(col_outliers)
-        else:
-            raise ValueError("Invalid method. Choose 'iqr' or 'zscore'.")
-        outliers_index = list(outliers_index)
-        outliers_df = self.data.loc[outliers_index]
+        columns = list(columns)
 
+        if isinstance(self.data, ChunkedData):
+            lower, upper = streaming_bounds(self.data, columns, method, threshold, zscore_threshold, k=sketch_size)
+            if remove:
+                self.data = self.data.map(lambda chunk: chunk[~bounds_mask(chunk, columns, lower, upper)])
+                return self.data
+            return self.data.map(lambda chunk: chunk[bounds_mask(chunk, columns, lower, upper)])
+
+        if self.backend.name != "serial":
+            mask = partitioned_mask(self.data, columns, self.backend, method, threshold, zscore_threshold)
+        elif method == "iqr":
+            mask = iqr_mask(self.data, columns, threshold, n_jobs)
+        else:
+            mask = zscore_mask(self.data, columns, zscore_threshold, n_jobs)
 
         if remove:
-            self.data = self.data.drop(index=outliers_index)
+            self.data = self.data[~mask]
             return self.data
         else:
-            return outliers_df
+            return self.data[mask]
 
-    def check_duplicates(self, subset=None):
-        """Check if duplicates exist without removing them."""
-        dup_count = self.data.duplicated(subset=subset).sum()
-        print(f"Number of duplicate rows: {dup_count}")
+    def check_duplicates(self, subset=None, method="exact", bits=64):
+        """Count (and log) duplicate rows without removing them.
+        Chunked data is scanned once with row fingerprints; method is 'exact' or 'bloom'."""
+        if isinstance(self.data, ChunkedData):
+            deduplicator = Deduplicator(subset=subset, method=method, bits=bits)
+            for chunk in self.data:
+                deduplicator.duplicated(chunk)
+            dup_count = deduplicator.duplicates
+        else:
+            dup_count = self.data.duplicated(subset=subset).sum()
+        logger.info("Number of duplicate rows: %d", dup_count)
         return dup_count
 
-    def remove_duplicates(self, subset=None, keep='first'):
-        """Remove duplicates"""
-        dup_count = self.check_duplicates(subset)
-        self.data = self.data.drop_duplicates(subset=subset, keep=keep)
+    def remove_duplicates(self, subset=None, keep='first', method="exact", bits=64):
+        """Remove duplicates and log how many were removed.
+        Chunked data keeps first occurrences and is deduplicated lazily in one pass;
+        `self.deduplicator` holds the counts of the latest pass, logged when it ends."""
+        if isinstance(self.data, ChunkedData):
+            if keep != "first":
+                raise ValueError("Chunked data only supports keep='first'.")
+            source = self.data
+
+            def deduplicated():
+                self.deduplicator = Deduplicator(subset=subset, method=method, bits=bits)
+                for chunk in source:
+                    yield self.deduplicator.drop_duplicates(chunk)
+                logger.info("Number of duplicate rows: %d", self.deduplicator.duplicates)
+            self.data = ChunkedData(deduplicated)
+            return self.data
+
+        duplicated = self.data.duplicated(subset=subset, keep=keep)
+        logger.info("Number of duplicate rows: %d", duplicated.sum())
+        self.data = self.data[~duplicated.to_numpy()]
         return self.data
+
+
+def _encode_column(task):
+    encoder, series, fit = task
+    return encoder, encoder.fit_transform(series) if fit else encoder.transform(series)
@@ -0,0 +1,191 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+from .chunked import ChunkedData
+from .sketches import HyperLogLog, KLLSketch, TopK
+
+
+class ColumnProfile:
+    """
+    Mergeable summary of one column.
+    Always: row count, null count and approximate distinct count (HyperLogLog).
+    Numeric columns also track min/max, mean/variance (Welford, merged with Chan's formula)
+    and a KLL sketch for approximate quantiles and histograms. All but float columns
+    keep the top-k values (counting every distinct float would dominate the pass).
+    """
+
+    def __init__(self, name, dtype, numeric, k=200, top_k=10, precision=14, seed=None):
+        self.name = name
+        self.dtype = dtype
+        self.numeric = numeric
+        self.count = 0
+        self.nulls = 0
+        self.n = 0
+        self.mean = np.nan
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.sketch = KLLSketch(k, seed) if numeric else None
+        self.distinct = HyperLogLog(precision)
+        self.top = None if dtype.startswith("float") else TopK(top_k)
+
+    def update(self, series):
+        """Fold one chunk of the column into the profile."""
+        nulls = int(series.isna().sum())
+        self.count += len(series)
+        self.nulls += nulls
+        if self.numeric:
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if len(values):
+                mean = values.mean()
+                self._combine(len(values), mean, float(((values - mean) ** 2).sum()), values.min(), values.max())
+                self.sketch.update(values)
+        self.distinct.update(series)
+        if self.top is not None:
+            self.top.update(series)
+        return self
+
+    def _combine(self, n, mean, m2, minimum, maximum):
+        if self.n == 0:
+            self.n, self.mean, self.m2 = n, mean, m2
+        else:
+            total = self.n + n
+            delta = mean - self.mean
+            self.mean += delta * n / total
+            self.m2 += m2 + delta ** 2 * self.n * n / total
+            self.n = total
+        self.min = np.fmin(self.min, minimum)
+        self.max = np.fmax(self.max, maximum)
+
+    def merge(self, other):
+        """Fold the profile of the same column from another chunk or worker into this one."""
+        self.count += other.count
+        self.nulls += other.nulls
+        if self.numeric and other.n:
+            self._combine(other.n, other.mean, other.m2, other.min, other.max)
+            self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+        if self.top is not None and other.top is not None:
+            self.top.merge(other.top)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.variance))
+
+    def quantile(self, q):
+        """Approximate quantile(s) of a numeric column."""
+        if not self.numeric:
+            raise TypeError(f"Column '{self.name}' is not numeric. Quantiles require numeric data.")
+        return self.sketch.quantile(q)
+
+    def histogram(self, bins=30):
+        """Approximate histogram (counts, bin edges) of a numeric column."""
+        if not self.numeric:
+            raise TypeError(f"Column '{self.name}' is not numeric. Histograms require numeric data.")
+        return self.sketch.histogram(bins)
+
+    def summary(self):
+        """Flat dict of the column's statistics."""
+        summary = {"dtype": self.dtype, "count": self.count, "nulls": self.nulls,
+                   "distinct": self.distinct.count()}
+        top = self.top.top(1) if self.top is not None else pd.Series(dtype="int64")
+        summary["top"] = top.index[0] if len(top) else None
+        summary["top_count"] = int(top.iloc[0]) if len(top) else 0
+        if self.numeric:
+            q25, q50, q75 = self.quantile([0.25, 0.5, 0.75]) if self.n else (np.nan,) * 3
+            summary.update({"mean": self.mean, "std": self.std, "min": self.min, "25%": q25, "50%": q50,
+                            "75%": q75, "max": self.max})
+        return summary
+
+
+class Profile:
+    """
+    Mergeable profile of a dataset: one ColumnProfile per column plus the row count.
+    Built in a single pass over a DataFrame or ChunkedData; profiles of separate
+    chunks, files or workers combine with `merge` (or `+`) into the profile of the union.
+    k: KLL sketch size (quantile rank error about 1.7 / k)
+    top_k: number of most frequent values reported per column
+    precision: HyperLogLog precision (distinct count error about 1.04 / sqrt(2 ** precision))
+    """
+
+    def __init__(self, k=200, top_k=10, precision=14, seed=None):
+        self.k = k
+        self.top_k = top_k
+        self.precision = precision
+        self.seed = seed
+        self.rows = 0
+        self.columns = {}
+
+    @classmethod
+    def profile(cls, data, columns=None, k=200, top_k=10, precision=14, seed=None):
+        """Profile a DataFrame or ChunkedData (optionally only `columns`) in one pass."""
+        profile = cls(k, top_k, precision, seed)
+        chunks = data if isinstance(data, ChunkedData) else [data]
+        for chunk in chunks:
+            if columns is not None:
+                missing = [col for col in columns if col not in chunk.columns]
+                if missing:
+                    raise ValueError(f"Column '{missing[0]}' not found in the DataFrame.")
+                chunk = chunk[list(columns)]
+            profile.update(chunk)
+        return profile
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the profile."""
+        self.rows += len(chunk)
+        for col in chunk.columns:
+            if col not in self.columns:
+                series = chunk[col]
+                numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+                self.columns[col] = ColumnProfile(col, str(series.dtype), numeric, self.k, self.top_k,
+                                                  self.precision, self.seed)
+            self.columns[col].update(chunk[col])
+        return self
+
+    def merge(self, other):
+        """Fold another profile (e.g. of another chunk or file) into this one."""
+        self.rows += other.rows
+        for col, column in other.columns.items():
+            if col in self.columns:
+                if self.columns[col].numeric != column.numeric:
+                    raise TypeError(f"Column '{col}' is numeric in one profile but not in the other.")
+                self.columns[col].merge(column)
+            else:
+                self.columns[col] = copy.deepcopy(column)
+        return self
+
+    def __add__(self, other):
+        return self.copy().merge(other)
+
+    def copy(self):
+        return copy.deepcopy(self)
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    @property
+    def nulls(self):
+        """Null count per column."""
+        return pd.Series({col: column.nulls for col, column in self.columns.items()}, dtype="int64")
+
+    def numeric_columns(self):
+        return [col for col, column in self.columns.items() if column.numeric]
+
+    def moments(self):
+        """count, mean, std, min and max per numeric column, in the layout of `streaming_moments`."""
+        rows = {col: (column.n, column.mean, column.std, column.min, column.max)
+                for col, column in self.columns.items() if column.numeric}
+        return pd.DataFrame.from_dict(rows, orient="index", columns=["count", "mean", "std", "min", "max"])
+
+    def summary(self):
+        """DataFrame with one row of statistics per column."""
+        return pd.DataFrame.from_dict({col: column.summary() for col, column in self.columns.items()},
+                                      orient="index")
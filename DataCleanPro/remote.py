@@ -0,0 +1,598 @@
+"""
+Concurrent HTTP(S) downloads for URL inputs, on asyncio streams from the standard library.
+
+`RemoteFetcher` speaks HTTP/1.1 with keep-alive over a bounded pool of connections per
+event loop, retries transient failures (connection errors, timeouts, 408/429/5xx) with
+exponential backoff, resumes interrupted bodies with byte ranges, and can keep a local
+cache of downloaded files that is revalidated with the server's ETag/Last-Modified
+(a 304 response reuses the cached copy). Every coroutine method has a blocking
+counterpart that runs on a background event loop owned by the fetcher.
+HTTP_PROXY/HTTPS_PROXY/NO_PROXY are honoured like urllib does: plain HTTP is sent to the
+proxy, HTTPS goes through a CONNECT tunnel.
+"""
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import socket
+import ssl
+import tempfile
+import threading
+import urllib.request
+import weakref
+from urllib.parse import unquote, urljoin, urlsplit
+
+REDIRECTS = {301, 302, 303, 307, 308}
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+MAX_REDIRECTS = 5
+COMPRESSED_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+_TRANSIENT = (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError)
+
+
+def url_extension(url):
+    """File extension of a URL's path, keeping the inner one of compressed files ('.csv.gz')."""
+    stem, extension = os.path.splitext(os.path.basename(urlsplit(url).path).lower())
+    if extension in COMPRESSED_EXTENSIONS:
+        extension = os.path.splitext(stem)[1] + extension
+    return extension
+
+
+class HTTPError(OSError):
+    """The server answered with an error status."""
+
+    def __init__(self, url, status, reason=""):
+        super().__init__(f"HTTP {status}{' ' + reason if reason else ''} fetching '{url}'.")
+        self.url = url
+        self.status = status
+
+
+class _Connection:
+    def __init__(self, key, reader, writer):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+
+
+class _Pool:
+    """Connections of one event loop: at most `limit` open, idle keep-alive ones reused per host."""
+
+    def __init__(self, limit, timeout):
+        self.limit = limit
+        self.timeout = timeout
+        self.slots = asyncio.Semaphore(limit)
+        self.idle = {}
+        self.open = 0
+
+    async def acquire(self, key):
+        await self.slots.acquire()
+        try:
+            connections = self.idle.get(key, [])
+            while connections:
+                connection = connections.pop()
+                if not connection.reader.at_eof():
+                    connection.reused = True
+                    return connection
+                self._close(connection)
+            if self.open >= self.limit:
+                # Every other slot is in use or idle on another host; hand one of the latter over.
+                self._close(next(connections for connections in self.idle.values() if connections).pop(0))
+            reader, writer = await asyncio.wait_for(_connect(*key), self.timeout)
+            self.open += 1
+            return _Connection(key, reader, writer)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, connection, reusable):
+        if reusable:
+            self.idle.setdefault(connection.key, []).append(connection)
+        else:
+            self._close(connection)
+        self.slots.release()
+
+    def _close(self, connection):
+        connection.writer.close()
+        self.open -= 1
+
+    def close(self):
+        for connections in self.idle.values():
+            while connections:
+                self._close(connections.pop())
+
+
+async def _connect(scheme, host, port, proxy):
+    """Streams to host:port, directly or through an HTTP proxy (host, port, Proxy-Authorization)."""
+    context = ssl.create_default_context() if scheme == "https" else None
+    if proxy is None:
+        return await asyncio.open_connection(host, port, ssl=context)
+    if context is None:
+        return await asyncio.open_connection(proxy[0], proxy[1])
+    sock = await _tunnel(host, port, proxy)
+    return await asyncio.open_connection(sock=sock, ssl=context, server_hostname=host)
+
+
+async def _tunnel(host, port, proxy):
+    """Non-blocking socket connected to host:port through a CONNECT request to the proxy."""
+    loop = asyncio.get_running_loop()
+    proxy_host, proxy_port, authorization = proxy
+    family, kind, protocol, _, address = (await loop.getaddrinfo(proxy_host, proxy_port,
+                                                                 type=socket.SOCK_STREAM))[0]
+    sock = socket.socket(family, kind, protocol)
+    sock.setblocking(False)
+    try:
+        await loop.sock_connect(sock, address)
+        authority = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        lines = [f"CONNECT {authority} HTTP/1.1", f"Host: {authority}"]
+        if authorization is not None:
+            lines.append(f"Proxy-Authorization: {authorization}")
+        await loop.sock_sendall(sock, ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        # The proxy sends nothing after its response head until the TLS handshake starts.
+        head = b""
+        while b"\r\n\r\n" not in head:
+            block = await loop.sock_recv(sock, 4096)
+            if not block:
+                raise ConnectionResetError("Proxy closed the connection before answering CONNECT.")
+            head += block
+        _, status, *reason = head.split(b"\r\n", 1)[0].decode("latin-1").split(None, 2)
+        if int(status) != 200:
+            raise HTTPError(f"{authority} through proxy {proxy_host}:{proxy_port}", int(status),
+                            reason[0].strip() if reason else "")
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _proxy(url):
+    """(host, port, Proxy-Authorization header or None) of a proxy URL such as 'http://user:pw@proxy:3128'."""
+    parts = urlsplit(url if "://" in url else "http://" + url)
+    authorization = None
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}".encode()
+        authorization = "Basic " + base64.b64encode(credentials).decode("ascii")
+    return parts.hostname, parts.port or 80, authorization
+
+
+class _Response:
+    """Status line and headers of a response whose body has not been read yet."""
+
+    def __init__(self, url, status, reason, headers, connection, pool, timeout, block_size):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._connection = connection
+        self._pool = pool
+        self._timeout = timeout
+        self._block_size = block_size
+
+    def release(self, reusable=False):
+        if self._connection is not None:
+            self._pool.release(self._connection, reusable)
+            self._connection = None
+
+    async def blocks(self):
+        """Body blocks; the connection goes back to the pool once the body is fully read."""
+        reader, timeout = self._connection.reader, self._timeout
+        framed = True
+        try:
+            if self.status in (204, 304) or self.status < 200:
+                pass
+            elif "chunked" in self.headers.get("transfer-encoding", "").lower():
+                while True:
+                    size = int((await asyncio.wait_for(reader.readline(), timeout)).split(b";")[0], 16)
+                    if size == 0:
+                        while (await asyncio.wait_for(reader.readline(), timeout)) not in (b"\r\n", b"\n", b""):
+                            pass
+                        break
+                    async for block in self._read_exactly(size):
+                        yield block
+                    await asyncio.wait_for(reader.readexactly(2), timeout)
+            elif "content-length" in self.headers:
+                async for block in self._read_exactly(int(self.headers["content-length"])):
+                    yield block
+            else:
+                framed = False
+                while True:
+                    block = await asyncio.wait_for(reader.read(self._block_size), timeout)
+                    if not block:
+                        break
+                    yield block
+        except BaseException:
+            self.release()
+            raise
+        self.release(framed and self.headers.get("connection", "").lower() != "close")
+
+    async def _read_exactly(self, size):
+        while size:
+            block = await asyncio.wait_for(self._connection.reader.read(min(size, self._block_size)), self._timeout)
+            if not block:
+                raise asyncio.IncompleteReadError(b"", size)
+            size -= len(block)
+            yield block
+
+
+async def _read_head(reader, timeout):
+    line = await asyncio.wait_for(reader.readline(), timeout)
+    if not line:
+        raise ConnectionResetError("Connection closed before a response was received.")
+    _, status, *reason = line.decode("latin-1").split(None, 2)
+    headers = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        if line in (b"\r\n", b"\n", b""):
+            return int(status), (reason[0].strip() if reason else ""), headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+class RemoteFetcher:
+    """
+    Download HTTP(S) URLs concurrently over a bounded, keep-alive connection pool.
+
+    max_connections: connections open at the same time (per event loop)
+    retries: extra attempts after a transient failure; interrupted bodies resume with a Range request
+    backoff: seconds before the first retry, doubled on every further one (or the server's Retry-After)
+    timeout: seconds allowed for connecting and for each read
+    cache_dir: if given, downloaded files are kept there and revalidated with ETag/Last-Modified
+    block_size: bytes read from the socket at a time
+    proxies: scheme -> proxy URL, plus 'no' for hosts reached directly; default: the
+             HTTP_PROXY/HTTPS_PROXY/NO_PROXY settings (`urllib.request.getproxies`); {} for none
+
+    Async API: `fetch_async`, `fetch_many_async`, `download_async`, `download_many_async`
+    and the `stream_async` generator. The same names without `_async` block, except `open`,
+    which returns a file object reading the body while it downloads.
+    """
+
+    def __init__(self, max_connections=8, retries=3, backoff=0.5, timeout=30.0, cache_dir=None, block_size=1 << 16,
+                 proxies=None):
+        if not isinstance(max_connections, int) or max_connections <= 0:
+            raise ValueError("max_connections must be a positive integer.")
+        if not isinstance(retries, int) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.block_size = block_size
+        self.proxies = urllib.request.getproxies() if proxies is None else dict(proxies)
+        self.hits = 0
+        self.misses = 0
+        self._pools = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # --- HTTP ---------------------------------------------------------------------------
+
+    def _pool(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self._pools:
+            self._pools[loop] = _Pool(self.max_connections, self.timeout)
+        return self._pools[loop]
+
+    def _route(self, parts, scheme):
+        """Pool key (scheme, host, port, proxy) of a URL; proxy is None for direct connections."""
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self.proxies.get(scheme)
+        if proxy and not urllib.request.proxy_bypass_environment(parts.hostname, self.proxies):
+            return scheme, parts.hostname, port, _proxy(proxy)
+        return scheme, parts.hostname, port, None
+
+    async def _open(self, url, headers):
+        """Send a GET for `url`, following redirects, and return the response before its body."""
+        pool = self._pool()
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            key = self._route(parts, scheme)
+            host = parts.netloc.rpartition("@")[2]
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            proxy = key[3] if scheme == "http" else None
+            if proxy is not None:
+                # Plain HTTP through a proxy: absolute-form target, credentials for the proxy.
+                target = f"http://{host}{target}"
+            lines = [f"GET {target} HTTP/1.1", f"Host: {host}", "User-Agent: DataCleanPro",
+                     "Accept-Encoding: identity"]
+            if proxy is not None and proxy[2] is not None:
+                lines.append(f"Proxy-Authorization: {proxy[2]}")
+            lines += [f"{name}: {value}" for name, value in headers.items()]
+            request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+            while True:
+                connection = await pool.acquire(key)
+                try:
+                    connection.writer.write(request)
+                    await connection.writer.drain()
+                    status, reason, response_headers = await _read_head(connection.reader, self.timeout)
+                    break
+                except _TRANSIENT:
+                    pool.release(connection, False)
+                    if not connection.reused:
+                        raise
+                    # The server dropped an idle keep-alive connection; retry on a new one.
+                except BaseException:
+                    pool.release(connection, False)
+                    raise
+            response = _Response(url, status, reason, response_headers, connection, pool, self.timeout,
+                                 self.block_size)
+            if status not in REDIRECTS or "location" not in response_headers:
+                return response
+            response.release()
+            url = urljoin(url, response_headers["location"])
+        raise OSError(f"Too many redirects fetching '{url}'.")
+
+    async def _stream(self, url, headers=None, byte_range=None, info=None):
+        """
+        Body blocks of `url`, retrying transient failures. After an interruption the rest is
+        requested with a Range header (validated with If-Range); servers that ignore ranges
+        resend the whole body and the part already received is skipped.
+        byte_range: (start, stop) to receive only those bytes
+        info: dict filled with the status and headers of the first response
+        """
+        offset, stop = byte_range or (0, None)
+        received, attempt, validator = 0, 0, None
+        while True:
+            start = offset + received
+            request_headers = dict(headers or {})
+            if start or stop is not None:
+                request_headers["Range"] = f"bytes={start}-{'' if stop is None else stop - 1}"
+                if validator is not None:
+                    request_headers["If-Range"] = validator
+            try:
+                response = await self._open(url, request_headers)
+                if response.status in RETRY_STATUSES and attempt < self.retries:
+                    retry_after = response.headers.get("retry-after", "")
+                    response.release()
+                    attempt += 1
+                    await asyncio.sleep(float(retry_after) if retry_after.isdigit()
+                                        else self.backoff * 2 ** (attempt - 1))
+                    continue
+                if response.status >= 400:
+                    response.release()
+                    raise HTTPError(url, response.status, response.reason)
+                if info is not None and not info:
+                    info.update(status=response.status, headers=response.headers)
+                if response.status == 304:
+                    response.release()
+                    return
+                if validator is None:
+                    etag = response.headers.get("etag", "")
+                    validator = (etag if etag and not etag.startswith("W/")
+                                 else response.headers.get("last-modified"))
+                if response.status == 206 and not response.headers.get("content-range", "").startswith(f"bytes {start}-"):
+                    response.release()
+                    raise OSError(f"Unexpected Content-Range fetching '{url}'.")
+                skip = start if response.status != 206 else 0
+                remaining = None if stop is None else stop - start
+                blocks = response.blocks()
+                try:
+                    async for block in blocks:
+                        if skip:
+                            if len(block) <= skip:
+                                skip -= len(block)
+                                continue
+                            block, skip = block[skip:], 0
+                        if remaining is not None:
+                            block = block[:remaining]
+                            remaining -= len(block)
+                        if block:
+                            received += len(block)
+                            yield block
+                        if remaining == 0:
+                            break
+                finally:
+                    await blocks.aclose()
+                return
+            except HTTPError:
+                raise
+            except _TRANSIENT:
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+    # --- async API ----------------------------------------------------------------------
+
+    async def stream_async(self, url, byte_range=None):
+        """Async generator of the body's blocks as they arrive; byte_range=(start, stop) limits it to those bytes."""
+        async for block in self._stream(url, byte_range=byte_range):
+            yield block
+
+    async def fetch_async(self, url, byte_range=None):
+        """Body of `url` as bytes (through the cache, if any, unless a byte_range is given)."""
+        if self.cache_dir is not None and byte_range is None:
+            path = await self._cached(url)
+            with open(path, "rb") as handle:
+                return handle.read()
+        return b"".join([block async for block in self._stream(url, byte_range=byte_range)])
+
+    async def download_async(self, url, file_path=None):
+        """Save the body of `url` to `file_path`, or to the cache when no path is given; returns the path."""
+        if file_path is None:
+            if self.cache_dir is None:
+                raise ValueError("Pass file_path or create the RemoteFetcher with a cache_dir.")
+            return await self._cached(url)
+        await self._save(url, file_path)
+        return file_path
+
+    async def fetch_many_async(self, urls, return_exceptions=False):
+        """Bodies of many URLs, downloaded concurrently, in the order given."""
+        return await asyncio.gather(*(self.fetch_async(url) for url in urls), return_exceptions=return_exceptions)
+
+    async def download_many_async(self, urls, directory=None, return_exceptions=False):
+        """
+        Save many URLs concurrently, into `directory` (named by URL hash, keeping the extension)
+        or the cache when it is None. Returns the local paths in the order given.
+        """
+        paths = [None if directory is None else os.path.join(directory, self._file_name(url)) for url in urls]
+        return await asyncio.gather(*(self.download_async(url, path) for url, path in zip(urls, paths)),
+                                    return_exceptions=return_exceptions)
+
+    async def aclose(self):
+        """Close the idle connections of the running event loop."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    # --- cache --------------------------------------------------------------------------
+
+    @staticmethod
+    def _file_name(url):
+        return hashlib.sha256(url.encode()).hexdigest()[:32] + url_extension(url)
+
+    async def _save(self, url, file_path, headers=None):
+        """Stream the body into `file_path` via a temporary file; returns the first response's info."""
+        info = {}
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix=".part")
+        try:
+            with os.fdopen(handle, "wb") as output:
+                async for block in self._stream(url, headers=headers, info=info):
+                    output.write(block)
+            if info["status"] == 304:
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return info
+
+    async def _cached(self, url):
+        """Path of the cached body of `url`, downloaded or revalidated as needed."""
+        body_path = os.path.join(self.cache_dir, self._file_name(url))
+        meta_path = os.path.splitext(body_path)[0] + ".json"
+        headers = {}
+        if os.path.exists(body_path) and os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as handle:
+                meta = json.load(handle)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        info = await self._save(url, body_path, headers)
+        if info["status"] == 304:
+            self.hits += 1
+            return body_path
+        self.misses += 1
+        with open(meta_path, "w", encoding="utf-8") as handle:
+            json.dump({"url": url, "etag": info["headers"].get("etag"),
+                       "last_modified": info["headers"].get("last-modified")}, handle)
+        return body_path
+
+    # --- blocking API -------------------------------------------------------------------
+
+    def _background_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="DataCleanPro-fetch", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._background_loop()).result()
+
+    def fetch(self, url, byte_range=None):
+        """Blocking `fetch_async`."""
+        return self._run(self.fetch_async(url, byte_range))
+
+    def fetch_many(self, urls, return_exceptions=False):
+        """Blocking `fetch_many_async`."""
+        return self._run(self.fetch_many_async(urls, return_exceptions))
+
+    def download(self, url, file_path=None):
+        """Blocking `download_async`."""
+        return self._run(self.download_async(url, file_path))
+
+    def download_many(self, urls, directory=None, return_exceptions=False):
+        """Blocking `download_many_async`."""
+        return self._run(self.download_many_async(urls, directory, return_exceptions))
+
+    def open(self, url, byte_range=None):
+        """Binary file object over the body of `url`, read while it downloads (e.g. straight into pd.read_csv)."""
+        return io.BufferedReader(_BodyReader(self._stream(url, byte_range=byte_range), self._background_loop()),
+                                 buffer_size=self.block_size)
+
+    def close(self):
+        """Close pooled connections and stop the background event loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join()
+            loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _BodyReader(io.RawIOBase):
+    """Readable raw file over body blocks produced on an event loop; a bounded queue gives back-pressure."""
+
+    def __init__(self, blocks, loop, max_blocks=8):
+        self._loop = loop
+        self._queue = asyncio.Queue(max_blocks)
+        self._block = memoryview(b"")
+        self._done = False
+        self._task = asyncio.run_coroutine_threadsafe(self._pump(blocks), loop)
+
+    async def _pump(self, blocks):
+        try:
+            async for block in blocks:
+                await self._queue.put(block)
+            await self._queue.put(None)
+        except Exception as error:
+            await self._queue.put(error)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._block and not self._done:
+            item = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop).result()
+            if isinstance(item, Exception):
+                self._done = True
+                raise item
+            if item is None:
+                self._done = True
+            else:
+                self._block = memoryview(item)
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._task.cancel()
+        super().close()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_fetcher():
+    """The shared RemoteFetcher DataLoader uses for URLs when none is passed."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RemoteFetcher()
+        return _default
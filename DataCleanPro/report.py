@@ -0,0 +1,270 @@
+import base64
+import html
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .correlation import Correlation, heatmap_matrix
+from .encoders import is_categorical_column
+from .summaries import (binned_kde, box_statistics, finite_values, group_codes, grouped_histograms, histogram,
+                        split_groups)
+
+FORMATS = ["png", "svg", "html"]
+
+
+class SharedSummaries:
+    """
+    Per-column summaries computed on first use and reused by every figure of a report,
+    so e.g. a distribution plot and a histogram grid bin the same column only once.
+    """
+
+    def __init__(self, data, bins=50):
+        self.data = data
+        self.bins = bins
+        self._cache = {}
+
+    def _get(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def numeric(self, column):
+        if column not in self.data.columns:
+            raise ValueError(f"Column '{column}' not found in the DataFrame.")
+        if not pd.api.types.is_numeric_dtype(self.data[column]):
+            raise TypeError(f"Column '{column}' is not numeric. Cannot plot it as a numeric column.")
+        return self._get(("values", column), lambda: finite_values(self.data[column]))
+
+    def categorical(self, column):
+        if column not in self.data.columns:
+            raise ValueError(f"Column '{column}' not found in the DataFrame.")
+        if not is_categorical_column(self.data[column]):
+            raise TypeError(f"Column '{column}' is not categorical. Cannot plot it as a categorical column.")
+        return self._get(("codes", column), lambda: group_codes(self.data[column]))
+
+    def histogram(self, column, bins):
+        return self._get(("histogram", column, bins), lambda: histogram(self.numeric(column), bins))
+
+    def kde(self, column):
+        return self._get(("kde", column), lambda: binned_kde(self.numeric(column)))
+
+    def box(self, column):
+        return self._get(("box", column), lambda: box_statistics(self.numeric(column), label=column))
+
+    def counts(self, column):
+        def compute():
+            codes, labels = self.categorical(column)
+            return labels, np.bincount(codes[codes >= 0], minlength=len(labels))
+        return self._get(("counts", column), compute)
+
+    def correlation(self):
+        def compute():
+            numeric_data = self.data.select_dtypes(include="number")
+            if numeric_data.empty:
+                raise ValueError("No numeric columns found in the DataFrame for correlation heatmap.")
+            return Correlation.compute(numeric_data).matrix()
+        return self._get(("correlation",), compute)
+
+
+def plot_payload(summaries, kind, *columns):
+    """Small, picklable data behind one figure; raises like the matching Visualization method."""
+    if kind == "distribution":
+        (column,) = columns
+        counts, edges = summaries.histogram(column, summaries.bins)
+        return {"title": f"Distribution of {column}", "xlabel": column, "counts": counts, "edges": edges,
+                "kde": summaries.kde(column), "n": len(summaries.numeric(column))}
+    if kind == "outliers":
+        (column,) = columns
+        return {"title": f"Outliers in {column}", "boxes": [summaries.box(column)]}
+    if kind == "correlation_heatmap":
+        return {"title": "Correlation Heatmap", "matrix": heatmap_matrix(summaries.correlation())}
+    if kind == "categorical_count":
+        (column,) = columns
+        labels, counts = summaries.counts(column)
+        return {"title": f"Count of Categories in {column}", "xlabel": column, "labels": labels, "counts": counts}
+    if kind == "distribution_by_category":
+        column, category = columns
+        codes, labels = summaries.categorical(category)
+        _, edges = summaries.histogram(column, summaries.bins)
+        values = summaries.data[column].to_numpy(dtype="float64", na_value=np.nan)
+        return {"title": f"Distribution of {column} by {category}", "xlabel": column, "legend": category,
+                "labels": labels, "edges": edges, "counts": grouped_histograms(values, codes, len(labels), edges)}
+    if kind == "grouped_boxplot":
+        column, category = columns
+        codes, labels = summaries.categorical(category)
+        summaries.numeric(column)
+        values = summaries.data[column].to_numpy(dtype="float64", na_value=np.nan)
+        groups = split_groups(values, codes, len(labels))
+        return {"title": f"Boxplot of {column} by {category}", "xlabel": category, "ylabel": column,
+                "boxes": [box_statistics(group, label=label) for group, label in zip(groups, labels)]}
+    if kind == "histograms":
+        numeric_columns = summaries.data.select_dtypes(include="number").columns
+        if len(numeric_columns) == 0:
+            raise ValueError("No numeric columns found in the DataFrame for histograms.")
+        return {"title": "Histograms of Numeric Columns",
+                "panels": [(col, *summaries.histogram(col, 20)) for col in numeric_columns]}
+    raise ValueError(f"Invalid plot '{kind}'. Valid are: {list(DRAWERS)}.")
+
+
+def _draw_distribution(fig, payload):
+    ax = fig.subplots()
+    ax.stairs(payload["counts"], payload["edges"], fill=True, alpha=0.5)
+    if payload["kde"] is not None:
+        grid, density = payload["kde"]
+        width = payload["edges"][1] - payload["edges"][0]
+        ax.plot(grid, density * payload["n"] * width)
+    ax.set_xlabel(payload["xlabel"])
+    ax.set_ylabel("Frequency")
+    ax.set_title(payload["title"])
+
+
+def _draw_boxes(fig, payload):
+    ax = fig.subplots()
+    ax.bxp(payload["boxes"])
+    ax.set_xlabel(payload.get("xlabel", ""))
+    ax.set_ylabel(payload.get("ylabel", ""))
+    ax.set_title(payload["title"])
+
+
+def _draw_heatmap(fig, payload):
+    matrix = payload["matrix"]
+    ax = fig.subplots()
+    image = ax.imshow(matrix.to_numpy(), cmap="coolwarm", vmin=-1, vmax=1)
+    fig.colorbar(image, ax=ax)
+    labels = [str(col) for col in matrix.columns]
+    ax.set_xticks(range(len(labels)), labels, rotation=90)
+    ax.set_yticks(range(len(labels)), labels)
+    if len(labels) <= 20:
+        for (row, col), value in np.ndenumerate(matrix.to_numpy()):
+            ax.text(col, row, f"{value:.2f}", ha="center", va="center", fontsize=8)
+    ax.set_title(payload["title"])
+
+
+def _draw_counts(fig, payload):
+    ax = fig.subplots()
+    ax.bar(payload["labels"], payload["counts"])
+    ax.set_xlabel(payload["xlabel"])
+    ax.set_ylabel("Count")
+    ax.tick_params(axis="x", rotation=45)
+    ax.set_title(payload["title"])
+
+
+def _draw_grouped_distribution(fig, payload):
+    ax = fig.subplots()
+    for counts, label in zip(payload["counts"], payload["labels"]):
+        ax.stairs(counts, payload["edges"], fill=True, alpha=0.4, label=label)
+    ax.legend(title=payload["legend"])
+    ax.set_xlabel(payload["xlabel"])
+    ax.set_ylabel("Frequency")
+    ax.set_title(payload["title"])
+
+
+def _draw_histograms(fig, payload):
+    panels = payload["panels"]
+    n_cols = int(np.ceil(np.sqrt(len(panels))))
+    n_rows = int(np.ceil(len(panels) / n_cols))
+    axes = fig.subplots(n_rows, n_cols, squeeze=False).ravel()
+    for ax, (col, counts, edges) in zip(axes, panels):
+        ax.stairs(counts, edges, fill=True)
+        ax.set_title(str(col))
+    for ax in axes[len(panels):]:
+        ax.set_visible(False)
+    fig.suptitle(payload["title"], fontsize=16)
+
+
+DRAWERS = {
+    "distribution": (_draw_distribution, (8, 6)),
+    "outliers": (_draw_boxes, (8, 6)),
+    "correlation_heatmap": (_draw_heatmap, (10, 8)),
+    "categorical_count": (_draw_counts, (8, 6)),
+    "distribution_by_category": (_draw_grouped_distribution, (8, 6)),
+    "grouped_boxplot": (_draw_boxes, (8, 6)),
+    "histograms": (_draw_histograms, (12, 10)),
+}
+
+
+def render_figure(kind, payload, file_format="png", dpi=100):
+    """Draw one figure off-screen (Agg canvas, no pyplot state) and return the encoded image bytes."""
+    from matplotlib.figure import Figure
+
+    draw, figsize = DRAWERS[kind]
+    fig = Figure(figsize=figsize, layout="constrained")
+    try:
+        draw(fig, payload)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=file_format, dpi=dpi)
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
+
+def _render_task(task):
+    return render_figure(*task)
+
+
+def default_plots(data, max_categories=50):
+    """A distribution plot per numeric column, a count plot per low-cardinality categorical column
+    and a correlation heatmap when there are at least two numeric columns."""
+    numeric = list(data.select_dtypes(include="number").columns)
+    plots = [("distribution", col) for col in numeric]
+    plots += [("categorical_count", col) for col in data.columns
+              if is_categorical_column(data[col]) and data[col].nunique() <= max_categories]
+    if len(numeric) >= 2:
+        plots.append(("correlation_heatmap",))
+    return plots
+
+
+def render_report(data, plots=None, output=None, file_format="html", workers=None, bins=50, dpi=100):
+    """
+    Render plots headlessly to image files or one self-contained HTML page.
+    plots: list of plot names or tuples (name, *columns), named like the Visualization
+           methods without 'plot_', e.g. ("grouped_boxplot", "Fare", "Embarked")
+    output: directory for 'png'/'svg' files, file path for 'html'
+            (default: 'report' for images, 'report.html' for html)
+    workers: processes drawing figures in parallel (1 draws in this process)
+    Summaries are computed once here and shared between figures; only they are sent to the workers.
+    Returns the list of written file paths.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Invalid format '{file_format}'. Valid are: {FORMATS}.")
+    if output is None:
+        output = "report.html" if file_format == "html" else "report"
+    if plots is None:
+        plots = default_plots(data)
+    plots = [(plot,) if isinstance(plot, str) else tuple(plot) for plot in plots]
+    if not plots:
+        raise ValueError("No plots requested.")
+    summaries = SharedSummaries(data, bins)
+    payloads = [plot_payload(summaries, *plot) for plot in plots]
+
+    image_format = "png" if file_format == "html" else file_format
+    tasks = [(plot[0], payload, image_format, dpi) for plot, payload in zip(plots, payloads)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        images = [_render_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            images = list(pool.map(_render_task, tasks))
+
+    if file_format == "html":
+        sections = [f"<h2>{html.escape(payload['title'])}</h2>\n"
+                    f"<img src=\"data:image/png;base64,{base64.b64encode(image).decode()}\">"
+                    for payload, image in zip(payloads, images)]
+        with open(output, "w", encoding="utf-8") as handle:
+            handle.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>DataCleanPro report</title>"
+                         "</head><body>\n<h1>DataCleanPro report</h1>\n" + "\n".join(sections) + "\n</body></html>\n")
+        return [output]
+
+    os.makedirs(output, exist_ok=True)
+    paths = []
+    for number, (plot, image) in enumerate(zip(plots, images), start=1):
+        name = "_".join(str(part) for part in plot)
+        name = "".join(char if char.isalnum() or char in "-_" else "_" for char in name)
+        path = os.path.join(output, f"{number:02d}_{name}.{file_format}")
+        with open(path, "wb") as handle:
+            handle.write(image)
+        paths.append(path)
+    return paths
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch for one numeric stream.
+    Memory stays around a few times `k` values regardless of the stream length;
+    rank error is roughly 1.7 / k. NaN values are ignored. The exact minimum and
+    maximum are tracked so the extreme quantiles are exact.
+    """
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """Add an array of values to the sketch."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch into this one."""
+        if other.count == 0:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item stays behind; the rest halve into the next level.
+                keep = items[:1] if len(items) % 2 else items[:0]
+                paired = items[len(keep):]
+                promoted = paired[self._rng.integers(2)::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                # Capacities of lower levels shrink when a level is added, so restart.
+                level = 0 if level + 2 == len(self._levels) else level + 1
+            else:
+                level += 1
+
+    def weighted_items(self):
+        """Retained items in sorted order with the number of stream values each one stands for."""
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(values), 2.0 ** level) for level, values in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def histogram(self, bins=30):
+        """Approximate histogram (counts, bin edges) of the stream, like numpy.histogram."""
+        if self.count == 0:
+            return np.zeros(bins, dtype="int64"), np.linspace(0.0, 1.0, bins + 1)
+        items, weights = self.weighted_items()
+        edges = np.linspace(self.min, self.max, bins + 1)
+        # Interpolate the sketch's CDF at the edges rather than binning its items, which
+        # would put each heavy item's whole weight into a single bin.
+        ranks = np.interp(edges, np.concatenate([[self.min], items, [self.max]]),
+                          np.concatenate([[0], np.cumsum(weights) - weights / 2, [self.count]]))
+        counts = np.diff(np.round(ranks)).astype("int64")
+        return counts, edges
+
+    def quantile(self, q):
+        """Approximate quantile(s) for q in [0, 1], with linear interpolation like pandas."""
+        scalar = np.ndim(q) == 0
+        q = np.atleast_1d(np.asarray(q, dtype="float64"))
+        if self.count == 0:
+            result = np.full(q.shape, np.nan)
+            return result[0] if scalar else result
+        items, weights = self.weighted_items()
+        # Position of each item on the 0..count-1 rank axis (centre of its weight).
+        positions = np.cumsum(weights) - (weights + 1) / 2
+        targets = q * (self.count - 1)
+        result = np.interp(targets, positions, items)
+        result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+        return result[0] if scalar else result
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch using 2 ** `precision` one-byte registers.
+    The relative standard error is about 1.04 / sqrt(2 ** precision) (0.8% at the default 14).
+    Missing values are not counted.
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Add a Series or array of values (hashed with pandas' stable object hash)."""
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return self
+        hashes = pd.util.hash_array(values.to_numpy())
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << width) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining `width` bits.
+        _, bit_length = np.frexp(remainder.astype("float64"))
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """Estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
+
+
+class TopK:
+    """
+    Mergeable most-frequent-values summary.
+    Keeps exact counts for at most `capacity` values (default 100 * k); when it
+    overflows only the largest counts are kept, so counts of rare values may be
+    dropped while frequent ones stay accurate.
+    """
+
+    def __init__(self, k=10, capacity=None):
+        self.k = k
+        self.capacity = capacity or 100 * k
+        self.counts = pd.Series(dtype="int64")
+
+    def update(self, values):
+        return self._add(pd.Series(values).value_counts(dropna=True))
+
+    def merge(self, other):
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        if len(counts):
+            counts = counts.copy()
+            counts.index = counts.index.astype(object)
+            self.counts = self.counts.add(counts, fill_value=0).astype("int64") if len(self.counts) else counts
+            if len(self.counts) > self.capacity:
+                self.counts = self.counts.nlargest(self.capacity)
+        return self
+
+    def top(self, k=None):
+        """The `k` most frequent values with their counts, most frequent first."""
+        return self.counts.sort_values(ascending=False, kind="stable").head(k or self.k)
@@ -0,0 +1,258 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from .chunked import ChunkedData, numeric_columns, streaming_median, streaming_mode, streaming_moments
+from .encoders import LabelEncoder
+from .imputation import apply_fill_values
+
+NUMERIC_STATISTICS = ["min", "max", "mean", "std", "median"]
+
+
+class FittedStatistics:
+    """
+    Per-column statistics fitted once on reference data and reused on new batches.
+    numeric: DataFrame indexed by column with min, max, mean, std (ddof=1) and median
+    modes: most frequent value per column
+    label_maps: category -> integer code per categorical column, numbered like LabelEncoder
+    frequency_maps: category -> relative frequency per categorical column
+    """
+
+    def __init__(self, numeric=None, modes=None, label_maps=None, frequency_maps=None):
+        if numeric is None:
+            numeric = pd.DataFrame(columns=NUMERIC_STATISTICS, dtype="float64")
+        self.numeric = numeric
+        self.modes = modes or {}
+        self.label_maps = label_maps or {}
+        self.frequency_maps = frequency_maps or {}
+
+    @classmethod
+    def fit(cls, data, columns=None, categorical=None):
+        """
+        Fit statistics on a DataFrame or ChunkedData.
+        columns: numeric columns to summarize (default: all numeric columns)
+        categorical: columns to build label and frequency maps for
+        """
+        if columns is None:
+            columns = numeric_columns(data)
+        columns = list(columns)
+        categorical = list(categorical or [])
+
+        if isinstance(data, ChunkedData):
+            moments = streaming_moments(data, columns)
+            numeric = moments[["min", "max", "mean", "std"]].copy()
+            numeric["median"] = streaming_median(data, columns, moments=moments)
+            modes = streaming_mode(data, data.columns)
+            label_maps, frequency_maps = cls._fit_categorical_chunked(data, categorical)
+        else:
+            for col in columns + categorical:
+                if col not in data.columns:
+                    raise ValueError(f"Column '{col}' not found in the DataFrame.")
+            numeric = data[columns].agg(NUMERIC_STATISTICS).T.astype("float64")
+            mode_rows = data.mode(dropna=True)
+            modes = {col: mode_rows[col].iloc[0] for col in data.columns
+                     if len(mode_rows) and not pd.isna(mode_rows[col].iloc[0])}
+            label_maps = {}
+            frequency_maps = {}
+            for col in categorical:
+                label_maps[col] = _label_map(LabelEncoder().fit(data[col]))
+                freq = data[col].value_counts(dropna=False)
+                frequency_maps[col] = (freq / freq.sum()).to_dict()
+        return cls(numeric[NUMERIC_STATISTICS], modes, label_maps, frequency_maps)
+
+    @classmethod
+    def from_profile(cls, profile):
+        """
+        Numeric statistics and modes from a Profile, without another pass over the data.
+        Medians and modes are approximate (KLL sketch and top-k summary); float columns get no mode.
+        """
+        rows = {}
+        for col in profile.numeric_columns():
+            column = profile[col]
+            rows[col] = [column.min, column.max, column.mean, column.std, column.quantile(0.5)]
+        numeric = pd.DataFrame.from_dict(rows, orient="index", columns=NUMERIC_STATISTICS, dtype="float64")
+        modes = {}
+        for col, column in profile.columns.items():
+            top = column.top.top(1) if column.top is not None else []
+            if len(top):
+                modes[col] = top.index[0]
+        return cls(numeric, modes)
+
+    @staticmethod
+    def _fit_categorical_chunked(data, categorical):
+        encoders = {col: LabelEncoder() for col in categorical}
+        counts = {col: None for col in categorical}
+        for chunk in data:
+            for col in categorical:
+                encoders[col].partial_fit(chunk[col])
+                current = chunk[col].value_counts(dropna=False)
+                counts[col] = current if counts[col] is None else counts[col].add(current, fill_value=0)
+        frequency_maps = {}
+        for col, freq in counts.items():
+            frequency_maps[col] = (freq / freq.sum()).to_dict() if freq is not None else {}
+        label_maps = {col: _label_map(encoder) for col, encoder in encoders.items()}
+        return label_maps, frequency_maps
+
+    def _numeric(self, columns, statistic):
+        missing = [col for col in columns if col not in self.numeric.index]
+        if missing:
+            raise ValueError(f"No fitted statistics for columns {missing}.")
+        return self.numeric.loc[columns, statistic]
+
+    def _resolve(self, columns):
+        if columns is None:
+            return list(self.numeric.index)
+        return list(columns)
+
+    @staticmethod
+    def _apply(data, func):
+        if isinstance(data, ChunkedData):
+            return data.map(func)
+        return func(data)
+
+    def fill_missing(self, data, strategy="mean"):
+        """Fill missing values with fitted means, medians or modes in a single pass."""
+        valid = ["mean", "median", "mode"]
+        if strategy not in valid:
+            raise ValueError(f"Invalid strategy '{strategy}'. Valid are: {valid}.")
+        if strategy == "mode":
+            fill_values = dict(self.modes)
+        else:
+            fill_values = self.numeric[strategy].dropna().to_dict()
+        return self._apply(data, lambda frame: apply_fill_values(frame, fill_values))
+
+    def normalize(self, data, columns=None):
+        """Min-Max scale columns with the fitted min and max."""
+        columns = self._resolve(columns)
+        low = self._numeric(columns, "min")
+        span = self._numeric(columns, "max") - low
+        constant = list(span[span == 0].index)
+        if constant:
+            raise ValueError(f"Cannot normalize columns {constant} as they have a constant value.")
+        return self._apply(data, lambda frame: self._scale(frame, columns, low, span))
+
+    def standardize(self, data, columns=None):
+        """Z-score scale columns with the fitted mean and standard deviation."""
+        columns = self._resolve(columns)
+        mean = self._numeric(columns, "mean")
+        std = self._numeric(columns, "std")
+        constant = list(std[std == 0].index)
+        if constant:
+            raise ValueError(f"Cannot standardize columns {constant} as they have zero standard deviation.")
+        return self._apply(data, lambda frame: self._scale(frame, columns, mean, std))
+
+    @staticmethod
+    def _scale(frame, columns, offset, scale):
+        result = frame.copy()
+        values = frame[columns].to_numpy(dtype="float64", na_value=np.nan)
+        scaled = (values - offset.to_numpy()) / scale.to_numpy()
+        result[columns] = pd.DataFrame(scaled, index=frame.index, columns=columns)
+        return result
+
+    def encode(self, data, columns, method="label"):
+        """
+        Encode categorical columns with fitted label or frequency maps.
+        Label codes match LabelEncoder: missing and unseen categories become -1.
+        Unseen categories become NaN with frequency maps.
+        """
+        valid = ["label", "frequency"]
+        if method not in valid:
+            raise ValueError(f"Invalid encoding '{method}'. Valid are: {valid}.")
+        maps = self.label_maps if method == "label" else self.frequency_maps
+        missing = [col for col in columns if col not in maps]
+        if missing:
+            raise ValueError(f"No fitted {method} maps for columns {missing}.")
+
+        def encode_frame(frame):
+            result = frame.copy()
+            for col in columns:
+                if method == "label":
+                    result[col] = self.encoder(col).transform(frame[col])
+                else:
+                    result[col] = frame[col].map(maps[col])
+            return result
+        return self._apply(data, encode_frame)
+
+    def encoder(self, column, encoder_class=LabelEncoder, **kwargs):
+        """
+        Fitted encoder (LabelEncoder, or e.g. OneHotEncoder) whose categories are the
+        fitted label map of `column`, in code order. kwargs go to the encoder's constructor.
+        """
+        if column not in self.label_maps:
+            raise ValueError(f"No fitted label maps for columns {[column]}.")
+        mapping = self.label_maps[column]
+        encoder = encoder_class(**kwargs)
+        encoder.categories = pd.Index(sorted(mapping, key=mapping.get))
+        return encoder
+
+    def to_dict(self):
+        """JSON-serializable representation of the statistics."""
+        return {
+            "numeric": {
+                "columns": [_to_json(col) for col in self.numeric.index],
+                **{stat: [_to_json(value) for value in self.numeric[stat]] for stat in NUMERIC_STATISTICS},
+            },
+            "modes": [[_to_json(col), _to_json(value)] for col, value in self.modes.items()],
+            "label_maps": [[_to_json(col), [[_to_json(k), v] for k, v in mapping.items()]]
+                           for col, mapping in self.label_maps.items()],
+            "frequency_maps": [[_to_json(col), [[_to_json(k), v] for k, v in mapping.items()]]
+                               for col, mapping in self.frequency_maps.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        numeric = pd.DataFrame({stat: state["numeric"][stat] for stat in NUMERIC_STATISTICS},
+                               index=state["numeric"]["columns"], dtype="float64")
+        modes = {col: _from_json(value) for col, value in state["modes"]}
+        # Missing categories were written as null; map them back to NaN keys.
+        label_maps = {col: {_from_json(k): v for k, v in mapping} for col, mapping in state["label_maps"]}
+        frequency_maps = {col: {_from_json(k): v for k, v in mapping} for col, mapping in state["frequency_maps"]}
+        return cls(numeric, modes, label_maps, frequency_maps)
+
+    def save(self, file_path):
+        """Write the statistics to a compact JSON file."""
+        with open(file_path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, file_path):
+        """Read statistics previously written with `save`."""
+        with open(file_path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+def _label_map(encoder):
+    """Category -> code map of a fitted LabelEncoder."""
+    return {category: code for code, category in enumerate(encoder.categories)}
+
+
+def _to_json(value):
+    """Convert NumPy scalars to plain Python values for JSON; timestamps and timedeltas become tagged objects."""
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    elif isinstance(value, np.timedelta64):
+        value = pd.Timedelta(value)
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return {"timestamp": value.isoformat(), "tz": None if value.tz is None else str(value.tz)}
+    if isinstance(value, pd.Timedelta):
+        return {"timedelta": value.isoformat()}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _from_json(value):
+    """Inverse of `_to_json`: restore tagged timestamps and timedeltas, and null as NaN."""
+    if value is None:
+        return np.nan
+    if isinstance(value, dict) and "timestamp" in value:
+        timestamp = pd.Timestamp(value["timestamp"])
+        return timestamp if value["tz"] is None else timestamp.tz_convert(value["tz"])
+    if isinstance(value, dict) and "timedelta" in value:
+        return pd.Timedelta(value["timedelta"])
+    return value
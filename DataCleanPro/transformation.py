@@ -1,18 +1,215 @@
+import os
+
+import numpy as np
 import pandas as pd
 
+from .backends import SharedBlock, combine_moments, get_backend, moments_task, partitions, scale_task
+from .chunked import ChunkedData, numeric_columns, streaming_moments
+from .statistics import FittedStatistics
+
+# Rows per slice when scaling a row-major block, bounding temporaries.
+BLOCK_ROWS = 65536
+
 class Transformation:
-    def __init__(self, data: pd.DataFrame):
-        if not isinstance(data, pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, backend=None):
+        """
+        backend: 'serial' (default), 'thread', 'process' or a backend instance such as
+                 ThreadBackend(workers=16); spreads the scaling of in-memory frames over cores
+        """
+        if not isinstance(data, (pd.DataFrame, ChunkedData)):
             raise TypeError("Input data needs to be pandas DataFrame.")
         self.data = data
+        self.backend = get_backend(backend)
+        # Backends created here from a name (or the default) are shut down by `close`.
+        self._owns_backend = backend is None or isinstance(backend, str)
+
+    def close(self):
+        """Shut down the backend's workers if this object created the backend; instances passed in are left open."""
+        if self._owns_backend:
+            self.backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def fit(self, columns=None):
+        """Fit per-column statistics once so later batches can be scaled without re-aggregation."""
+        return FittedStatistics.fit(self.data, columns=columns)
+
+    def _scale_chunked(self, columns, operation):
+        """Gather per-column statistics in one streaming pass, then scale chunks lazily."""
+        if columns is None:
+            columns = numeric_columns(self.data)
+        if len(columns) == 0:
+            raise ValueError(f"No numeric columns found or specified for {operation}.")
+        first = next(iter(self.data), None)
+        for col in columns:
+            if first is None or col not in first.columns:
+                raise ValueError(f"Column '{col}' not found in the DataFrame.")
+            if not pd.api.types.is_numeric_dtype(first[col]):
+                raise TypeError(f"Column '{col}' is not numeric. Cannot apply {operation}.")
+
+        moments = streaming_moments(self.data, columns)
+        if operation == "normalization":
+            offset = moments["min"]
+            scale = moments["max"] - moments["min"]
+            for col in columns:
+                if scale[col] == 0:
+                    raise ValueError(f"Cannot normalize column '{col}' as it has a constant value.")
+        else:
+            offset = moments["mean"]
+            scale = moments["std"]
+            for col in columns:
+                if scale[col] == 0:
+                    raise ValueError(f"Cannot standardize column '{col}' as it has zero standard deviation.")
+
+        columns = list(columns)
+        def apply(chunk):
+            chunk = chunk.copy()
+            chunk[columns] = (chunk[columns] - offset) / scale
+            return chunk
+        return self.data.map(apply)
+
+    def _scale_block(self, columns, operation, out, as_frame):
+        """
+        Scale `columns` into one contiguous row-major float64 block, in place.
+        out: 'array' for an in-memory ndarray, or a file path for a numpy.memmap
+             (chunked data is streamed straight into the file, so it never has to fit in RAM)
+        as_frame: return a DataFrame view over the block instead of the block itself
+        """
+        chunked = isinstance(self.data, ChunkedData)
+        if columns is None:
+            columns = numeric_columns(self.data)
+        columns = list(columns)
+        if len(columns) == 0:
+            raise ValueError(f"No numeric columns found or specified for {operation}.")
+        first = next(iter(self.data), None) if chunked else self.data
+        for col in columns:
+            if first is None or col not in first.columns:
+                raise ValueError(f"Column '{col}' not found in the DataFrame.")
+            if not pd.api.types.is_numeric_dtype(first[col]):
+                raise TypeError(f"Column '{col}' is not numeric. Cannot apply {operation}.")
 
-    def normalize_data(self, columns=None):
+        if chunked:
+            # Rows arrive chunk by chunk, so the block is row-major and scaled in row slices.
+            block, moments = self._chunks_to_block(columns, out)
+            index = pd.RangeIndex(len(block))
+        else:
+            # Column-major, so each column is one contiguous run that is filled and scaled in place.
+            shape = (len(self.data), len(columns))
+            block = np.empty(shape, order="F") if out == "array" else _open_memmap(out, "w+", shape, order="F")
+            for position, col in enumerate(columns):
+                block[:, position] = self.data[col].to_numpy(dtype="float64", na_value=np.nan)
+            moments = _column_moments(block)
+
+        if operation == "normalization":
+            offset = moments["min"].to_numpy()
+            scale = moments["max"].to_numpy() - offset
+        else:
+            offset = moments["mean"].to_numpy()
+            scale = moments["std"].to_numpy()
+        for position, col in enumerate(columns):
+            if scale[position] == 0:
+                if operation == "normalization":
+                    raise ValueError(f"Cannot normalize column '{col}' as it has a constant value.")
+                raise ValueError(f"Cannot standardize column '{col}' as it has zero standard deviation.")
+
+        if chunked:
+            for start in range(0, len(block), BLOCK_ROWS):
+                part = block[start:start + BLOCK_ROWS]
+                part -= offset
+                part /= scale
+        else:
+            for position in range(len(columns)):
+                values = block[:, position]
+                values -= offset[position]
+                values /= scale[position]
+            index = self.data.index
+        if isinstance(block, np.memmap):
+            block.flush()
+        if as_frame:
+            return pd.DataFrame(block, index=index, columns=columns, copy=False)
+        return block
+
+    def _scale_partitioned(self, columns, operation):
+        """
+        Scale a frame with the backend: columns are copied once into a column-major block
+        (shared memory for processes), moments are gathered per partition and merged in
+        partition order, then each partition is scaled in place.
+        """
+        columns = list(columns)
+        for col in columns:
+            if not pd.api.types.is_numeric_dtype(self.data[col]):
+                raise TypeError(f"Column '{col}' is not numeric. Cannot apply {operation}.")
+        with SharedBlock.from_frame(self.data, columns, self.backend) as block:
+            parts = partitions(len(self.data), len(columns), self.backend.workers)
+            stats = self.backend.map(moments_task, [(block.handle, rows, cols) for rows, cols in parts])
+            count, mean, m2, low, high = combine_moments(zip(parts, stats), len(columns))
+            if operation == "normalization":
+                offset, scale = low, high - low
+            else:
+                offset = mean
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    scale = np.sqrt(m2 / (count - 1))
+            for position, col in enumerate(columns):
+                if scale[position] == 0:
+                    if operation == "normalization":
+                        raise ValueError(f"Cannot normalize column '{col}' as it has a constant value.")
+                    raise ValueError(f"Cannot standardize column '{col}' as it has zero standard deviation.")
+            self.backend.map(scale_task, [(block.handle, rows, cols, offset, scale) for rows, cols in parts])
+            result = self.data.copy()
+            for position, col in enumerate(columns):
+                # Copied out before the shared block is released.
+                result[col] = block.array[:, position].copy()
+        return result
+
+    def _chunks_to_block(self, columns, out):
+        """Copy the chunks' columns into a block while gathering their moments, in a single pass."""
+        parts = []
+        handle = None if out == "array" else open(out, "wb")
+        n_rows = 0
+
+        def tee():
+            nonlocal n_rows
+            for chunk in self.data:
+                values = chunk[columns].to_numpy(dtype="float64", na_value=np.nan)
+                if handle is None:
+                    parts.append(values)
+                else:
+                    np.ascontiguousarray(values).tofile(handle)
+                n_rows += len(values)
+                yield chunk
+
+        try:
+            moments = streaming_moments(tee(), columns)
+        finally:
+            if handle is not None:
+                handle.close()
+        if n_rows == 0:
+            raise ValueError("No rows to scale.")
+        if handle is None:
+            return np.concatenate(parts), moments
+        return _open_memmap(out, "r+", (n_rows, len(columns))), moments
+
+    def normalize_data(self, columns=None, stats=None, out=None, as_frame=False):
         """
         Normalize selected columns using Min-Max scaling.
         If no columns are specified, all numeric columns will be used.
+        stats: FittedStatistics to apply instead of recomputing them on this data
+        out: 'array' or a file path to scale the columns on one float64 block
+             (an ndarray, or a numpy.memmap for data larger than RAM) instead of copying the frame
+        as_frame: with `out`, return a DataFrame view over the block (chunked data gets a RangeIndex)
         """
+        if stats is not None:
+            return stats.normalize(self.data, columns)
+        if out is not None:
+            return self._scale_block(columns, "normalization", out, as_frame)
+        if isinstance(self.data, ChunkedData):
+            return self._scale_chunked(columns, "normalization")
         if columns is None:
-            columns = self.data.select_dtypes(include=['int64', 'float64']).columns
+            columns = self.data.select_dtypes(include='number').columns
         else:
             for col in columns:
                 if col not in self.data.columns:
@@ -20,25 +217,38 @@ class Transformation:
 
         if len(columns) == 0:
             raise ValueError("No numeric columns found or specified for normalization.")
+        if self.backend.name != "serial":
+            return self._scale_partitioned(columns, "normalization")
         normalized_data = self.data.copy()
         for col in columns:
             if not pd.api.types.is_numeric_dtype(self.data[col]):
                 raise TypeError(f"Column '{col}' is not numeric. Cannot apply normalization.")
-            min_value = self.data[col].min()
-            max_value = self.data[col].max()
+            values = self.data[col].astype("float64")
+            min_value = values.min()
+            max_value = values.max()
             if min_value == max_value:
                 raise ValueError(f"Cannot normalize column '{col}' as it has a constant value.")
-            normalized_data[col] = (self.data[col] - min_value) / (max_value - min_value)
+            normalized_data[col] = (values - min_value) / (max_value - min_value)
         
         return normalized_data
 
-    def standardize_data(self, columns=None):
+    def standardize_data(self, columns=None, stats=None, out=None, as_frame=False):
         """
         Standardize selected columns using Z-score scaling.
         If no columns are specified, all numeric columns will be used.
+        stats: FittedStatistics to apply instead of recomputing them on this data
+        out: 'array' or a file path to scale the columns on one float64 block
+             (an ndarray, or a numpy.memmap for data larger than RAM) instead of copying the frame
+        as_frame: with `out`, return a DataFrame view over the block (chunked data gets a RangeIndex)
         """
+        if stats is not None:
+            return stats.standardize(self.data, columns)
+        if out is not None:
+            return self._scale_block(columns, "standardization", out, as_frame)
+        if isinstance(self.data, ChunkedData):
+            return self._scale_chunked(columns, "standardization")
         if columns is None:
-            columns = self.data.select_dtypes(include=['int64', 'float64']).columns
+            columns = self.data.select_dtypes(include='number').columns
         else:
             for col in columns:
                 if col not in self.data.columns:
@@ -46,14 +256,34 @@ class Transformation:
 
         if len(columns) == 0:
             raise ValueError("No numeric columns found or specified for standardization.")
+        if self.backend.name != "serial":
+            return self._scale_partitioned(columns, "standardization")
 
         standardized_data = self.data.copy()
         for col in columns:
             if not pd.api.types.is_numeric_dtype(self.data[col]):
                 raise TypeError(f"Column '{col}' is not numeric. Cannot apply standardization.")
-            mean = self.data[col].mean()
-            std = self.data[col].std()
+            values = self.data[col].astype("float64")
+            mean = values.mean()
+            std = values.std()
             if std == 0:
                 raise ValueError(f"Cannot standardize column '{col}' as it has zero standard deviation.")
-            standardized_data[col] = (self.data[col] - mean) / std
-        return standardized_data
\ No newline at end of file
+            standardized_data[col] = (values - mean) / std
+        return standardized_data
+
+def _open_memmap(path, mode, shape, order="C"):
+    return np.memmap(os.fspath(path), dtype="float64", mode=mode, shape=shape, order=order)
+
+
+def _column_moments(block):
+    """min, max, mean and std (ddof=1) of each column of a column-major block, one column at a time."""
+    rows = []
+    for position in range(block.shape[1]):
+        values = block[:, position]
+        valid = values[~np.isnan(values)]
+        if len(valid) == 0:
+            rows.append((np.nan, np.nan, np.nan, np.nan))
+            continue
+        std = valid.std(ddof=1) if len(valid) > 1 else np.nan
+        rows.append((valid.min(), valid.max(), valid.mean(), std))
+    return pd.DataFrame(rows, columns=["min", "max", "mean", "std"])
@@ -1,52 +1,111 @@
-import seaborn as sns
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from .correlation import Correlation, heatmap_matrix
+from .encoders import is_categorical_column
+from .report import render_report
+from .summaries import (binned_kde, box_statistics, finite_values, group_codes, grouped_histograms, histogram,
+                        split_groups)
+
+# matplotlib and seaborn are imported inside the plotting methods, so importing the
+# package for cleaning alone does not load them.
+
 class Visualization:
-    def __init__(self, data):
+    def __init__(self, data, aggregate="auto", max_rows=100_000, bins=50, show=True):
+        """
+        aggregate: True to bin and summarize with NumPy before plotting (histograms, box
+                   statistics, KDE on a fixed grid), so only small summaries reach matplotlib;
+                   False to pass raw rows to seaborn; 'auto' aggregates above `max_rows` rows
+        bins: number of histogram bins in aggregated plots
+        show: call plt.show() after each plot; False leaves the figure open and returns it
+        """
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Input data must be a pandas DataFrame.")
+        if aggregate not in [True, False, "auto"]:
+            raise ValueError(f"Invalid aggregate '{aggregate}'. Valid are: [True, False, 'auto'].")
         self.data = data
+        self.aggregate = aggregate
+        self.max_rows = max_rows
+        self.bins = bins
+        self.show = show
+
+    def _finish(self):
+        import matplotlib.pyplot as plt
+        if self.show:
+            plt.show()
+        return plt.gcf()
+
+    def _aggregated(self):
+        return self.aggregate is True or (self.aggregate == "auto" and len(self.data) > self.max_rows)
+
+    def _plot_binned(self, values, label=None):
+        """Draw a histogram and its grid KDE (scaled to counts) from the summaries of `values`."""
+        import matplotlib.pyplot as plt
+        counts, edges = histogram(values, self.bins)
+        line = plt.stairs(counts, edges, fill=True, alpha=0.5, label=label)
+        kde = binned_kde(values)
+        if kde is not None:
+            grid, density = kde
+            plt.plot(grid, density * len(values) * (edges[1] - edges[0]), color=line.get_facecolor())
 
     def plot_distribution(self, column):
         """Plots the distribution of a given column."""
+        import matplotlib.pyplot as plt
         if column not in self.data.columns:
             raise ValueError(f"Column '{column}' not found in the DataFrame.")
         if not pd.api.types.is_numeric_dtype(self.data[column]):
             raise TypeError(f"Column '{column}' is not numeric. Distribution plots require numeric data.")
         
-        sns.histplot(self.data[column], kde=True)
+        if self._aggregated():
+            self._plot_binned(finite_values(self.data[column]))
+        else:
+            import seaborn as sns
+            sns.histplot(self.data[column], kde=True)
         plt.title(f'Distribution of {column}')
         plt.xlabel(column)
         plt.ylabel('Frequency')
-        plt.show()
+        return self._finish()
 
     def plot_outliers(self, column):
         """Plots a boxplot to detect outliers in a given column."""
+        import matplotlib.pyplot as plt
         if column not in self.data.columns:
             raise ValueError(f"Column '{column}' not found in the DataFrame.")
         if not pd.api.types.is_numeric_dtype(self.data[column]):
             raise TypeError(f"Column '{column}' is not numeric. Boxplots require numeric data.")
         
-        sns.boxplot(x=self.data[column])
+        if self._aggregated():
+            plt.gca().bxp([box_statistics(finite_values(self.data[column]), label=column)])
+        else:
+            import seaborn as sns
+            sns.boxplot(x=self.data[column])
         plt.title(f'Outliers in {column}')
-        plt.show()
+        return self._finish()
 
-    def plot_correlation_heatmap(self):
-        """Plots a heatmap of correlations between numeric features."""
-        numeric_data = self.data.select_dtypes(include=['int64', 'float64'])
+    def plot_correlation_heatmap(self, method="pearson", cluster=None, max_size=100, annotate=None):
+        """Plots a heatmap of correlations between numeric features.
+        method: 'pearson' or 'spearman'
+        cluster: reorder columns so correlated ones sit together (default: when downsampling)
+        max_size: wider matrices are averaged over blocks of adjacent columns down to this size
+        annotate: write the values in the cells (default: up to 20 columns)"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        numeric_data = self.data.select_dtypes(include='number')
         if numeric_data.empty:
             raise ValueError("No numeric columns found in the DataFrame for correlation heatmap.")
         
-        correlation_matrix = numeric_data.corr()
+        correlation_matrix = heatmap_matrix(Correlation.compute(numeric_data, method=method).matrix(),
+                                            cluster, max_size)
+        if annotate is None:
+            annotate = len(correlation_matrix) <= 20
         plt.figure(figsize=(10, 8))
-        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', fmt=".2f")
+        sns.heatmap(correlation_matrix, annot=annotate, cmap='coolwarm', fmt=".2f", vmin=-1, vmax=1)
         plt.title('Correlation Heatmap')
-        plt.show()
+        return self._finish()
 
     # def plot_pairwise_scatter(self):
     #     """Plots pairwise scatter plots for numeric features."""
-    #     numeric_data = self.data.select_dtypes(include=['int64', 'float64'])
+    #     numeric_data = self.data.select_dtypes(include='number')
     #     if numeric_data.empty:
     #         raise ValueError("No numeric columns found in the DataFrame for pairwise scatter plots.")
         
@@ -56,55 +115,104 @@ class Visualization:
 
     def plot_categorical_count(self, column):
         """Plots the count of each category in a categorical column."""
+        import matplotlib.pyplot as plt
         if column not in self.data.columns:
             raise ValueError(f"Column '{column}' not found in the DataFrame.")
-        if not pd.api.types.is_categorical_dtype(self.data[column]) and not pd.api.types.is_object_dtype(self.data[column]):
+        if not is_categorical_column(self.data[column]):
             raise TypeError(f"Column '{column}' is not categorical. Count plots require categorical data.")
         
-        sns.countplot(x=self.data[column])
+        if self._aggregated():
+            counts = self.data[column].value_counts(sort=False)
+            plt.bar([str(label) for label in counts.index], counts.to_numpy())
+        else:
+            import seaborn as sns
+            sns.countplot(x=self.data[column])
         plt.title(f'Count of Categories in {column}')
         plt.xlabel(column)
         plt.ylabel('Count')
         plt.xticks(rotation=45)
-        plt.show()
+        return self._finish()
 
     def plot_distribution_by_category(self, column, category):
         """Plots the distribution of a numeric column grouped by a categorical column."""
+        import matplotlib.pyplot as plt
         if column not in self.data.columns or category not in self.data.columns:
             raise ValueError(f"Column '{column}' or '{category}' not found in the DataFrame.")
         if not pd.api.types.is_numeric_dtype(self.data[column]):
             raise TypeError(f"Column '{column}' is not numeric. Distribution plots require numeric data.")
-        if not pd.api.types.is_categorical_dtype(self.data[category]) and not pd.api.types.is_object_dtype(self.data[category]):
+        if not is_categorical_column(self.data[category]):
             raise TypeError(f"Column '{category}' is not categorical. Grouped distributions require categorical grouping.")
         
-        sns.FacetGrid(self.data, hue=category, height=6).map(sns.histplot, column, kde=True).add_legend()
+        if self._aggregated():
+            values = self.data[column].to_numpy(dtype="float64", na_value=np.nan)
+            codes, labels = group_codes(self.data[category])
+            _, edges = histogram(finite_values(self.data[column]), self.bins)
+            counts = grouped_histograms(values, codes, len(labels), edges)
+            plt.figure(figsize=(6, 6))
+            for group, label in enumerate(labels):
+                plt.stairs(counts[group], edges, fill=True, alpha=0.4, label=label)
+            plt.legend(title=category)
+        else:
+            import seaborn as sns
+            sns.FacetGrid(self.data, hue=category, height=6).map(sns.histplot, column, kde=True).add_legend()
         plt.title(f'Distribution of {column} by {category}')
         plt.xlabel(column)
         plt.ylabel('Frequency')
-        plt.show()
+        return self._finish()
 
     def plot_grouped_boxplot(self, numeric_column, category_column):
         """Plots a boxplot of a numeric column grouped by a categorical column."""
+        import matplotlib.pyplot as plt
         if numeric_column not in self.data.columns or category_column not in self.data.columns:
             raise ValueError(f"Column '{numeric_column}' or '{category_column}' not found in the DataFrame.")
         if not pd.api.types.is_numeric_dtype(self.data[numeric_column]):
             raise TypeError(f"Column '{numeric_column}' is not numeric. Boxplots require numeric data.")
-        if not pd.api.types.is_categorical_dtype(self.data[category_column]) and not pd.api.types.is_object_dtype(self.data[category_column]):
+        if not is_categorical_column(self.data[category_column]):
             raise TypeError(f"Column '{category_column}' is not categorical. Grouped boxplots require categorical grouping.")
         
-        sns.boxplot(x=category_column, y=numeric_column, data=self.data)
+        if self._aggregated():
+            values = self.data[numeric_column].to_numpy(dtype="float64", na_value=np.nan)
+            codes, labels = group_codes(self.data[category_column])
+            groups = split_groups(values, codes, len(labels))
+            plt.gca().bxp([box_statistics(group, label=label) for group, label in zip(groups, labels)])
+        else:
+            import seaborn as sns
+            sns.boxplot(x=category_column, y=numeric_column, data=self.data)
         plt.title(f'Boxplot of {numeric_column} by {category_column}')
         plt.xlabel(category_column)
         plt.ylabel(numeric_column)
         plt.xticks(rotation=45)
-        plt.show()
+        return self._finish()
 
     def plot_histograms(self):
         """Plots histograms for all numeric columns."""
-        numeric_columns = self.data.select_dtypes(include=['int64', 'float64']).columns
+        import matplotlib.pyplot as plt
+        numeric_columns = self.data.select_dtypes(include='number').columns
         if len(numeric_columns) == 0:
             raise ValueError("No numeric columns found in the DataFrame for histograms.")
         
-        self.data[numeric_columns].hist(figsize=(12, 10), bins=20)
+        if self._aggregated():
+            n_cols = int(np.ceil(np.sqrt(len(numeric_columns))))
+            n_rows = int(np.ceil(len(numeric_columns) / n_cols))
+            fig, axes = plt.subplots(n_rows, n_cols, figsize=(12, 10), squeeze=False)
+            for ax, col in zip(axes.ravel(), numeric_columns):
+                counts, edges = histogram(finite_values(self.data[col]), 20)
+                ax.stairs(counts, edges, fill=True)
+                ax.set_title(col)
+            for ax in axes.ravel()[len(numeric_columns):]:
+                ax.set_visible(False)
+        else:
+            self.data[numeric_columns].hist(figsize=(12, 10), bins=20)
         plt.suptitle('Histograms of Numeric Columns', fontsize=16)
-        plt.show()
+        return self._finish()
+
+    def report(self, plots=None, output=None, file_format="html", workers=None, dpi=100):
+        """
+        Render plots headlessly (Agg, no plt.show) to PNG/SVG files or one HTML report.
+        plots: e.g. ["histograms", ("distribution", "Age"), ("grouped_boxplot", "Fare", "Embarked")];
+               default: distributions, category counts and the correlation heatmap
+        output: directory for 'png'/'svg', file for 'html' (default: 'report' or 'report.html')
+        workers: processes drawing the figures in parallel (1 renders in this process)
+        The binned summaries are computed once and shared by all figures. Returns the written paths.
+        """
+        return render_report(self.data, plots, output, file_format, workers, self.bins, dpi)
@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.backends import combine_moments, partial_moments, partitions
+
+class TestBackends(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(19)
+        values = rng.normal(10, 3, size=(600, 12))
+        values[rng.random(values.shape) < 0.05] = np.nan
+        values[::50, 3] *= 20  # outliers
+        cls.data = pd.DataFrame(values, columns=[f"c{i}" for i in range(12)])
+        cls.data["count"] = rng.integers(0, 5, 600)
+        cls.data["nullable"] = pd.array(np.where(rng.random(600) < 0.1, None, rng.integers(0, 9, 600)), dtype="Int64")
+        cls.data["city"] = rng.choice(["paris", "rome", "oslo", None], 600)
+        cls.data["sex"] = rng.choice(["male", "female"], 600)
+        cls.backends = [ThreadBackend(workers=3), ThreadBackend(workers=40), ProcessBackend(workers=2)]
+
+    @classmethod
+    def tearDownClass(cls):
+        for backend in cls.backends:
+            backend.close()
+
+    def test_get_backend(self):
+        self.assertEqual(Preprocessor(self.data).backend.name, "serial")
+        self.assertEqual(Transformation(self.data, backend="thread").backend.name, "thread")
+        with self.assertRaises(ValueError):
+            Preprocessor(self.data, backend="gpu")
+        with self.assertRaises(TypeError):
+            Transformation(self.data, backend=4)
+
+    def test_close_shuts_down_owned_backends(self):
+        with Preprocessor(self.data.copy(), backend="thread") as pre:
+            pre.backend.workers = 2  # the pool only starts with more than one worker
+            pre.handle_missing_values(strategy="mean")
+            pool = pre.backend._pool
+            self.assertIsNotNone(pool)
+        self.assertIsNone(pre.backend._pool)
+        self.assertTrue(pool._shutdown)
+        with Transformation(self.data.copy(), backend="process") as transformation:
+            transformation.backend.workers = 2
+            transformation.standardize_data(columns=[f"c{i}" for i in range(12)])
+            self.assertIsNotNone(transformation.backend._pool)
+        self.assertIsNone(transformation.backend._pool)
+        shared = ThreadBackend(workers=2)
+        try:
+            with Preprocessor(self.data.copy(), backend=shared) as pre:
+                pre.handle_missing_values(strategy="mean")
+            self.assertIsNotNone(shared._pool)
+        finally:
+            shared.close()
+
+    def test_partitions_cover_block(self):
+        for n_columns, by in [(12, "columns"), (2, "rows"), (12, "rows")]:
+            parts = partitions(100, n_columns, 5, by="auto" if by == "columns" or n_columns == 2 else by)
+            covered = np.zeros((100, n_columns), dtype=int)
+            for (r0, r1), (c0, c1) in parts:
+                covered[r0:r1, c0:c1] += 1
+            self.assertTrue((covered == 1).all())
+            self.assertLessEqual(len(parts), 5)
+
+    def test_combined_moments_match_numpy(self):
+        block = np.asfortranarray(self.data.iloc[:, :12].to_numpy())
+        parts = partitions(len(block), 12, 7, by="rows")
+        count, mean, m2, low, high = combine_moments([(part, partial_moments(block, *part)) for part in parts], 12)
+        np.testing.assert_allclose(mean, np.nanmean(block, axis=0))
+        np.testing.assert_allclose(m2 / (count - 1), np.nanvar(block, axis=0, ddof=1))
+        np.testing.assert_array_equal(low, np.nanmin(block, axis=0))
+        np.testing.assert_array_equal(high, np.nanmax(block, axis=0))
+
+    def test_scaling_matches_serial(self):
+        columns = [f"c{i}" for i in range(12)] + ["count", "nullable"]
+        for backend in self.backends:
+            for method in ["normalize_data", "standardize_data"]:
+                expected = getattr(Transformation(self.data), method)(columns=columns)
+                result = getattr(Transformation(self.data, backend=backend), method)(columns=columns)
+                pd.testing.assert_frame_equal(result, expected)
+            with self.assertRaises(TypeError):
+                Transformation(self.data, backend=backend).standardize_data(columns=["city"])
+
+    def test_constant_column_raises(self):
+        data = self.data.assign(constant=1.0)
+        with self.assertRaises(ValueError):
+            Transformation(data, backend=self.backends[0]).normalize_data(columns=["c0", "constant"])
+
+    def test_missing_values_match_serial(self):
+        for backend in self.backends:
+            for strategy in ["mean", "median", "mode"]:
+                expected = Preprocessor(self.data.copy()).handle_missing_values(strategy=strategy)
+                result = Preprocessor(self.data.copy(), backend=backend).handle_missing_values(strategy=strategy)
+                pd.testing.assert_frame_equal(result, expected)
+
+    def test_encoding_matches_serial(self):
+        for backend in self.backends:
+            for method in ["label", "onehot", "frequency"]:
+                serial = Preprocessor(self.data.copy())
+                expected = serial.encode_categorical(["city", "sex"], method=method)
+                parallel = Preprocessor(self.data.copy(), backend=backend)
+                result = parallel.encode_categorical(["city", "sex"], method=method)
+                pd.testing.assert_frame_equal(result, expected)
+                self.assertEqual(list(parallel.encoders), ["city", "sex"])
+                self.assertTrue(parallel.encoders["city"].categories.equals(serial.encoders["city"].categories))
+
+    def test_outliers_match_serial(self):
+        for backend in self.backends:
+            for method in ["iqr", "zscore"]:
+                expected = Preprocessor(self.data).handle_outliers(method=method)
+                result = Preprocessor(self.data, backend=backend).handle_outliers(method=method)
+                pd.testing.assert_frame_equal(result, expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(os.path.join(self.tmp.name, "cache"))
+        rng = np.random.default_rng(11)
+        self.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 500),
+            "pclass": rng.integers(1, 4, 500),
+            "sex": pd.Categorical(rng.choice(["male", "female"], 500)),
+            "name": [f"p{i}" for i in range(500)],
+        })
+        self.data.loc[::7, "age"] = np.nan
+        self.path = os.path.join(self.tmp.name, "data.csv")
+        self.data.to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_preserves_frame(self):
+        self.cache.put("k", self.data)
+        loaded = self.cache.get("k")
+        pd.testing.assert_frame_equal(loaded, self.data)
+        loaded.loc[0, "age"] = -1.0  # copy-on-write mapping: writable, cache file untouched
+        pd.testing.assert_frame_equal(self.cache.get("k"), self.data)
+
+    def test_missing_key(self):
+        self.assertIsNone(self.cache.get("absent"))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache.put("k", self.data)
+        path = self.cache._path("k")
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        for content in [raw[:12], b"DCPCACHE" + b"\xff" * 16, b"DCPCACHE" + bytes(24) + b"junk", raw[:-4000]]:
+            with open(path, "wb") as handle:
+                handle.write(content)
+            self.assertIsNone(self.cache.get("k"))
+            self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.cache.misses, 4)
+        pd.testing.assert_frame_equal(self.cache.get_or_compute("k", lambda: self.data), self.data)
+
+    def test_load_is_cached_and_invalidated(self):
+        first = self.cache.load(self.path)
+        second = self.cache.load(self.path)
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.data.head(10).to_csv(self.path, index=False)
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 10 ** 9))
+        self.assertEqual(len(self.cache.load(self.path)), 10)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_loader_arguments_are_part_of_key(self):
+        plain = self.cache.load(self.path)
+        optimized = self.cache.load(self.path, optimize=True)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertNotEqual(plain["pclass"].dtype, optimized["pclass"].dtype)
+
+    def test_hash_validation_ignores_touch(self):
+        cache = DiskCache(os.path.join(self.tmp.name, "hashed"), validate="hash")
+        cache.load(self.path)
+        os.utime(self.path, ns=(0, 0))
+        cache.load(self.path)
+        self.assertEqual(cache.hits, 1)
+
+    def test_lru_eviction(self):
+        self.cache.put("a", self.data)
+        entry_size = self.cache.size()
+        self.cache.max_bytes = int(entry_size * 2.5)
+        self.cache.put("b", self.data)
+        os.utime(self.cache._path("a"), ns=(0, 1))
+        os.utime(self.cache._path("b"), ns=(0, 2))
+        self.cache.get("a")  # "a" becomes most recently used
+        self.cache.put("c", self.data)
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+
+    def test_invalid_validate(self):
+        with self.assertRaises(ValueError):
+            DiskCache(self.tmp.name, validate="size")
+
+    def test_pipeline_warm_run_skips_work(self):
+        def build():
+            return (Pipeline.from_file(self.path, cache=self.cache)
+                    .handle_missing_values(strategy="median")
+                    .encode_categorical(["sex"], method="label")
+                    .standardize_data(columns=["age"]))
+        cold = build()
+        expected = cold.collect()
+        warm = build()
+        result = warm.collect()
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertIsNone(warm.data)  # the source was never parsed
+        other = build().normalize_data(columns=["pclass"]).collect()
+        self.assertFalse(other["pclass"].equals(expected["pclass"]))
+
+    def test_pipeline_on_frame(self):
+        first = Pipeline(self.data, cache=self.cache).handle_missing_values().collect()
+        hits = self.cache.hits
+        second = Pipeline(self.data.copy(), cache=self.cache).handle_missing_values().collect()
+        self.assertEqual(self.cache.hits, hits + 1)
+        pd.testing.assert_frame_equal(first, second)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestChunkedData(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.data = pd.DataFrame({
+            "a": rng.normal(50, 10, 1001),
+            "b": rng.integers(0, 100, 1001).astype("float64"),
+            "c": rng.choice(["x", "y", "z"], 1001),
+        })
+        cls.data.loc[::7, "a"] = np.nan
+        cls.data.loc[::11, "b"] = np.nan
+        cls.data.loc[::13, "c"] = None
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "data.csv")
+        cls.data.to_csv(cls.path, index=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_stream_csv_chunksize(self):
+        chunks = DataLoader.stream_csv(self.path, chunksize=100)
+        sizes = [len(chunk) for chunk in chunks]
+        self.assertEqual(max(sizes), 100)
+        self.assertEqual(sum(sizes), len(self.data))
+        # Re-iterable: a second pass reads the file again.
+        self.assertEqual(len(chunks.collect()), len(self.data))
+
+    def test_stream_csv_max_bytes(self):
+        chunks = DataLoader.stream_csv(self.path, max_bytes=4096)
+        for chunk in chunks:
+            self.assertLessEqual(chunk.memory_usage(deep=True).sum(), 2 * 4096)
+        with self.assertRaises(ValueError):
+            DataLoader.stream_csv(self.path)
+
+    def test_handle_missing_values_matches_in_memory(self):
+        for strategy in ["mean", "median", "mode"]:
+            expected = Preprocessor(pd.read_csv(self.path)).handle_missing_values(strategy=strategy)
+            result = Preprocessor(DataLoader.stream_csv(self.path, chunksize=97)).handle_missing_values(strategy=strategy)
+            self.assertIsInstance(result, ChunkedData)
+            pd.testing.assert_frame_equal(result.collect(), expected)
+
+    def test_scaling_matches_in_memory(self):
+        frame = pd.read_csv(self.path)
+        chunked = Transformation(DataLoader.stream_csv(self.path, chunksize=128))
+        pd.testing.assert_frame_equal(chunked.normalize_data(columns=["a", "b"]).collect(),
+                                      Transformation(frame).normalize_data(columns=["a", "b"]))
+        pd.testing.assert_frame_equal(chunked.standardize_data().collect(),
+                                      Transformation(frame).standardize_data())
+
+    def test_unsupported_operation_on_chunks(self):
+        pre = Preprocessor(ChunkedData.from_frame(self.data, 200))
+        with self.assertRaises(TypeError):
+            pre.encode_categorical(columns=["c"])
+
+if __name__ == '__main__':
+    unittest.main()
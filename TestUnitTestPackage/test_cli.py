@@ -0,0 +1,120 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.cli import main, validate_spec
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(21)
+        self.frames = []
+        for part in range(3):
+            frame = pd.DataFrame({"age": rng.normal(40, 10, 400), "fare": rng.lognormal(2, 1, 400),
+                                  "sex": rng.choice(["male", "female"], 400)})
+            frame.loc[::6, "age"] = np.nan
+            frame.to_csv(self.path(f"part{part}.csv"), index=False)
+            self.frames.append(pd.read_csv(self.path(f"part{part}.csv")))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, *parts):
+        return os.path.join(self.tmp.name, *parts)
+
+    def run_main(self, spec, *args, name="job.json"):
+        with open(self.path(name), "w", encoding="utf-8") as handle:
+            handle.write(spec if isinstance(spec, str) else json.dumps(spec))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            status = main([self.path(name), *args])
+        return status, output.getvalue()
+
+    def spec(self, **overrides):
+        spec = {"inputs": [self.path("part*.csv")],
+                "steps": [{"handle_missing_values": {"strategy": "mean"}}, {"normalize_data": {"columns": ["age"]}}],
+                "output": {"directory": self.path("out"), "format": "csv"}}
+        spec.update(overrides)
+        return spec
+
+    def expected(self, frame):
+        filled = Preprocessor(frame.copy()).handle_missing_values(strategy="mean")
+        return Transformation(filled).normalize_data(columns=["age"])
+
+    def test_runs_steps_per_file_and_prints_timings(self):
+        status, output = self.run_main(self.spec(workers=2))
+        self.assertEqual(status, 0)
+        self.assertIn("Cleaned 3 of 3 files (1,200 rows written)", output)
+        for label in ["load", "1. handle_missing_values", "2. normalize_data", "write"]:
+            self.assertIn(label, output)
+        for part, frame in enumerate(self.frames):
+            result = pd.read_csv(self.path("out", f"part{part}.csv"))
+            pd.testing.assert_frame_equal(result, self.expected(frame))
+
+    def test_chunked_input_matches_whole_files(self):
+        status, _ = self.run_main(self.spec(chunksize=150, output={"directory": self.path("out"), "format": "ndjson"}))
+        self.assertEqual(status, 0)
+        result = pd.read_json(self.path("out", "part0.jsonl"), lines=True)
+        pd.testing.assert_frame_equal(result, self.expected(self.frames[0]))
+
+    def test_chunked_csv_header_written_once(self):
+        frame = pd.DataFrame({"x": [np.nan] * 5 + list(range(7)), "y": np.arange(12.0)})
+        frame.to_csv(self.path("in.csv"), index=False)
+        spec = self.spec(inputs=[self.path("in.csv")], chunksize=5,
+                         steps=[{"handle_missing_values": {"strategy": "drop"}}])
+        self.assertEqual(self.run_main(spec)[0], 0)
+        result = pd.read_csv(self.path("out", "in.csv"))
+        pd.testing.assert_frame_equal(result, frame.dropna().reset_index(drop=True), check_dtype=False)
+        self.assertTrue(pd.api.types.is_numeric_dtype(result["x"]))
+
+    def test_yaml_spec_and_overrides(self):
+        spec = (f"inputs: ['{self.path('part0.csv')}']\n"
+                "steps:\n  - remove_duplicates\n  - handle_outliers: {method: zscore}\n"
+                "output: {directory: unused, format: parquet}\n")
+        status, _ = self.run_main(spec, "--output-dir", self.path("yaml_out"), name="job.yaml")
+        self.assertEqual(status, 0)
+        self.assertTrue(os.path.exists(self.path("yaml_out", "part0.parquet")))
+
+    def test_failures_are_reported(self):
+        status, output = self.run_main(self.spec(inputs=[self.path("part0.csv"), self.path("missing.csv")]))
+        self.assertEqual(status, 1)
+        self.assertIn("Cleaned 1 of 2 files", output)
+        self.assertIn("FAILED", output)
+
+    def test_dry_run_and_invalid_specs(self):
+        status, output = self.run_main(self.spec(), "--dry-run")
+        self.assertEqual(status, 0)
+        self.assertEqual(len(output.splitlines()), 3)
+        self.assertFalse(os.path.exists(self.path("out")))
+        status, output = self.run_main(self.spec(steps=["impute"]))
+        self.assertEqual(status, 2)
+        self.assertIn("Invalid step 'impute'", output)
+        with self.assertRaises(ValueError):
+            validate_spec(self.spec(chunksize=100, steps=[{"encode_categorical": {"columns": ["sex"]}}]))
+        with self.assertRaises(ValueError):
+            validate_spec(self.spec(output={"directory": "out", "format": "xlsx"}))
+        with self.assertRaises(ValueError) as context:
+            validate_spec(self.spec(steps=[{"handle_missing_values": {"stratgy": "mean"}}]))
+        self.assertIn("'stratgy'", str(context.exception))
+
+    def test_colliding_outputs_are_rejected(self):
+        for name in ["a", "b"]:
+            os.makedirs(self.path(name))
+            self.frames[0].to_csv(self.path(name, "data.csv"), index=False)
+        status, output = self.run_main(self.spec(inputs=[self.path("*", "data.csv")], workers=2))
+        self.assertEqual(status, 2)
+        self.assertIn("would both be written to", output)
+        self.assertFalse(os.path.exists(self.path("out")))
+
+    def test_process_backend_shared_by_steps(self):
+        status, _ = self.run_main(self.spec(inputs=[self.path("part0.csv")], backend="process"))
+        self.assertEqual(status, 0)
+        pd.testing.assert_frame_equal(pd.read_csv(self.path("out", "part0.csv")), self.expected(self.frames[0]))
+
+if __name__ == "__main__":
+    unittest.main()
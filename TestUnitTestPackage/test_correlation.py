@@ -0,0 +1,64 @@
+import unittest
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.correlation import heatmap_matrix, top_pairs
+
+class TestCorrelation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(17)
+        cls.data = pd.DataFrame(rng.normal(size=(2000, 6)) + 1000, columns=list("abcdef"))
+        cls.data["g"] = 2 * cls.data["a"] + rng.normal(size=2000)
+        cls.data["h"] = -cls.data["b"] + 2 * rng.normal(size=2000)
+        cls.missing = cls.data.copy()
+        cls.missing.iloc[::7, 0] = np.nan
+        cls.missing.iloc[::5, 3] = np.nan
+
+    def test_pearson_matches_pandas(self):
+        for data in [self.data, self.missing]:
+            result = Correlation.compute(data).matrix()
+            pd.testing.assert_frame_equal(result, data.corr(), atol=1e-10)
+
+    def test_chunks_and_merge(self):
+        chunked = Correlation.compute(ChunkedData.from_frame(self.missing, chunksize=300)).matrix()
+        pd.testing.assert_frame_equal(chunked, self.missing.corr(), atol=1e-10)
+        mixed = pd.concat([self.data.iloc[:800], self.missing.iloc[800:]])
+        merged = Correlation.compute(self.data.iloc[:800]).merge(Correlation.compute(self.missing.iloc[800:]))
+        pd.testing.assert_frame_equal(merged.matrix(), mixed.corr(), atol=1e-10)
+
+    def test_spearman(self):
+        exact = Correlation.compute(self.data, method="spearman")
+        pd.testing.assert_frame_equal(exact.matrix(), self.data.corr(method="spearman"), atol=1e-10)
+        per_column = Correlation.compute(self.missing, method="spearman").matrix()
+        pd.testing.assert_frame_equal(per_column, self.missing.corr(method="spearman"), atol=0.01)
+        with self.assertRaises(ValueError):
+            exact.update(self.missing)
+        approximate = Correlation.compute(ChunkedData.from_frame(self.missing, chunksize=500), method="spearman")
+        pd.testing.assert_frame_equal(approximate.matrix(), self.missing.corr(method="spearman"), atol=0.01)
+
+    def test_top_pairs(self):
+        pairs = Correlation.compute(self.data).top_pairs(k=2)
+        self.assertEqual(list(zip(pairs["left"], pairs["right"])), [("a", "g"), ("b", "h")])
+        self.assertLess(pairs["correlation"].iloc[1], 0)
+        self.assertEqual(len(top_pairs(self.data.corr(), k=100)), 28)
+
+    def test_heatmap_matrix(self):
+        matrix = self.data.corr()
+        small = heatmap_matrix(matrix, cluster=True, max_size=4)
+        self.assertEqual(small.shape, (4, 4))
+        ordered = heatmap_matrix(matrix, cluster=True, max_size=100)
+        position = {col: i for i, col in enumerate(ordered.columns)}
+        self.assertEqual(abs(position["a"] - position["g"]), 1)
+
+    def test_plot_heatmap(self):
+        Visualization(self.data, show=False).plot_correlation_heatmap(max_size=4)
+        plt.close("all")
+        with self.assertRaises(ValueError):
+            Correlation.compute(self.data, method="kendall")
+
+if __name__ == '__main__':
+    unittest.main()
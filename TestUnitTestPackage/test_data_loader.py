@@ -0,0 +1,210 @@
+import glob
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestColumnarFormats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(10)
+        cls.data = pd.DataFrame({f"c{i}": rng.normal(size=5000) for i in range(20)})
+        cls.data["year"] = np.repeat(np.arange(2015, 2025), 500)
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_parquet_projection_and_filters(self):
+        DataLoader.write_parquet(self.data, self.path("data.parquet"), row_group_size=500)
+        loaded = DataLoader.load_parquet(self.path("data.parquet"), columns=["c1", "year"],
+                                         filters=[("year", ">=", 2023)])
+        self.assertEqual(list(loaded.columns), ["c1", "year"])
+        self.assertEqual(len(loaded), 1000)
+        self.assertIsInstance(loaded["c1"].dtype, pd.ArrowDtype)
+        expected = self.data.loc[self.data["year"] >= 2023, "c1"].to_numpy()
+        np.testing.assert_allclose(loaded["c1"].to_numpy(dtype="float64"), expected)
+
+    def test_feather_and_orc_round_trip(self):
+        DataLoader.write_feather(self.data, self.path("data.feather"))
+        DataLoader.write_orc(self.data, self.path("data.orc"))
+        for loader, name in [(DataLoader.load_feather, "data.feather"), (DataLoader.load_orc, "data.orc")]:
+            loaded = loader(self.path(name), columns=["c0"], filters=[("year", "==", 2015)], dtype_backend=None)
+            np.testing.assert_allclose(loaded["c0"], self.data["c0"].iloc[:500])
+
+    def test_streamed_write_and_read(self):
+        chunks = ChunkedData.from_frame(self.data, 1200)
+        DataLoader.write_parquet(chunks, self.path("chunked.parquet"))
+        streamed = DataLoader.stream_parquet(self.path("chunked.parquet"), columns=["c2"], batch_size=700)
+        self.assertLessEqual(max(len(chunk) for chunk in streamed), 700)
+        np.testing.assert_allclose(streamed.collect()["c2"].to_numpy(dtype="float64"), self.data["c2"])
+
+class TestOptimizeDtypes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(11)
+        cls.data = pd.DataFrame({
+            "id": np.arange(3000),
+            "score": rng.integers(-100, 100, 3000),
+            "half": rng.integers(0, 8, 3000) / 2,
+            "price": rng.normal(size=3000),
+            "city": rng.choice(["paris", "rome", "oslo"], 3000),
+            "name": [f"user{i}" for i in range(3000)],
+        })
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "data.csv")
+        cls.data.to_csv(cls.path, index=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_optimize_dtypes_report(self):
+        optimized, report = DataLoader.optimize_dtypes(self.data, sample_size=500, report=True)
+        self.assertEqual(optimized["id"].dtype, np.int16)
+        self.assertEqual(optimized["score"].dtype, np.int8)
+        self.assertEqual(optimized["half"].dtype, np.float32)
+        self.assertEqual(optimized["price"].dtype, np.float64)
+        self.assertIsInstance(optimized["city"].dtype, pd.CategoricalDtype)
+        self.assertNotIn("name", report["columns"])
+        self.assertLess(report["after"], report["before"])
+        pd.testing.assert_frame_equal(optimized.astype(self.data.dtypes.to_dict()), self.data)
+
+    def test_cleaning_on_downcast_columns(self):
+        optimized = DataLoader.load_csv(self.path, optimize=True, sample_size=500)
+        self.assertIsInstance(optimized["city"].dtype, pd.CategoricalDtype)
+        normalized = Transformation(optimized).normalize_data()
+        self.assertEqual(list(normalized.select_dtypes(include="number").columns), ["id", "score", "half", "price"])
+        self.assertAlmostEqual(normalized["score"].min(), 0.0)
+        self.assertAlmostEqual(normalized["score"].max(), 1.0)
+        encoded = Preprocessor(optimized.copy()).encode_categorical(["city"], method="frequency")
+        self.assertAlmostEqual(encoded["city"].sum(), sum(self.data["city"].value_counts(normalize=True) ** 2) * 3000)
+
+class TestLoadMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.shards = []
+        for day in range(6):
+            shard = pd.DataFrame({"day": day, "value": np.arange(day * 10, day * 10 + 10)})
+            path = os.path.join(cls.tmpdir.name, f"shard_{day}.csv")
+            shard.to_csv(path, index=False)
+            cls.shards.append(shard)
+        with open(os.path.join(cls.tmpdir.name, "shard_broken.csv"), "w") as handle:
+            handle.write("other\n1\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_glob_with_source_column(self):
+        pattern = os.path.join(self.tmpdir.name, "shard_[0-9].csv")
+        for executor in ["thread", "process"]:
+            data = DataLoader.load_many(pattern, workers=3, executor=executor, source_column="source")
+            pd.testing.assert_frame_equal(data.drop(columns="source"), pd.concat(self.shards, ignore_index=True))
+            self.assertEqual(data["source"].nunique(), 6)
+            self.assertTrue(data.loc[data["day"] == 2, "source"].str.endswith("shard_2.csv").all())
+
+    def test_repeated_path_is_one_source_category(self):
+        path = os.path.join(self.tmpdir.name, "shard_0.csv")
+        data = DataLoader.load_many([path, path], source_column="source")
+        self.assertEqual(len(data), 2 * len(self.shards[0]))
+        self.assertEqual(list(data["source"].cat.categories), [path])
+        self.assertTrue((data["source"] == path).all())
+
+    def test_schema_mismatch_skip_and_raise(self):
+        pattern = os.path.join(self.tmpdir.name, "shard_*.csv")
+        paths = sorted(glob.glob(pattern)) + [os.path.join(self.tmpdir.name, "missing.csv")]
+        data, report = DataLoader.load_many(paths, on_error="skip", report=True)
+        self.assertEqual(len(data), 60)
+        self.assertEqual(len(report["loaded"]), 6)
+        self.assertEqual(len(report["skipped"]), 2)
+        with self.assertRaises(ValueError):
+            DataLoader.load_many(paths)
+
+class TestNDJSON(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.records = [{"id": i, "user": {"name": f"u{i % 7}", "geo": {"lat": i / 10}},
+                        "amount": None if i % 9 == 0 else i * 1.5, "kind": "click"} for i in range(2500)]
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.plain = os.path.join(cls.tmpdir.name, "events.jsonl")
+        cls.compressed = os.path.join(cls.tmpdir.name, "events.jsonl.gz")
+        lines = "".join(json.dumps(record) + "\n" for record in cls.records)
+        with open(cls.plain, "w") as handle:
+            handle.write(lines)
+        with gzip.open(cls.compressed, "wt") as handle:
+            handle.write(lines)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_load_flattens_nested_fields(self):
+        loaded = DataLoader.load_json(self.compressed)
+        expected = pd.json_normalize(self.records)
+        self.assertEqual(sorted(loaded.columns), sorted(expected.columns))
+        pd.testing.assert_frame_equal(loaded[expected.columns], expected, check_dtype=False)
+
+    def test_stream_chunks(self):
+        chunks = list(DataLoader.stream_json(self.plain, chunksize=1000))
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 500])
+        self.assertEqual(chunks[2].index[0], 2000)
+        by_bytes = DataLoader.stream_json(self.compressed, max_bytes=16 * 1024)
+        self.assertGreater(len(list(by_bytes)), 3)
+        self.assertEqual(len(by_bytes.collect()), 2500)
+        filled = Preprocessor(DataLoader.stream_json(self.plain, chunksize=700)).handle_missing_values(strategy="mean")
+        self.assertFalse(filled.collect()["amount"].isna().any())
+
+    def test_schema_and_projection(self):
+        schema = {"id": "int32", "user.geo.lat": "double", "amount": "double"}
+        loaded = DataLoader.stream_json(self.plain, chunksize=1000, schema=schema).collect()
+        self.assertEqual(list(loaded.columns), list(schema))
+        self.assertEqual(loaded["id"].dtype, np.int32)
+        projected = DataLoader.load_json(self.plain, columns=["user.name", "id"])
+        self.assertEqual(list(projected.columns), ["user.name", "id"])
+        arrow = DataLoader.stream_json(self.plain, chunksize=5000, schema=schema, dtype_backend="pyarrow").collect()
+        self.assertIsInstance(arrow["amount"].dtype, pd.ArrowDtype)
+
+    def test_pure_python_fallback_matches(self):
+        expected = DataLoader.load_json(self.compressed, columns=["id", "user.name", "amount"])
+        with mock.patch.dict("sys.modules", {"pyarrow.json": None}):
+            fallback = DataLoader.stream_json(self.compressed, chunksize=1000, columns=["id", "user.name", "amount"])
+            self.assertEqual([len(chunk) for chunk in fallback], [1000, 1000, 500])
+            pd.testing.assert_frame_equal(fallback.collect(), expected, check_dtype=False)
+
+    def test_late_typed_field(self):
+        path = os.path.join(self.tmpdir.name, "late.jsonl")
+        with open(path, "w") as handle:
+            for i in range(60000):  # the first 1 MiB block only has nulls in "note"
+                handle.write(json.dumps({"id": i, "note": None if i < 50000 else f"n{i}"}) + "\n")
+        expected = pd.read_json(path, lines=True)
+        loaded = DataLoader.load_json(path)
+        pd.testing.assert_series_equal(loaded["id"], expected["id"], check_dtype=False)
+        np.testing.assert_array_equal(loaded["note"].isna(), expected["note"].isna())
+        self.assertEqual(loaded["note"].dropna().tolist(), expected["note"].dropna().tolist())
+        chunks = DataLoader.stream_json(path, max_bytes=8 * 1024)
+        self.assertEqual(chunks.collect()["note"].iloc[-1], "n59999")
+        self.assertEqual(list(DataLoader.load_many([path]).columns), ["id", "note"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DataLoader.stream_json(self.plain)
+        with self.assertRaises(ValueError):
+            DataLoader.stream_json(self.plain, chunksize=10, dtype_backend="arrow")
+        with self.assertRaises(ValueError):
+            DataLoader.load_json(self.plain, columns=["missing"])
+        with self.assertRaises(ValueError):
+            DataLoader.load_json(self.plain, lines=False, columns=["id"])
+
+if __name__ == '__main__':
+    unittest.main()
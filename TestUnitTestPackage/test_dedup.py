@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro.dedup import BloomFilter, Deduplicator, HashSet, row_fingerprints
+
+class TestDedup(unittest.TestCase):
+    def test_fingerprints_ignore_index(self):
+        frame = pd.DataFrame({"a": [1, 2, 1], "b": ["x", "y", "x"]}, index=[10, 20, 30])
+        keys = row_fingerprints(frame)
+        self.assertEqual(keys[0], keys[2])
+        self.assertNotEqual(keys[0], keys[1])
+        wide = row_fingerprints(frame, subset=["a"], bits=128)
+        self.assertEqual(wide[0], wide[2])
+
+    def test_128_bit_words_are_independent_on_numeric_data(self):
+        rng = np.random.default_rng(6)
+        frame = pd.DataFrame({"a": rng.integers(0, 1000, 5000), "b": rng.normal(size=5000)})
+        wide = row_fingerprints(frame, bits=128)
+        self.assertFalse((wide["high"] == wide["low"]).any())
+        np.testing.assert_array_equal(wide["low"], row_fingerprints(frame))
+        self.assertEqual(len(np.unique(wide["high"])), len(frame.drop_duplicates()))
+        swapped = row_fingerprints(frame[["b", "a"]].set_axis(["a", "b"], axis=1), bits=128)
+        self.assertFalse((swapped["high"] == wide["high"]).all())
+
+    def test_hash_set_matches_python_set(self):
+        rng = np.random.default_rng(6)
+        seen, reference = HashSet(), set()
+        for _ in range(20):
+            keys = rng.integers(0, 5000, 300).astype(np.uint64)
+            expected = np.array([key in reference for key in keys])
+            np.testing.assert_array_equal(seen.contains(keys), expected)
+            seen.add(keys)
+            reference.update(keys.tolist())
+        self.assertEqual(len(seen), len(reference))
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=10000, error_rate=0.01)
+        keys = np.random.default_rng(7).integers(0, 2**63, 10000).astype(np.uint64)
+        bloom.add(keys)
+        self.assertTrue(bloom.contains(keys).all())
+        others = np.random.default_rng(8).integers(0, 2**63, 10000).astype(np.uint64)
+        self.assertLess(bloom.contains(others).mean(), 0.03)
+
+    def test_deduplicator_across_chunks(self):
+        dedup = Deduplicator()
+        first = dedup.drop_duplicates(pd.DataFrame({"a": [1, 1, 2]}))
+        second = dedup.drop_duplicates(pd.DataFrame({"a": [2, 3]}))
+        self.assertEqual(first["a"].tolist() + second["a"].tolist(), [1, 2, 3])
+        self.assertEqual((dedup.rows_seen, dedup.duplicates), (5, 2))
+
+if __name__ == '__main__':
+    unittest.main()
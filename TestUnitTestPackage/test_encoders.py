@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.encoders import FrequencyEncoder, LabelEncoder, OneHotEncoder
+
+class TestEncoders(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame({
+            "city": ["paris", "rome", "paris", None, "oslo", "paris"],
+            "value": [1, 2, 3, 4, 5, 6],
+        })
+        self.batch = pd.Series(["rome", "lima", None, "paris"], name="city")
+
+    def test_label_codes_use_small_dtype_and_are_reusable(self):
+        encoder = LabelEncoder().fit(self.data["city"])
+        codes = encoder.transform(self.batch)
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(codes.tolist(), [1, -1, -1, 0])
+        with self.assertRaises(ValueError):
+            LabelEncoder(handle_unknown="error").fit(self.data["city"]).transform(self.batch)
+
+    def test_frequency_matches_value_counts(self):
+        encoded = Preprocessor(self.data.copy()).encode_categorical(["city"], method="frequency")
+        expected = self.data["city"].map(self.data["city"].value_counts(dropna=False, normalize=True))
+        self.assertTrue(np.allclose(encoded["city"], expected))
+        unseen = FrequencyEncoder().fit(self.data["city"]).transform(self.batch)
+        self.assertEqual(unseen.iloc[1], 0.0)
+
+    def test_onehot_dense_and_sparse(self):
+        dense = Preprocessor(self.data.copy()).encode_categorical(["city"], method="onehot")
+        sparse = Preprocessor(self.data.copy()).encode_categorical(["city"], method="onehot", sparse=True)
+        self.assertEqual(list(dense.columns), ["value", "city_paris", "city_rome", "city_oslo"])
+        self.assertIsInstance(sparse["city_paris"].dtype, pd.SparseDtype)
+        dummies = list(dense.columns[1:])
+        self.assertTrue((sparse[dummies].sparse.to_dense().to_numpy() == dense[dummies].to_numpy()).all())
+        matrix = OneHotEncoder(sparse="csr").fit(self.data["city"]).transform(self.batch)
+        self.assertEqual(matrix.shape, (4, 3))
+        self.assertEqual(matrix.nnz, 2)
+        preprocessor = Preprocessor(self.data.copy())
+        matrices = preprocessor.encode_categorical(["city"], method="onehot", sparse="csr")
+        self.assertEqual(matrices["city"].shape, (len(self.data), 3))
+        pd.testing.assert_frame_equal(preprocessor.data, self.data)
+        for sparse in ["bogus", "coo"]:
+            with self.assertRaises(ValueError):
+                Preprocessor(self.data.copy()).encode_categorical(["city"], method="onehot", sparse=sparse)
+
+    def test_encoders_reused_across_batches(self):
+        first = Preprocessor(self.data.copy())
+        first.encode_categorical(["city"], method="label")
+        second = Preprocessor(pd.DataFrame({"city": self.batch}))
+        encoded = second.encode_categorical(["city"], method="label", encoders=first.encoders)
+        self.assertEqual(encoded["city"].tolist(), [1, -1, -1, 0])
+
+    def test_partial_fit_appends_categories(self):
+        encoder = LabelEncoder().fit(self.data["city"])
+        codes = encoder.partial_fit_transform(self.batch)
+        self.assertEqual(list(encoder.categories), ["paris", "rome", "oslo", "lima"])
+        self.assertEqual(codes.tolist(), [1, 3, -1, 0])
+        frequency = FrequencyEncoder().partial_fit(self.data["city"]).partial_fit(self.batch)
+        combined = pd.concat([self.data["city"], self.batch])
+        expected = combined.value_counts() / len(combined)
+        self.assertTrue(np.allclose(frequency.frequencies, expected[list(frequency.categories)]))
+        self.assertAlmostEqual(frequency.missing_frequency, 2 / 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import unittest
+import DataCleanPro
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(DataCleanPro.__file__)))
+
+def loaded_modules(code):
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT, MPLBACKEND="Agg")
+    script = code + "\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env)
+    return set(output.stdout.split())
+
+class TestLazyImports(unittest.TestCase):
+    def test_cleaning_path_skips_plotting_libraries(self):
+        modules = loaded_modules("import DataCleanPro\n"
+                                 "DataCleanPro.DataLoader, DataCleanPro.Preprocessor, DataCleanPro.Transformation")
+        self.assertIn("DataCleanPro.preprocessor", modules)
+        for name in ["matplotlib", "seaborn", "DataCleanPro.visualization"]:
+            self.assertNotIn(name, modules)
+
+    def test_visualization_defers_plotting_libraries(self):
+        modules = loaded_modules("from DataCleanPro import Visualization")
+        self.assertIn("DataCleanPro.visualization", modules)
+        self.assertNotIn("seaborn", modules)
+        self.assertNotIn("matplotlib.pyplot", modules)
+
+    def test_star_import_and_attributes(self):
+        namespace = {}
+        exec("from DataCleanPro import *", namespace)
+        for name in DataCleanPro.__all__:
+            self.assertIs(namespace[name], getattr(DataCleanPro, name))
+        self.assertIn("Preprocessor", dir(DataCleanPro))
+        with self.assertRaises(AttributeError):
+            DataCleanPro.Missing
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestIncrementalCleaner(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(22)
+        values = rng.normal(50, 10, size=(300, 2))
+        values[rng.random(values.shape) < 0.1] = np.nan
+        self.data = pd.DataFrame(values, columns=["x", "y"])
+        self.data["city"] = rng.choice(["paris", "rome", "oslo"], 300)
+        self.deltas = [self.data.iloc[:100], self.data.iloc[100:220], self.data.iloc[220:]]
+
+    def test_single_delta_matches_eager(self):
+        cleaner = IncrementalCleaner(strategy="mean", encode=["city"], scale="standardize", columns=["x", "y"])
+        result = cleaner.update(self.data)
+        expected = Preprocessor(self.data.copy()).handle_missing_values(strategy="mean")
+        expected = Preprocessor(expected).encode_categorical(["city"], method="label")
+        expected = Transformation(expected).standardize_data(columns=["x", "y"])
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_fill_values_use_all_rows_seen(self):
+        cleaner = IncrementalCleaner(strategy="mean")
+        for end, delta in zip([100, 220, 300], self.deltas):
+            result = cleaner.update(delta)
+            seen = self.data.iloc[:end]
+            self.assertAlmostEqual(cleaner.fill_values()["x"], seen["x"].mean())
+            filled = result["x"][delta["x"].isna()]
+            self.assertTrue(np.allclose(filled, seen["x"].mean()))
+        self.assertEqual(cleaner.rows_seen, 300)
+        self.assertFalse(cleaner.update(self.data.iloc[:0]).isna().any().any())
+
+    def test_mode_fill(self):
+        data = pd.DataFrame({"city": ["rome", None, "oslo", "oslo"], "n": [1, 1, None, 2]})
+        cleaner = IncrementalCleaner(strategy="mode")
+        cleaner.update(data.iloc[:1])
+        result = cleaner.update(data.iloc[1:])
+        self.assertEqual(result["city"].tolist(), ["oslo", "oslo", "oslo"])
+        self.assertEqual(result["n"].tolist(), [1, 1, 2])
+
+    def test_duplicates_dropped_across_deltas(self):
+        cleaner = IncrementalCleaner(strategy=None, deduplicate="exact", subset=["city"])
+        outputs = [cleaner.update(delta) for delta in self.deltas]
+        self.assertEqual(sorted(pd.concat(outputs)["city"]), ["oslo", "paris", "rome"])
+        self.assertEqual(len(outputs[0]), 3)
+        self.assertEqual(cleaner.rows_emitted, 3)
+
+    def test_codes_stable_and_frequencies_cumulative(self):
+        labels = IncrementalCleaner(strategy=None, encode=["city"])
+        first = labels.update(pd.DataFrame({"city": ["rome", "oslo"]}))
+        second = labels.update(pd.DataFrame({"city": ["lima", "oslo", "rome"]}))
+        self.assertEqual(first["city"].tolist(), [0, 1])
+        self.assertEqual(second["city"].tolist(), [2, 1, 0])
+        frequencies = IncrementalCleaner(strategy=None, encode=["city"], method="frequency")
+        frequencies.update(pd.DataFrame({"city": ["rome", "oslo"]}))
+        result = frequencies.update(pd.DataFrame({"city": ["oslo", "oslo"]}))
+        self.assertEqual(result["city"].tolist(), [0.75, 0.75])
+
+    def test_save_and_load(self):
+        cleaner = IncrementalCleaner(strategy="median", scale="normalize")
+        cleaner.update(self.deltas[0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "state.pkl")
+            cleaner.save(path)
+            restored = IncrementalCleaner.load(path)
+        pd.testing.assert_frame_equal(restored.update(self.deltas[1]), cleaner.update(self.deltas[1]))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            IncrementalCleaner(strategy="interpolate")
+        with self.assertRaises(TypeError):
+            IncrementalCleaner().update([1, 2])
+        with self.assertRaises(ValueError):
+            IncrementalCleaner(scale="standardize").update(pd.DataFrame({"x": [1.0, 1.0]}))
+
+    def test_failed_update_leaves_state_unchanged(self):
+        cleaner = IncrementalCleaner(strategy="mean", scale="standardize", deduplicate="exact")
+        cleaner.update(self.deltas[0])
+        with self.assertRaises(TypeError):
+            cleaner.update(self.deltas[1].assign(x="a"))
+        self.assertEqual((cleaner.rows_seen, cleaner.deduplicator.rows_seen), (100, 100))
+        self.assertEqual(cleaner.profile["x"].n, self.deltas[0]["x"].notna().sum())
+        result = cleaner.update(self.deltas[1])
+        self.assertEqual(len(result), 120)
+        self.assertEqual(cleaner.rows_seen, 220)
+        self.assertAlmostEqual(cleaner.fill_values()["x"], self.data["x"].iloc[:220].mean())
+
+if __name__ == "__main__":
+    unittest.main()
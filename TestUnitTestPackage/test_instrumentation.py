@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+import urllib.request
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro import instrumentation
+from DataCleanPro.instrumentation import JSONLinesSink, LoggingSink, OpenMetricsSink
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.data = pd.DataFrame({"age": rng.normal(40, 10, 200), "fare": rng.lognormal(2, 1, 200),
+                                  "sex": rng.choice(["male", "female"], 200)})
+        self.data.loc[::9, "age"] = np.nan
+        self.records = []
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        original = Preprocessor.handle_missing_values
+        instrumentation.enable([self.records.append])
+        self.assertIsNot(Preprocessor.handle_missing_values, original)
+        instrumentation.disable()
+        self.assertIs(Preprocessor.handle_missing_values, original)
+        self.assertFalse(instrumentation.is_enabled())
+        Preprocessor(self.data.copy()).handle_missing_values()
+        self.assertEqual(self.records, [])
+
+    def test_records_shapes_and_times(self):
+        with instrumentation.instrument([self.records.append]):
+            Preprocessor(self.data.copy()).handle_missing_values(strategy="drop")
+            Transformation(self.data).normalize_data(columns=["fare"])
+        first, second = self.records
+        self.assertEqual(first["method"], "Preprocessor.handle_missing_values")
+        self.assertEqual((first["rows_in"], first["columns_in"]), (200, 3))
+        self.assertEqual((first["rows_out"], first["columns_out"]), (200 - len(range(0, 200, 9)), 3))
+        self.assertEqual(second["method"], "Transformation.normalize_data")
+        for record in self.records:
+            self.assertGreaterEqual(record["wall_seconds"], 0)
+            self.assertGreaterEqual(record["cpu_seconds"], 0)
+            self.assertIsNone(record["error"])
+            self.assertEqual(record["depth"], 0)
+
+    def test_static_methods_and_nesting(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "data.csv")
+        self.data.to_csv(path, index=False)
+        with instrumentation.instrument([self.records.append]):
+            DataLoader.load_csv(path)
+            Pipeline(self.data).remove_duplicates().collect()
+        methods = [(record["method"], record["depth"]) for record in self.records]
+        self.assertIn(("DataLoader.load_csv", 0), methods)
+        self.assertIn(("Preprocessor.remove_duplicates", 1), methods)
+        self.assertEqual(methods[-1], ("Pipeline.collect", 0))
+
+    def test_errors_are_recorded_and_raised(self):
+        with instrumentation.instrument([self.records.append]):
+            with self.assertRaises(ValueError):
+                Preprocessor(self.data).handle_missing_values(strategy="bogus")
+        self.assertEqual(self.records[-1]["error"], "ValueError")
+
+    def test_memory(self):
+        with instrumentation.instrument([self.records.append], memory=True):
+            Transformation(self.data).standardize_data(columns=["age", "fare"])
+        self.assertGreater(self.records[0]["memory_peak_bytes"], 200 * 8)
+
+    def test_json_lines_and_logging_sinks(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "metrics.jsonl")
+        with self.assertLogs("DataCleanPro", level="INFO") as logs:
+            with instrumentation.instrument([JSONLinesSink(path), LoggingSink()]):
+                Preprocessor(self.data.copy()).handle_missing_values()
+                Preprocessor(self.data.copy()).check_duplicates()
+        with open(path, encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle]
+        self.assertEqual([record["method"] for record in records],
+                         ["Preprocessor.handle_missing_values", "Preprocessor.check_duplicates"])
+        self.assertIn("Preprocessor.handle_missing_values", logs.output[0])
+
+    def test_open_metrics(self):
+        sink = OpenMetricsSink()
+        with instrumentation.instrument([sink]):
+            for _ in range(3):
+                Transformation(self.data).normalize_data(columns=["fare"])
+        text = sink.render()
+        self.assertIn('datacleanpro_calls_total{method="Transformation.normalize_data"} 3', text)
+        self.assertIn('datacleanpro_rows_in_total{method="Transformation.normalize_data"} 600', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+        server = sink.serve(port=0)
+        self.addCleanup(sink.close)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            self.assertEqual(response.read().decode(), text)
+
+if __name__ == "__main__":
+    unittest.main()
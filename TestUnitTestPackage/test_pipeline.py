@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestPipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(9)
+        cls.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 400),
+            "fare": rng.exponential(20, 400),
+            "pclass": rng.integers(1, 4, 400),
+            "sex": rng.choice(["male", "female"], 400),
+        })
+        cls.data.loc[::6, "age"] = np.nan
+        cls.data.loc[::10, "fare"] = np.nan
+
+    def eager(self, data):
+        pre = Preprocessor(data.copy())
+        pre.handle_missing_values(strategy="median")
+        pre.encode_categorical(["sex"], method="frequency")
+        pre.handle_outliers(method="iqr", remove=True)
+        normalized = Transformation(pre.data).normalize_data(columns=["fare"])
+        return Transformation(normalized).standardize_data(columns=["age", "pclass"])
+
+    def test_matches_eager_steps(self):
+        pipeline = (Pipeline(self.data)
+                    .handle_missing_values(strategy="median")
+                    .encode_categorical(["sex"], method="frequency")
+                    .handle_outliers(method="iqr")
+                    .normalize_data(columns=["fare"])
+                    .standardize_data(columns=["age", "pclass"]))
+        self.assertEqual([kind for kind, _ in pipeline.plan()], ["fused", "frame", "fused"])
+        result = pipeline.collect()
+        pd.testing.assert_frame_equal(result, self.eager(self.data), check_dtype=False)
+
+    def test_steps_are_lazy_and_source_untouched(self):
+        original = self.data.copy()
+        pipeline = Pipeline(self.data).handle_missing_values().normalize_data()
+        self.assertIn("fused column pass", pipeline.explain())
+        result = pipeline.collect()
+        pd.testing.assert_frame_equal(self.data, original)
+        self.assertEqual(result[["age", "fare", "pclass"]].isna().sum().sum(), 0)
+        self.assertAlmostEqual(result["fare"].max(), 1.0)
+
+    def test_invalid_steps(self):
+        with self.assertRaises(TypeError):
+            Pipeline(self.data).normalize_data(columns=["sex"]).collect()
+        with self.assertRaises(ValueError):
+            Pipeline(self.data).handle_missing_values(strategy="zero")
+
+if __name__ == '__main__':
+    unittest.main()
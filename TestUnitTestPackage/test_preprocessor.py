@@ -0,0 +1,121 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.imputation import multi_column_mode
+
+class TestHandleMissingValues(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(2)
+        values = rng.integers(0, 6, size=(300, 40)).astype("float64")
+        values[rng.random(values.shape) < 0.1] = np.nan
+        cls.data = pd.DataFrame(values, columns=[f"c{i}" for i in range(40)])
+        cls.data["f32"] = pd.Series([1.5, np.nan, 2.5] * 100, dtype="float32")
+        cls.data["nullable"] = pd.array([1, None, 2] * 100, dtype="Int64")
+        cls.data["text"] = ["a", None, "b"] * 100
+
+    def test_matches_per_column_reference(self):
+        for strategy in ["mean", "median", "mode"]:
+            result = Preprocessor(self.data.copy()).handle_missing_values(strategy=strategy)
+            for col in self.data.columns:
+                series = self.data[col]
+                if not pd.api.types.is_numeric_dtype(series):
+                    if strategy == "mode":
+                        self.assertEqual(result.loc[series.isna(), col].unique().tolist(), ["a"])
+                    continue
+                if strategy == "mode":
+                    fill = series.mode(dropna=True).iloc[0]
+                else:
+                    fill = getattr(series, strategy)()
+                filled = result.loc[series.isna(), col].astype("float64")
+                self.assertTrue(np.allclose(filled, float(fill)))
+            self.assertEqual(list(result.columns), list(self.data.columns))
+
+    def test_covers_non_default_numeric_dtypes(self):
+        result = Preprocessor(self.data.copy()).handle_missing_values(strategy="mean")
+        self.assertEqual(result["f32"].dtype, np.float32)
+        self.assertEqual(result["nullable"].dtype, pd.Float64Dtype())
+        self.assertEqual(result[["f32", "nullable"]].isna().sum().sum(), 0)
+        self.assertTrue(result["text"].isna().any())
+
+    def test_check_missing_values_logs_counts(self):
+        with self.assertLogs("DataCleanPro", level="INFO") as logs:
+            missing = Preprocessor(self.data).check_missing_values()
+        self.assertEqual(missing["nullable"], 100)
+        self.assertIn("nullable", logs.output[0])
+        with self.assertLogs("DataCleanPro", level="INFO") as logs:
+            Preprocessor(self.data.dropna()).check_missing_values()
+        self.assertEqual(logs.records[0].getMessage(), "No missing values found.")
+
+    def test_mode_keeps_large_integers_exact(self):
+        big = 2 ** 53
+        data = pd.DataFrame({"ids": pd.array([big + 1, None, big + 1, big + 2, big], dtype="Int64"),
+                             "u": np.array([2 ** 64 - 1] * 3 + [3, 3], dtype="uint64"),
+                             "x": [0.5, np.nan, 0.5, 1.0, 1.0]})
+        modes = multi_column_mode(data)
+        self.assertEqual(modes.tolist(), [big + 1, 2 ** 64 - 1, 0.5])
+        result = Preprocessor(data.copy()).handle_missing_values(strategy="mode")
+        self.assertEqual(result["ids"].iloc[1], big + 1)
+        self.assertEqual(result["x"].iloc[1], 0.5)
+
+class TestHandleOutliers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(3)
+        cls.data = pd.DataFrame(rng.standard_t(3, size=(2000, 12)), columns=[f"x{i}" for i in range(12)])
+        cls.data["label"] = "a"
+
+    def reference_index(self, data):
+        index = set()
+        for col in data.select_dtypes(include="number").columns:
+            q1, q3 = data[col].quantile(0.25), data[col].quantile(0.75)
+            low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+            index.update(data[(data[col] < low) | (data[col] > high)].index)
+        return sorted(index)
+
+    def test_iqr_matches_per_column_reference(self):
+        outliers = Preprocessor(self.data.copy()).handle_outliers(method="iqr")
+        self.assertEqual(list(outliers.index), self.reference_index(self.data))
+        threaded = Preprocessor(self.data.copy()).handle_outliers(method="iqr", n_jobs=4)
+        pd.testing.assert_frame_equal(threaded, outliers)
+
+    def test_remove_and_zscore(self):
+        pre = Preprocessor(self.data.copy())
+        n_outliers = len(pre.handle_outliers(method="zscore", n_jobs=3))
+        pre.handle_outliers(method="zscore", remove=True)
+        self.assertEqual(len(pre.data), len(self.data) - n_outliers)
+
+    def test_chunked_iqr_uses_sketch_quartiles(self):
+        chunked = Preprocessor(ChunkedData.from_frame(self.data, 250))
+        outliers = chunked.handle_outliers(method="iqr").collect()
+        expected = set(self.reference_index(self.data))
+        overlap = len(expected & set(outliers.index)) / len(expected)
+        self.assertGreater(overlap, 0.9)
+        kept = chunked.handle_outliers(method="iqr", remove=True).collect()
+        self.assertEqual(len(kept) + len(outliers), len(self.data))
+
+class TestDuplicates(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(5)
+        cls.data = pd.DataFrame({"a": rng.integers(0, 30, 3000), "b": rng.choice(["x", "y"], 3000)})
+
+    def test_in_memory_single_scan(self):
+        expected = self.data.drop_duplicates()
+        with self.assertLogs("DataCleanPro", level="INFO") as logs:
+            result = Preprocessor(self.data.copy()).remove_duplicates()
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertEqual(logs.records[0].getMessage(), f"Number of duplicate rows: {len(self.data) - len(expected)}")
+
+    def test_chunked_exact_and_bloom(self):
+        expected = self.data.drop_duplicates(subset=["a"])
+        for method, bits in [("exact", 64), ("exact", 128), ("bloom", 64)]:
+            pre = Preprocessor(ChunkedData.from_frame(self.data, 128))
+            self.assertEqual(pre.check_duplicates(subset=["a"], method=method, bits=bits), len(self.data) - len(expected))
+            result = pre.remove_duplicates(subset=["a"], method=method, bits=bits).collect()
+            pd.testing.assert_frame_equal(result, expected)
+            self.assertEqual(pre.deduplicator.duplicates, len(self.data) - len(expected))
+
+if __name__ == '__main__':
+    unittest.main()
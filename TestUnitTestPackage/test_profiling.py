@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestProfile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(13)
+        cls.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 20000),
+            "pclass": rng.integers(1, 4, 20000),
+            "sex": rng.choice(["male", "female", "other"], 20000, p=[0.6, 0.3, 0.1]),
+        })
+        cls.data.loc[::11, "age"] = np.nan
+        cls.data.loc[::17, "sex"] = None
+
+    def test_matches_exact_statistics(self):
+        profile = Profile.profile(self.data)
+        age = profile["age"]
+        self.assertEqual(profile.rows, 20000)
+        self.assertEqual(age.nulls, self.data["age"].isna().sum())
+        self.assertAlmostEqual(age.mean, self.data["age"].mean())
+        self.assertAlmostEqual(age.std, self.data["age"].std())
+        self.assertEqual(age.min, self.data["age"].min())
+        self.assertLess(abs(age.quantile(0.5) - self.data["age"].median()), 0.5)
+        self.assertEqual(profile["pclass"].distinct.count(), 3)
+        self.assertEqual(profile["sex"].top.top().index[0], "male")
+        self.assertFalse(profile["sex"].numeric)
+        counts, edges = age.histogram(bins=20)
+        self.assertEqual(counts.sum(), self.data["age"].notna().sum())
+        self.assertEqual(len(edges), 21)
+
+    def test_chunks_and_merge_agree(self):
+        whole = Profile.profile(self.data)
+        chunked = Profile.profile(ChunkedData.from_frame(self.data, chunksize=3000))
+        halves = Profile.profile(self.data.iloc[:7000]) + Profile.profile(self.data.iloc[7000:])
+        for profile in [chunked, halves]:
+            self.assertEqual(profile.rows, whole.rows)
+            pd.testing.assert_series_equal(profile.nulls, whole.nulls)
+            pd.testing.assert_frame_equal(profile.moments(), whole.moments())
+            self.assertEqual(profile["sex"].top.top().to_dict(), whole["sex"].top.top().to_dict())
+
+    def test_summary_and_consumers(self):
+        profile = Preprocessor(self.data).profile()
+        summary = profile.summary()
+        self.assertEqual(list(summary.index), ["age", "pclass", "sex"])
+        self.assertTrue(np.isnan(summary.loc["sex", "mean"]))
+        stats = FittedStatistics.from_profile(profile)
+        self.assertAlmostEqual(stats.numeric.loc["age", "mean"], self.data["age"].mean())
+        self.assertEqual(stats.modes["sex"], "male")
+        moments = profile.moments()
+        self.assertEqual(list(moments.columns), ["count", "mean", "std", "min", "max"])
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            Profile.profile(self.data, columns=["missing"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro.sketches import HyperLogLog, KLLSketch, TopK
+
+class TestKLLSketch(unittest.TestCase):
+    def test_quantiles_within_rank_error(self):
+        rng = np.random.default_rng(4)
+        values = rng.lognormal(size=200000)
+        sketch = KLLSketch(k=200, seed=0)
+        for chunk in np.array_split(values, 50):
+            sketch.update(chunk)
+        ordered = np.sort(values)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            rank = np.searchsorted(ordered, sketch.quantile(q)) / len(values)
+            self.assertLess(abs(rank - q), 0.02)
+        self.assertEqual(sketch.quantile(0), values.min())
+        self.assertEqual(sketch.quantile(1), values.max())
+
+    def test_merge_and_small_inputs(self):
+        left = KLLSketch(seed=1).update(np.arange(5000))
+        right = KLLSketch(seed=2).update(np.arange(5000, 10000))
+        merged = left.merge(right)
+        self.assertEqual(merged.count, 10000)
+        self.assertLess(abs(merged.quantile(0.5) - 4999.5), 200)
+        exact = KLLSketch().update([1.0, np.nan, 2.0, 3.0, 4.0])
+        self.assertTrue(np.allclose(exact.quantile([0.25, 0.5, 0.75]), [1.75, 2.5, 3.25]))
+
+class TestHyperLogLog(unittest.TestCase):
+    def test_estimate_and_merge(self):
+        left = HyperLogLog().update(np.arange(60000))
+        right = HyperLogLog().update(np.arange(30000, 90000))
+        self.assertLess(abs(left.count() - 60000) / 60000, 0.03)
+        self.assertLess(abs(left.merge(right).count() - 90000) / 90000, 0.03)
+
+    def test_small_counts_and_missing(self):
+        self.assertEqual(HyperLogLog().update(pd.Series(["a", "b", None, "a"])).count(), 2)
+        self.assertEqual(HyperLogLog().count(), 0)
+
+class TestTopK(unittest.TestCase):
+    def test_merge(self):
+        counts = TopK(2).update(["a", "b", "a", None]).merge(TopK(2).update(["b", "b", "c"]))
+        self.assertEqual(counts.top().to_dict(), {"b": 3, "a": 2})
+
+if __name__ == '__main__':
+    unittest.main()
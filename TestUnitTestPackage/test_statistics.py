@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.statistics import FittedStatistics
+
+class TestFittedStatistics(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        cls.reference = pd.DataFrame({
+            "age": rng.normal(40, 12, 500),
+            "fare": rng.exponential(30, 500),
+            "sex": rng.choice(["male", "female"], 500),
+        })
+        cls.reference.loc[::9, "age"] = np.nan
+        cls.reference.loc[::17, "sex"] = None
+        cls.batch = pd.DataFrame({"age": [np.nan, 30.0, 90.0], "fare": [10.0, np.nan, 500.0],
+                                  "sex": ["female", "unknown", None]})
+
+    def test_fitted_scaling_uses_reference_statistics(self):
+        stats = Transformation(self.reference).fit(columns=["age", "fare"])
+        result = Transformation(self.batch).normalize_data(columns=["fare"], stats=stats)
+        low, high = self.reference["fare"].min(), self.reference["fare"].max()
+        self.assertAlmostEqual(result["fare"].iloc[2], (500.0 - low) / (high - low))
+        expected = Transformation(self.reference).standardize_data(columns=["age", "fare"])
+        fitted = Transformation(self.reference).standardize_data(columns=["age", "fare"], stats=stats)
+        pd.testing.assert_frame_equal(fitted, expected)
+
+    def test_fitted_missing_values_and_encoding(self):
+        stats = Preprocessor(self.reference).fit(categorical=["sex"])
+        filled = Preprocessor(self.batch.copy()).handle_missing_values(strategy="median", stats=stats)
+        self.assertAlmostEqual(filled["age"].iloc[0], self.reference["age"].median())
+        encoded = Preprocessor(self.batch.copy()).encode_categorical(["sex"], method="label", stats=stats)
+        self.assertEqual(encoded["sex"].iloc[0], stats.label_maps["sex"]["female"])
+        self.assertEqual(encoded["sex"].tolist()[1:], [-1, -1])
+
+    def test_fitted_label_maps_match_label_encoder(self):
+        data = pd.DataFrame({"city": ["rome", None, "oslo", "lima", "oslo", None] * 20, "n": np.arange(120.0)})
+        expected = Preprocessor(data.copy()).encode_categorical(["city"], method="label")
+        for fitted in [data, ChunkedData.from_frame(data, 7)]:
+            stats = FittedStatistics.fit(fitted, categorical=["city"])
+            self.assertEqual(stats.label_maps["city"], {"rome": 0, "oslo": 1, "lima": 2})
+            encoded = Preprocessor(data.copy()).encode_categorical(["city"], method="label", stats=stats)
+            pd.testing.assert_frame_equal(encoded, expected)
+
+    def test_fitted_onehot_columns_match_reference(self):
+        stats = FittedStatistics.fit(self.reference, categorical=["sex"])
+        expected = Preprocessor(self.reference.copy()).encode_categorical(["sex"], method="onehot")
+        batch = self.batch.iloc[[0, 1]].copy()
+        encoded = Preprocessor(batch).encode_categorical(["sex"], method="onehot", stats=stats)
+        self.assertEqual(list(encoded.columns), list(expected.columns))
+        self.assertEqual(encoded["sex_female"].tolist(), [True, False])
+        self.assertEqual(encoded["sex_male"].tolist(), [False, False])
+        with self.assertRaises(ValueError):
+            Preprocessor(self.batch.copy()).encode_categorical(["fare"], method="onehot", stats=stats)
+
+    def test_save_and_load_round_trip(self):
+        stats = FittedStatistics.fit(self.reference, categorical=["sex"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stats.json")
+            stats.save(path)
+            loaded = FittedStatistics.load(path)
+        pd.testing.assert_frame_equal(loaded.numeric, stats.numeric)
+        self.assertEqual(loaded.label_maps["sex"]["male"], stats.label_maps["sex"]["male"])
+        pd.testing.assert_frame_equal(loaded.encode(self.reference, ["sex"], method="frequency"),
+                                      stats.encode(self.reference, ["sex"], method="frequency"))
+
+    def test_save_and_load_datetime_modes(self):
+        data = self.reference.assign(
+            seen=pd.Timestamp("2024-03-01 12:30") + pd.to_timedelta(np.arange(500) % 3, unit="D"),
+            zoned=pd.Timestamp("2024-03-01", tz="Europe/Paris"), waited=pd.to_timedelta(np.arange(500) % 2, unit="h"))
+        data.loc[:9, "seen"] = pd.NaT
+        stats = FittedStatistics.fit(data, columns=["age", "fare"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stats.json")
+            stats.save(path)
+            loaded = FittedStatistics.load(path)
+        self.assertEqual(loaded.modes["seen"], pd.Timestamp("2024-03-02 12:30"))
+        self.assertEqual(loaded.modes["zoned"], stats.modes["zoned"])
+        self.assertEqual(str(loaded.modes["zoned"].tz), "Europe/Paris")
+        self.assertEqual(loaded.modes["waited"], pd.Timedelta(0))
+        filled = loaded.fill_missing(data[["seen"]], strategy="mode")
+        self.assertEqual(filled["seen"].iloc[0], pd.Timestamp("2024-03-02 12:30"))
+
+    def test_fit_on_chunks_matches_frame(self):
+        chunked = FittedStatistics.fit(ChunkedData.from_frame(self.reference, 64), categorical=["sex"])
+        frame = FittedStatistics.fit(self.reference, categorical=["sex"])
+        pd.testing.assert_frame_equal(chunked.numeric, frame.numeric)
+        self.assertEqual(chunked.label_maps, frame.label_maps)
+
+if __name__ == '__main__':
+    unittest.main()
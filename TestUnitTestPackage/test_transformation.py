@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+
+class TestBlockScaling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(12)
+        cls.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 1000),
+            "fare": rng.exponential(20, 1000),
+            "pclass": rng.integers(1, 4, 1000).astype("int8"),
+            "sex": rng.choice(["male", "female"], 1000),
+        })
+        cls.data.loc[::9, "age"] = np.nan
+        cls.columns = ["age", "fare", "pclass"]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_array_matches_copying_path(self):
+        for method in ["normalize_data", "standardize_data"]:
+            expected = getattr(Transformation(self.data), method)()
+            block = getattr(Transformation(self.data), method)(out="array")
+            self.assertEqual(block.shape, (1000, 3))
+            np.testing.assert_allclose(block, expected[self.columns].to_numpy(), rtol=1e-10)
+
+    def test_memmap_frame_view(self):
+        path = os.path.join(self.tmp.name, "scaled.f8")
+        frame = Transformation(self.data).standardize_data(out=path, as_frame=True)
+        expected = Transformation(self.data).standardize_data()
+        pd.testing.assert_frame_equal(frame, expected[self.columns], rtol=1e-10)
+        stored = np.memmap(path, dtype="float64", mode="r", shape=(1000, 3), order="F")
+        np.testing.assert_array_equal(stored, frame.to_numpy())
+
+    def test_frame_matches_block(self):
+        block = Transformation(self.data).normalize_data(out="array")
+        frame = Transformation(self.data).normalize_data(out="array", as_frame=True)
+        self.assertEqual(list(frame.columns), self.columns)
+        np.testing.assert_array_equal(frame.to_numpy(), block)
+
+    def test_chunked_to_memmap(self):
+        path = os.path.join(self.tmp.name, "scaled.f8")
+        chunks = ChunkedData.from_frame(self.data, chunksize=128)
+        block = Transformation(chunks).normalize_data(columns=["age", "fare"], out=path)
+        self.assertIsInstance(block, np.memmap)
+        expected = Transformation(self.data).normalize_data(columns=["age", "fare"])
+        np.testing.assert_allclose(block, expected[["age", "fare"]].to_numpy(), rtol=1e-10)
+
+    def test_validation(self):
+        with self.assertRaises(TypeError):
+            Transformation(self.data).normalize_data(columns=["sex"], out="array")
+        with self.assertRaises(ValueError):
+            Transformation(self.data).normalize_data(columns=["missing"], out="array")
+        constant = pd.DataFrame({"a": [1.0, 1.0, 1.0]})
+        with self.assertRaises(ValueError):
+            Transformation(constant).standardize_data(out="array")
+
+if __name__ == '__main__':
+    unittest.main()
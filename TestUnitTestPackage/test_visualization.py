@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib import cbook
+import numpy as np
+import pandas as pd
+from DataCleanPro import *
+from DataCleanPro.summaries import binned_kde, box_statistics, finite_values, grouped_histograms, histogram
+
+class TestSummaries(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(14)
+        cls.values = rng.lognormal(size=50000)
+
+    def test_box_statistics_match_matplotlib(self):
+        expected = cbook.boxplot_stats(self.values)[0]
+        stats = box_statistics(self.values, max_fliers=10 ** 6)
+        for key in ["med", "q1", "q3", "whislo", "whishi"]:
+            self.assertAlmostEqual(stats[key], expected[key])
+        self.assertEqual(len(stats["fliers"]), len(expected["fliers"]))
+        self.assertEqual(len(box_statistics(self.values, max_fliers=100)["fliers"]), 100)
+
+    def test_binned_kde_is_a_density(self):
+        grid, density = binned_kde(self.values)
+        self.assertAlmostEqual(np.trapezoid(density, grid), 1.0, places=2)
+        self.assertIsNone(binned_kde(np.ones(10)))
+
+    def test_grouped_histograms(self):
+        codes = np.arange(len(self.values)) % 3
+        _, edges = histogram(self.values, 20)
+        counts = grouped_histograms(self.values, codes, 3, edges)
+        for group in range(3):
+            np.testing.assert_array_equal(counts[group], np.histogram(self.values[codes == group], edges)[0])
+
+class TestAggregatedPlots(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(15)
+        cls.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 5000),
+            "fare": rng.exponential(20, 5000),
+            "embarked": rng.choice(["S", "C", "Q"], 5000),
+        })
+        cls.data.loc[::13, "age"] = np.nan
+        cls.viz = Visualization(cls.data, aggregate=True)
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_plots_render(self):
+        self.viz.plot_distribution("age")
+        self.viz.plot_outliers("fare")
+        self.viz.plot_categorical_count("embarked")
+        self.viz.plot_distribution_by_category("age", "embarked")
+        self.viz.plot_grouped_boxplot("fare", "embarked")
+        self.viz.plot_histograms()
+        self.assertTrue(plt.gcf().number)
+
+    def test_auto_threshold_and_validation(self):
+        self.assertTrue(Visualization(self.data, max_rows=1000)._aggregated())
+        self.assertFalse(Visualization(self.data)._aggregated())
+        with self.assertRaises(ValueError):
+            Visualization(self.data, aggregate="yes")
+        with self.assertRaises(TypeError):
+            self.viz.plot_categorical_count("age")
+
+class TestReport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(16)
+        cls.data = pd.DataFrame({
+            "age": rng.normal(40, 10, 3000),
+            "fare": rng.exponential(20, 3000),
+            "embarked": rng.choice(["S", "C", "Q"], 3000),
+        })
+        cls.viz = Visualization(cls.data, show=False)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_html_report_in_process_pool(self):
+        path = os.path.join(self.tmp.name, "report.html")
+        figures = plt.get_fignums()
+        written = self.viz.report(output=path, workers=2)
+        self.assertEqual(written, [path])
+        with open(path, encoding="utf-8") as handle:
+            content = handle.read()
+        self.assertEqual(content.count("<img"), 4)
+        self.assertIn("Correlation Heatmap", content)
+        self.assertEqual(plt.get_fignums(), figures)  # no pyplot figures left behind
+
+    def test_image_files(self):
+        plots = ["histograms", ("distribution", "age"), ("grouped_boxplot", "fare", "embarked"),
+                 ("distribution_by_category", "age", "embarked"), ("outliers", "fare")]
+        for file_format, magic in [("png", b"\x89PNG"), ("svg", b"<?xml")]:
+            paths = self.viz.report(plots, output=os.path.join(self.tmp.name, file_format),
+                                    file_format=file_format, workers=1)
+            self.assertEqual(len(paths), len(plots))
+            self.assertTrue(paths[2].endswith("03_grouped_boxplot_fare_embarked." + file_format))
+            with open(paths[0], "rb") as handle:
+                self.assertTrue(handle.read().startswith(magic))
+
+    def test_default_output_depends_on_format(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            paths = self.viz.report(["histograms"], file_format="png", workers=1)
+            self.assertEqual(paths, [os.path.join("report", "01_histograms.png")])
+            self.assertEqual(self.viz.report(["histograms"], workers=1), ["report.html"])
+            self.assertTrue(os.path.isfile("report.html"))
+        finally:
+            os.chdir(cwd)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.viz.report(["pie"], output=self.tmp.name, file_format="png")
+        with self.assertRaises(TypeError):
+            self.viz.report([("distribution", "embarked")], output=self.tmp.name, file_format="png")
+        with self.assertRaises(ValueError):
+            self.viz.report(output=self.tmp.name, file_format="pdf")
+
+    def test_show_false_returns_figure(self):
+        figure = self.viz.plot_distribution("age")
+        self.assertIn(figure.number, plt.get_fignums())
+        plt.close("all")
+
+if __name__ == '__main__':
+    unittest.main()
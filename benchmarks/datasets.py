@@ -0,0 +1,46 @@
+"""Synthetic datasets for the benchmark suite."""
+import numpy as np
+import pandas as pd
+
+
+def make_dataset(rows, columns=10, cardinality=50, null_rate=0.05, duplicate_rate=0.05, seed=0):
+    """
+    Mixed-type frame with `rows` rows and `columns` columns:
+    about 70% float columns (normal and log-normal, with outliers), one integer column,
+    and string columns drawn from `cardinality` distinct values with a skewed frequency.
+    `null_rate` of the float and string cells are missing and `duplicate_rate` of the
+    rows repeat earlier rows.
+    """
+    rng = np.random.default_rng(seed)
+    n_categorical = max(1, int(round(columns * 0.2)))
+    n_float = max(1, columns - n_categorical - 1)
+    data = {}
+    for i in range(n_float):
+        values = rng.normal(50, 10, rows) if i % 2 == 0 else rng.lognormal(2, 0.8, rows)
+        values[rng.random(rows) < 0.001] *= 50  # outliers
+        values[rng.random(rows) < null_rate] = np.nan
+        data[f"num_{i}"] = values
+    data["count"] = rng.integers(0, 1000, rows)
+    labels = np.array([f"category_{i}" for i in range(cardinality)], dtype=object)
+    weights = 1.0 / np.arange(1, cardinality + 1)
+    weights /= weights.sum()
+    for i in range(n_categorical):
+        values = labels[rng.choice(cardinality, rows, p=weights)]
+        values[rng.random(rows) < null_rate] = None
+        data[f"cat_{i}"] = values
+    frame = pd.DataFrame(data)
+    n_duplicates = int(rows * duplicate_rate)
+    if n_duplicates and rows > n_duplicates:
+        targets = rng.choice(np.arange(n_duplicates, rows), n_duplicates, replace=False)
+        frame.iloc[targets] = frame.iloc[rng.integers(0, n_duplicates, n_duplicates)].to_numpy()
+        frame = frame.astype({col: "float64" for col in frame.columns if col.startswith("num_")})
+        frame["count"] = frame["count"].astype("int64")
+    return frame
+
+
+def numeric_columns(frame):
+    return [col for col in frame.columns if col.startswith("num_")]
+
+
+def categorical_columns(frame):
+    return [col for col in frame.columns if col.startswith("cat_")]
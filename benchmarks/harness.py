@@ -0,0 +1,145 @@
+"""Minimal benchmark harness: registered cases, timing, peak memory, JSON results and comparison."""
+import contextlib
+import datetime
+import io
+import json
+import platform
+import subprocess
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+CASES = []
+
+
+def case(group, name):
+    """
+    Register a benchmark. The decorated function receives (frame, workdir), does any
+    untimed setup (e.g. writing the input file) and returns the zero-argument callable to time.
+    Raising ImportError from setup marks the case as skipped (missing optional dependency).
+    """
+    def register(setup):
+        CASES.append({"group": group, "name": name, "setup": setup})
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def arrow_peak(interval=0.001):
+    """
+    Peak rise of pyarrow's allocated bytes while the block runs, sampled from a thread.
+    tracemalloc does not see Arrow's memory pool, so Arrow readers would otherwise show ~0 MB.
+    Yields a dict whose 'peak' is filled in on exit (0 without pyarrow).
+    """
+    result = {"peak": 0}
+    try:
+        import pyarrow
+    except ImportError:
+        yield result
+        return
+    start = pyarrow.total_allocated_bytes()
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            result["peak"] = max(result["peak"], pyarrow.total_allocated_bytes() - start)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield result
+    finally:
+        done.set()
+        sampler.join()
+        result["peak"] = max(result["peak"], pyarrow.total_allocated_bytes() - start)
+
+
+def measure(func, repeat=3):
+    """Wall times of `repeat` calls, then the peak memory of one more call (traced separately,
+    since tracing slows allocation-heavy code): the tracemalloc peak and the Arrow pool peak."""
+    times = []
+    # Methods that print diagnostics would otherwise flood the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            with arrow_peak() as arrow:
+                func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return times, peak, arrow["peak"]
+
+
+def run_case(entry, frame, params, workdir, repeat=3):
+    result = {"group": entry["group"], "name": entry["name"], "params": params}
+    try:
+        func = entry["setup"](frame.copy(), workdir)
+    except ImportError as error:
+        result["status"] = f"skipped: {error}"
+        return result
+    try:
+        times, peak, arrow = measure(func, repeat)
+    except Exception as error:
+        result["status"] = f"error: {type(error).__name__}: {error}"
+        return result
+    result.update({"status": "ok", "times": times, "min": min(times), "median": float(np.median(times)),
+                   "peak_bytes": peak + arrow, "arrow_peak_bytes": arrow, "rows_per_second": params["rows"] / min(times) if min(times) else None})
+    return result
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"timestamp": datetime.datetime.now().isoformat(timespec="seconds"), "commit": commit,
+            "python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+            "numpy": np.__version__, "pandas": pd.__version__}
+
+
+def save_results(results, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"environment": environment(), "results": results}, handle, indent=1, default=str)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def result_key(result):
+    return result["group"], result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results, baseline, threshold=1.25):
+    """
+    Rows (key, baseline seconds, current seconds, ratio) for cases run in both, using the
+    fastest repeat. Returns (rows, regressions), where regressions are rows slower than `threshold`x.
+    """
+    previous = {result_key(result): result for result in baseline["results"] if result.get("status") == "ok"}
+    rows, regressions = [], []
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None or result.get("status") != "ok":
+            continue
+        ratio = result["min"] / old["min"] if old["min"] else float("inf")
+        row = (result_key(result), old["min"], result["min"], ratio)
+        rows.append(row)
+        if ratio > threshold:
+            regressions.append(row)
+    return rows, regressions
+
+
+def format_result(result):
+    label = f"{result['group']}.{result['name']}"
+    if result["status"] != "ok":
+        return f"{label:<48}{result['status']}"
+    return (f"{label:<48}{result['min'] * 1000:>10.1f} ms{result['median'] * 1000:>10.1f} ms"
+            f"{result['peak_bytes'] / 1024 ** 2:>10.1f} MB")
@@ -0,0 +1,85 @@
+"""Import time of DataCleanPro in fresh interpreters, with a budget for the cleaning-only path.
+
+Usage:
+    PYTHONPATH=. python benchmarks/import_time.py [--repeat 5] [--budget 0.15]
+
+Each run imports pandas first (a hard dependency, reported separately), then the package and
+the cleaning classes, and records the time spent on the latter, peak RSS and which plotting
+modules got loaded. The Visualization path, shown for comparison, includes drawing one
+small plot, which is when matplotlib and seaborn get imported. The exit status is 1 when
+the median cleaning-path time exceeds --budget seconds or it imports a plotting module.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PLOTTING_MODULES = ["matplotlib", "matplotlib.pyplot", "seaborn", "scipy"]
+
+PATHS = {
+    "cleaning": ["DataLoader", "Preprocessor", "Transformation", "Pipeline"],
+    "visualization": ["Visualization"],
+}
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+import pandas
+loaded = time.perf_counter()
+import DataCleanPro
+for name in {names!r}:
+    getattr(DataCleanPro, name)
+if {plot!r}:
+    import numpy
+    DataCleanPro.Visualization(pandas.DataFrame({{"x": numpy.arange(10.0)}}), show=False).plot_distribution("x")
+done = time.perf_counter()
+print(json.dumps({{"pandas": loaded - start, "package": done - loaded,
+                  "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                  "modules": [name for name in {modules!r} if name in sys.modules]}}))
+"""
+
+
+def run_once(names, plot=False):
+    code = CHILD.format(names=names, plot=plot, modules=PLOTTING_MODULES)
+    env = dict(os.environ, MPLBACKEND="Agg")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(names, repeat=5, plot=False):
+    runs = [run_once(names, plot) for _ in range(repeat)]
+    return {"pandas": statistics.median(run["pandas"] for run in runs),
+            "package": statistics.median(run["package"] for run in runs),
+            "rss_mb": statistics.median(run["rss_mb"] for run in runs),
+            "modules": sorted(set().union(*(run["modules"] for run in runs)))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.15,
+                        help="seconds allowed for the cleaning path on top of importing pandas")
+    args = parser.parse_args(argv)
+
+    results = {"cleaning": measure(PATHS["cleaning"], args.repeat),
+               "visualization": measure(PATHS["visualization"], args.repeat, plot=True)}
+    print(f"{'path':<16}{'pandas':>10}{'package':>10}{'peak RSS':>12}  plotting modules")
+    for path, result in results.items():
+        print(f"{path:<16}{result['pandas'] * 1000:>7.0f} ms{result['package'] * 1000:>7.0f} ms"
+              f"{result['rss_mb']:>9.0f} MB  {', '.join(result['modules']) or '-'}")
+
+    cleaning = results["cleaning"]
+    failures = []
+    if cleaning["package"] > args.budget:
+        failures.append(f"cleaning path took {cleaning['package'] * 1000:.0f} ms, budget {args.budget * 1000:.0f} ms")
+    if cleaning["modules"]:
+        failures.append(f"cleaning path imported {', '.join(cleaning['modules'])}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""Time and memory-profile every DataCleanPro operation on synthetic data.
+
+Usage:
+    PYTHONPATH=. python benchmarks/suite.py [--rows 10000,100000] [--columns 10] [--cardinality 50]
+        [--null-rate 0.05] [--filter preprocessor] [--repeat 3] [--output results.json]
+        [--compare baseline.json] [--threshold 1.25]
+
+Every combination of the comma-separated sizes is run. With --compare, cases more than
+--threshold times slower than in the baseline file are listed and the exit status is 1.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import tempfile
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from DataCleanPro import (ChunkedData, Correlation, DataLoader, Pipeline, Preprocessor, Profile, Transformation,
+                          Visualization)
+from datasets import categorical_columns, make_dataset, numeric_columns
+from harness import CASES, case, compare, format_result, load_results, run_case, save_results
+
+
+# DataLoader
+
+def _written(frame, workdir, name, write):
+    path = os.path.join(workdir, name)
+    if not os.path.exists(path):
+        write(path)
+    return path
+
+
+@case("DataLoader", "load_csv")
+def load_csv(frame, workdir):
+    path = _written(frame, workdir, "data.csv", lambda path: frame.to_csv(path, index=False))
+    return lambda: DataLoader.load_csv(path)
+
+
+@case("DataLoader", "load_csv_optimized")
+def load_csv_optimized(frame, workdir):
+    path = _written(frame, workdir, "data.csv", lambda path: frame.to_csv(path, index=False))
+    return lambda: DataLoader.load_csv(path, optimize=True)
+
+
+@case("DataLoader", "load_json")
+def load_json(frame, workdir):
+    path = _written(frame, workdir, "data.json", lambda path: frame.to_json(path))
+    return lambda: DataLoader.load_json(path)
+
+
+@case("DataLoader", "load_ndjson")
+def load_ndjson(frame, workdir):
+    path = _written(frame, workdir, "data.jsonl", lambda path: frame.to_json(path, orient="records", lines=True))
+    return lambda: DataLoader.load_json(path)
+
+
+@case("DataLoader", "load_xlsx")
+def load_xlsx(frame, workdir):
+    path = _written(frame, workdir, "data.xlsx", lambda path: frame.to_excel(path, index=False))
+    return lambda: DataLoader.load_xlsx(path)
+
+
+@case("DataLoader", "load_parquet")
+def load_parquet(frame, workdir):
+    path = _written(frame, workdir, "data.parquet", lambda path: DataLoader.write_parquet(frame, path))
+    return lambda: DataLoader.load_parquet(path)
+
+
+@case("DataLoader", "load_feather")
+def load_feather(frame, workdir):
+    path = _written(frame, workdir, "data.feather", lambda path: DataLoader.write_feather(frame, path))
+    return lambda: DataLoader.load_feather(path)
+
+
+@case("DataLoader", "load_orc")
+def load_orc(frame, workdir):
+    path = _written(frame, workdir, "data.orc", lambda path: DataLoader.write_orc(frame, path))
+    return lambda: DataLoader.load_orc(path)
+
+
+@case("DataLoader", "stream_csv")
+def stream_csv(frame, workdir):
+    path = _written(frame, workdir, "data.csv", lambda path: frame.to_csv(path, index=False))
+    return lambda: sum(len(chunk) for chunk in DataLoader.stream_csv(path, max_bytes=8 * 1024 ** 2))
+
+
+@case("DataLoader", "stream_json")
+def stream_json(frame, workdir):
+    path = _written(frame, workdir, "data.jsonl", lambda path: frame.to_json(path, orient="records", lines=True))
+    return lambda: sum(len(chunk) for chunk in DataLoader.stream_json(path, max_bytes=8 * 1024 ** 2))
+
+
+@case("DataLoader", "load_many")
+def load_many(frame, workdir):
+    shards = os.path.join(workdir, "shards")
+    if not os.path.isdir(shards):
+        os.makedirs(shards)
+        for number, start in enumerate(range(0, len(frame), max(1, len(frame) // 4))):
+            frame.iloc[start:start + max(1, len(frame) // 4)].to_csv(os.path.join(shards, f"{number}.csv"), index=False)
+    return lambda: DataLoader.load_many(os.path.join(shards, "*.csv"), workers=4)
+
+
+@case("DataLoader", "write_parquet")
+def write_parquet(frame, workdir):
+    path = os.path.join(workdir, "written.parquet")
+    return lambda: DataLoader.write_parquet(frame, path)
+
+
+@case("DataLoader", "optimize_dtypes")
+def optimize_dtypes(frame, workdir):
+    return lambda: DataLoader.optimize_dtypes(frame)
+
+
+# Preprocessor
+
+@case("Preprocessor", "check_missing_values")
+def check_missing_values(frame, workdir):
+    return lambda: Preprocessor(frame).check_missing_values()
+
+
+def _imputation(strategy):
+    def setup(frame, workdir):
+        return lambda: Preprocessor(frame).handle_missing_values(strategy=strategy)
+    return setup
+
+
+for _strategy in ["mean", "median", "mode", "drop"]:
+    case("Preprocessor", f"handle_missing_values_{_strategy}")(_imputation(_strategy))
+
+
+def _encoding(method):
+    def setup(frame, workdir):
+        # encode_categorical writes the codes into the frame it is given, so each call gets a copy.
+        return lambda: Preprocessor(frame.copy()).encode_categorical(categorical_columns(frame), method=method)
+    return setup
+
+
+for _method in ["label", "onehot", "frequency"]:
+    case("Preprocessor", f"encode_categorical_{_method}")(_encoding(_method))
+
+
+def _outliers(method):
+    def setup(frame, workdir):
+        return lambda: Preprocessor(frame).handle_outliers(numeric_columns(frame), method=method, remove=True)
+    return setup
+
+
+for _method in ["iqr", "zscore"]:
+    case("Preprocessor", f"handle_outliers_{_method}")(_outliers(_method))
+
+
+@case("Preprocessor", "handle_outliers_chunked")
+def handle_outliers_chunked(frame, workdir):
+    chunks = ChunkedData.from_frame(frame, chunksize=max(1, len(frame) // 8))
+    return lambda: Preprocessor(chunks).handle_outliers(numeric_columns(frame), remove=True).collect()
+
+
+@case("Preprocessor", "check_duplicates")
+def check_duplicates(frame, workdir):
+    return lambda: Preprocessor(frame).check_duplicates()
+
+
+@case("Preprocessor", "remove_duplicates")
+def remove_duplicates(frame, workdir):
+    return lambda: Preprocessor(frame).remove_duplicates()
+
+
+@case("Preprocessor", "profile")
+def profile(frame, workdir):
+    return lambda: Profile.profile(frame)
+
+
+# Transformation
+
+@case("Transformation", "normalize_data")
+def normalize_data(frame, workdir):
+    return lambda: Transformation(frame).normalize_data()
+
+
+@case("Transformation", "standardize_data")
+def standardize_data(frame, workdir):
+    return lambda: Transformation(frame).standardize_data()
+
+
+@case("Transformation", "standardize_data_block")
+def standardize_data_block(frame, workdir):
+    return lambda: Transformation(frame).standardize_data(out="array")
+
+
+@case("Transformation", "correlation")
+def correlation(frame, workdir):
+    return lambda: Correlation.compute(frame).matrix()
+
+
+@case("Transformation", "pipeline")
+def pipeline(frame, workdir):
+    def run():
+        return (Pipeline(frame).handle_missing_values(strategy="median")
+                .encode_categorical(categorical_columns(frame), method="frequency")
+                .standardize_data(columns=numeric_columns(frame)).collect())
+    return run
+
+
+# Visualization
+
+def _plot(method, *args):
+    def setup(frame, workdir):
+        def run():
+            getattr(Visualization(frame, aggregate=True, show=False), method)(*args)
+            plt.gcf().canvas.draw()
+            plt.close("all")
+        return run
+    return setup
+
+
+case("Visualization", "plot_distribution")(_plot("plot_distribution", "num_0"))
+case("Visualization", "plot_outliers")(_plot("plot_outliers", "num_1"))
+case("Visualization", "plot_correlation_heatmap")(_plot("plot_correlation_heatmap"))
+case("Visualization", "plot_categorical_count")(_plot("plot_categorical_count", "cat_0"))
+case("Visualization", "plot_distribution_by_category")(_plot("plot_distribution_by_category", "num_0", "cat_0"))
+case("Visualization", "plot_grouped_boxplot")(_plot("plot_grouped_boxplot", "num_1", "cat_0"))
+case("Visualization", "plot_histograms")(_plot("plot_histograms"))
+
+
+@case("Visualization", "report")
+def report(frame, workdir):
+    output = os.path.join(workdir, "report.html")
+    return lambda: Visualization(frame, show=False).report(output=output, workers=1)
+
+
+def _sizes(text, kind=int):
+    return [kind(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=_sizes, default=[10000, 100000])
+    parser.add_argument("--columns", type=_sizes, default=[10])
+    parser.add_argument("--cardinality", type=_sizes, default=[50])
+    parser.add_argument("--null-rate", type=lambda text: _sizes(text, float), default=[0.05])
+    parser.add_argument("--filter", default="",
+                        help="only run cases whose 'group.name' contains one of these comma-separated texts")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file written by an earlier --output")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    patterns = [pattern.strip().lower() for pattern in args.filter.split(",")]
+    selected = [entry for entry in CASES
+                if any(pattern in f"{entry['group']}.{entry['name']}".lower() for pattern in patterns)]
+    results = []
+    for rows, columns, cardinality, null_rate in itertools.product(args.rows, args.columns, args.cardinality,
+                                                                   args.null_rate):
+        params = {"rows": rows, "columns": columns, "cardinality": cardinality, "null_rate": null_rate}
+        print(f"\n{rows} rows x {columns} columns, cardinality {cardinality}, null rate {null_rate}")
+        print(f"{'case':<48}{'min':>13}{'median':>13}{'peak':>13}")
+        frame = make_dataset(rows, columns, cardinality, null_rate)
+        with tempfile.TemporaryDirectory() as workdir:
+            for entry in selected:
+                result = run_case(entry, frame, params, workdir, args.repeat)
+                results.append(result)
+                print(format_result(result), flush=True)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        rows, regressions = compare(results, load_results(args.compare), args.threshold)
+        print(f"\n{'case':<48}{'size':<22}{'baseline':>12}{'current':>12}{'ratio':>8}")
+        for (group, name, params), old, new, ratio in rows:
+            params = json.loads(params)
+            size = f"{params['rows']}x{params['columns']} c{params['cardinality']} n{params['null_rate']}"
+            flag = "  <-- slower" if ratio > args.threshold else ""
+            print(f"{group + '.' + name:<48}{size:<22}{old * 1000:>10.1f}ms{new * 1000:>10.1f}ms{ratio:>7.2f}x{flag}")
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
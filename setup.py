@@ -15,6 +15,14 @@ setup(
         "matplotlib",
         "seaborn"
     ],
+    extras_require={
+        "sparse": ["scipy"],
+        "arrow": ["pyarrow"],
+        "yaml": ["pyyaml"],
+    },
+    entry_points={
+        "console_scripts": ["datacleanpro=DataCleanPro.cli:main"],
+    },
    
-    python_requires=">=3.6",
+    python_requires=">=3.9",
 )